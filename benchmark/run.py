@@ -0,0 +1,316 @@
+"""
+Offline benchmark for the Slack command path.
+
+Drives the handlers registered by `register_all_commands` and
+`jira.get_summary` end to end against the stub MCP server and the scripted
+model clients, so no network, API key or Jira container is needed.
+
+  python -m benchmark.run --commands 40 --concurrency 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUB_SERVER_PATH = os.path.join(ROOT_DIR, "benchmark", "stub_mcp_server.py")
+SCENARIOS = ("command", "summary", "claude")
+COMMAND = "/jira-summary"
+PROMPT = "Summary current sprint of board name: sentinels board"
+CLAUDE_PROMPT = "Search the blocked issues of the sentinels board with jira_search and summarize them"
+
+
+@dataclass
+class Result:
+  scenario: str
+  concurrency: int
+  latencies: list[float] = field(default_factory=list)
+  errors: int = 0
+  rejected: int = 0
+  elapsed: float = 0.0
+  peak_bytes: int = 0
+  counters: dict[str, int] = field(default_factory=dict)
+
+
+def _percentile(values: list[float], q: float) -> float:
+  if not values:
+    return 0.0
+  ordered = sorted(values)
+  return ordered[min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+def _write_mcp_config(directory: str) -> str:
+  config = {"mcpServers": {"atlassian": {"transport": "stdio", "command": sys.executable, "args": [STUB_SERVER_PATH]}}}
+  path = os.path.join(directory, "mcp.json")
+  with open(path, "w") as f:
+    json.dump(config, f)
+  return path
+
+
+def _override_env(values: dict[str, str]):
+  # Env reads .env before os.environ, so the overrides are dropped from its copy of .env as well
+  from src.config.env import Env
+  os.environ.update(values)
+  dotenv = Env._load_dotenv_values()
+  for key in values:
+    dotenv.pop(key, None)
+
+
+class FakeSlackClient:
+  """Records the Slack Web API calls the notifier's outbox makes."""
+
+  def __init__(self, on_message: Callable[[str, str], None]):
+    self._on_message = on_message
+    self._lock = threading.Lock()
+    self.posts = 0
+    self.updates = 0
+
+  async def chat_postMessage(self, channel: str, text: str, thread_ts: str | None = None, blocks: list | None = None) -> dict:
+    with self._lock:
+      self.posts += 1
+    self._on_message(channel, text)
+    return {"ts": f"{time.time():.6f}"}
+
+  async def chat_update(self, channel: str, ts: str, text: str, blocks: list | None = None) -> dict:
+    with self._lock:
+      self.updates += 1
+    self._on_message(channel, text)
+    return {"ts": ts}
+
+
+class FakeApp:
+  """Just enough of `slack_bolt.App` for `register_all_commands` and the notifier."""
+
+  def __init__(self, client: FakeSlackClient):
+    self.client = client
+    self.handlers: dict[str, Callable] = {}
+
+  def command(self, name: str):
+    def register(handler: Callable) -> Callable:
+      self.handlers[name] = handler
+      return handler
+    return register
+
+
+class CommandBench:
+  """Dispatches slash commands the way Bolt's listener threads would and waits for each reply to finish."""
+
+  def __init__(self):
+    from src.application import commands
+    from src.application.commands.jira import summary
+    from src.infrastructure.messaging.slack import notifier
+
+    self._done: dict[str, Future] = {}
+    self._failed: set[str] = set()
+    self.client = FakeSlackClient(self._on_message)
+    handle_summary = summary.handle_summary
+
+    async def timed_handle_summary(ack, respond, command):
+      try:
+        await handle_summary(ack, respond, command)
+      finally:
+        self._resolve(command["channel_id"], time.perf_counter())
+
+    summary.handle_summary = timed_handle_summary
+    app = FakeApp(self.client)
+    notifier.initialize(app, client=self.client)
+    # Commands import their module on first use, so the timed handler has to stay in place
+    commands.register_all_commands(app)
+    self._handler = app.handlers[COMMAND]
+
+  def _resolve(self, channel: str, finished_at: float | None):
+    future = self._done.get(channel)
+    if future is not None and not future.done():
+      future.set_result(finished_at)
+
+  def _on_message(self, channel: str, text: str):
+    from src.application.commands import BUSY_MESSAGE
+
+    if text == BUSY_MESSAGE:
+      self._resolve(channel, None)
+    elif text.startswith("Error handling command"):
+      self._failed.add(channel)
+
+  def run(self, result: Result, count: int, text: str, label: str):
+    limiter = threading.BoundedSemaphore(result.concurrency)
+    started: dict[str, float] = {}
+
+    for index in range(count):
+      limiter.acquire()
+      channel = f"{label}{index:05d}"
+      future = Future()
+      future.add_done_callback(lambda _: limiter.release())
+      self._done[channel] = future
+      started[channel] = time.perf_counter()
+      self._handler(ack=lambda *args, **kwargs: None, respond=lambda *args, **kwargs: None, command={
+        "command": COMMAND, "channel_id": channel, "text": text,
+      })
+
+    for channel, start in started.items():
+      finished_at = self._done[channel].result()
+      del self._done[channel]
+      if finished_at is None:
+        result.rejected += 1
+      elif channel in self._failed:
+        result.errors += 1
+      else:
+        result.latencies.append(finished_at - start)
+
+
+async def _bounded(concurrency: int, count: int, job: Callable[[], Any], result: Result):
+  semaphore = asyncio.Semaphore(concurrency)
+
+  async def one():
+    async with semaphore:
+      start = time.perf_counter()
+      try:
+        await job()
+      except Exception as e:
+        result.errors += 1
+        print(f"[{result.scenario}] {e}", file=sys.stderr)
+        return
+      result.latencies.append(time.perf_counter() - start)
+
+  await asyncio.gather(*(one() for _ in range(count)))
+
+
+async def _claude_conversation():
+  from src.config.agent import Agent
+  from src.infrastructure.llm.adapter import Adapter
+
+  agent = Adapter(Agent.CLAUDE)
+  await agent.open_session()
+  try:
+    async for _ in agent.stream_message(CLAUDE_PROMPT, {"temperature": 0, "use_tools": True}):
+      pass
+  finally:
+    await agent.close_session()
+
+
+def _span_counts() -> dict[str, int]:
+  from src.infrastructure.telemetry import metrics
+
+  spans = metrics.snapshot()["spans"]
+  return {name: sum(value["count"] for key, value in spans.items() if key.split("[")[0] == name) for name in ("llm.round_trip", "mcp.call_tool")}
+
+
+def _run_scenario(scenario: str, args: argparse.Namespace, commands: "CommandBench | None") -> Result:
+  from src.domain.use_case import jira
+  from src.infrastructure.runtime.worker_pool import get_runtime
+
+  fresh = not args.cached
+  prompt = f"{PROMPT} --fresh" if fresh else PROMPT
+  result = Result(scenario=scenario, concurrency=args.concurrency)
+
+  def execute(target: Result, count: int, label: str):
+    if scenario == "command":
+      commands.run(target, count, prompt, label)
+    elif scenario == "summary":
+      get_runtime().run(_bounded(target.concurrency, count, lambda: jira.get_summary(PROMPT, fresh=fresh), target)).result()
+    else:
+      get_runtime().run(_bounded(target.concurrency, count, _claude_conversation, target)).result()
+
+  # Warm-up spawns the MCP server and fills the tool catalog; it is not measured
+  execute(Result(scenario=scenario, concurrency=1), args.warmup, "W")
+
+  counters = _span_counts()
+  posts, updates = (commands.client.posts, commands.client.updates) if commands else (0, 0)
+  tracemalloc.reset_peak()
+  start = time.perf_counter()
+  execute(result, args.commands, scenario[0].upper())
+  result.elapsed = time.perf_counter() - start
+  result.peak_bytes = tracemalloc.get_traced_memory()[1]
+
+  result.counters = {name: count - counters.get(name, 0) for name, count in _span_counts().items()}
+  if commands and scenario == "command":
+    result.counters["slack.post"] = commands.client.posts - posts
+    result.counters["slack.update"] = commands.client.updates - updates
+  return result
+
+
+def _report(results: list[Result]) -> str:
+  lines = [
+    f"{'scenario':<10} {'conc':>4} {'ok':>5} {'err':>4} {'busy':>4} {'p50 s':>8} {'p95 s':>8} {'max s':>8} {'cmd/s':>7} {'peak MB':>8}  calls",
+  ]
+  for result in results:
+    done = len(result.latencies)
+    throughput = done / result.elapsed if result.elapsed else 0.0
+    calls = ", ".join(f"{name}={count}" for name, count in result.counters.items())
+    lines.append(
+      f"{result.scenario:<10} {result.concurrency:>4} {done:>5} {result.errors:>4} {result.rejected:>4} "
+      f"{_percentile(result.latencies, 0.5):>8.3f} {_percentile(result.latencies, 0.95):>8.3f} "
+      f"{max(result.latencies, default=0.0):>8.3f} {throughput:>7.2f} {result.peak_bytes / 2**20:>8.1f}  {calls}"
+    )
+  # ru_maxrss is KiB on Linux and bytes on macOS; it covers this process only, not the MCP server
+  maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2**20 if sys.platform == "darwin" else 2**10)
+  lines.append(f"process max RSS: {maxrss:.1f} MB")
+  return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description="Benchmark the Slack command path against local stand-ins.")
+  parser.add_argument("--commands", type=int, default=20, help="measured runs per scenario")
+  parser.add_argument("--concurrency", type=int, default=4, help="runs in flight at once")
+  parser.add_argument("--warmup", type=int, default=1, help="unmeasured runs before each scenario")
+  parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="scenario to run, repeatable (default: all)")
+  parser.add_argument("--cached", action="store_true", help="let plans and tool results come from the cache instead of passing --fresh")
+  parser.add_argument("--output", help="also append the report to this file")
+  return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+  args = _parse_args(argv)
+
+  sys.path.insert(0, ROOT_DIR)
+  # Forced over .env and the shell so the run never reads or writes the bot's own stores
+  workdir = tempfile.mkdtemp(prefix="bench-")
+  _override_env({
+    "CACHE_BACKEND": "memory",
+    "LLM_CACHE_BACKEND": "memory",
+    "CACHE_SQLITE_PATH": os.path.join(workdir, "cache.sqlite3"),
+    "LLM_CACHE_PATH": os.path.join(workdir, "llm_cache.sqlite3"),
+    "JIRA_SNAPSHOT_PATH": os.path.join(workdir, "jira_snapshots.sqlite3"),
+    "DIGEST_CACHE_PATH": os.path.join(workdir, "digests.sqlite3"),
+    "COMMAND_WORKER_CONCURRENCY": str(args.concurrency),
+    "COMMAND_QUEUE_MAX": str(max(args.commands, args.concurrency) * 2),
+  })
+
+  from benchmark import stub_models
+  from src.config.mcp import initialize as initialize_mcp
+  from src.domain.entity.custom_tool.registry import Registry as CustomToolRegistry
+  from src.infrastructure.mcp.session_pool import get_pool
+  from src.infrastructure.runtime.worker_pool import get_runtime
+
+  initialize_mcp(_write_mcp_config(workdir))
+  stub_models.install()
+  CustomToolRegistry.load()
+
+  scenarios = args.scenario or list(SCENARIOS)
+  commands = CommandBench() if "command" in scenarios else None
+  # Tracing allocations slows imports down badly, so start only once everything is loaded
+  tracemalloc.start()
+  try:
+    results = [_run_scenario(scenario, args, commands) for scenario in scenarios]
+  finally:
+    get_runtime().run(get_pool().close_all()).result()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+  report = _report(results)
+  print(report)
+  if args.output:
+    with open(args.output, "a") as f:
+      f.write(f"# {time.strftime('%Y-%m-%d %H:%M:%S')} {' '.join(argv if argv is not None else sys.argv[1:])}\n{report}\n\n")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,79 @@
+"""
+Stand-in for the mcp-atlassian server used by the benchmark.
+
+Speaks MCP over stdio through fastmcp and answers the Jira tools the planner
+uses with canned payloads. Size and latency are controlled from the
+environment: BENCH_ISSUE_COUNT, BENCH_ISSUE_BYTES and BENCH_MCP_LATENCY_MS.
+"""
+import asyncio
+import json
+import os
+
+from fastmcp import FastMCP
+
+
+ISSUE_COUNT = int(os.environ.get("BENCH_ISSUE_COUNT") or 50)
+ISSUE_BYTES = int(os.environ.get("BENCH_ISSUE_BYTES") or 2000)
+LATENCY = int(os.environ.get("BENCH_MCP_LATENCY_MS") or 50) / 1000
+STATUSES = ("To Do", "In Progress", "In Review", "Done")
+
+mcp = FastMCP("atlassian")
+
+
+def _issue(index: int) -> dict:
+  return {
+    "id": str(10000 + index),
+    "key": f"SEN-{index + 1}",
+    "summary": f"Benchmark issue {index + 1}",
+    "description": ("Lorem ipsum dolor sit amet. " * (ISSUE_BYTES // 28 + 1))[:ISSUE_BYTES],
+    "status": {"name": STATUSES[index % len(STATUSES)], "category": "To Do"},
+    "issue_type": {"name": "Story"},
+    "priority": {"name": "Medium"},
+    "assignee": {"display_name": f"Member {index % 5}", "email": f"member{index % 5}@example.com"},
+    "reporter": {"display_name": "Reporter", "email": "reporter@example.com"},
+    "labels": ["benchmark"],
+    "created": "2025-01-01T09:00:00.000+0000",
+    "updated": "2025-01-02T09:00:00.000+0000",
+    "customfield_10016": index % 8 + 1,
+  }
+
+
+def _issues() -> dict:
+  return {
+    "total": ISSUE_COUNT,
+    "start_at": 0,
+    "max_results": ISSUE_COUNT,
+    "issues": [_issue(index) for index in range(ISSUE_COUNT)],
+  }
+
+
+@mcp.tool
+async def jira_get_agile_boards(board_name: str | None = None, project_key: str | None = None) -> str:
+  """Get Jira agile boards by name or project key."""
+  await asyncio.sleep(LATENCY)
+  return json.dumps([{"id": "1", "name": board_name or "sentinels board", "type": "scrum"}])
+
+
+@mcp.tool
+async def jira_get_sprints_from_board(board_id: str, state: str | None = None) -> str:
+  """Get sprints of a Jira board."""
+  await asyncio.sleep(LATENCY)
+  return json.dumps([{"id": "100", "name": "Sprint 1", "state": state or "active", "board_id": board_id}])
+
+
+@mcp.tool
+async def jira_get_sprint_issues(sprint_id: str, fields: str | None = None, limit: int = 50) -> str:
+  """Get the issues of a Jira sprint."""
+  await asyncio.sleep(LATENCY)
+  return json.dumps(_issues())
+
+
+@mcp.tool
+async def jira_search(jql: str, fields: str | None = None, limit: int = 50) -> str:
+  """Search Jira issues with JQL."""
+  await asyncio.sleep(LATENCY)
+  return json.dumps(_issues())
+
+
+if __name__ == "__main__":
+  mcp.run(show_banner=False)
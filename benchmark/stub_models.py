@@ -0,0 +1,181 @@
+"""
+Scripted stand-ins for the Anthropic and Gemini SDK clients.
+
+Every conversation follows the same script: a request with a response schema
+gets the canned plan, a request whose prompt names one of the offered tools
+gets one call to that tool, and anything else gets the canned summary. Replies
+are delayed by BENCH_LLM_LATENCY_MS and streamed in BENCH_STREAM_CHUNKS pieces.
+"""
+import asyncio
+import json
+import os
+from typing import Any, AsyncIterator
+
+from anthropic.types import Message, MessageTokensCount, TextBlock, ToolUseBlock, Usage
+from google.genai import types
+
+from src.domain.entity.agent.common.plan import Plan
+from src.infrastructure.llm.model.claude import Claude
+from src.infrastructure.llm.model.gemini import Gemini
+from src.infrastructure.llm.tokens import approximate_tokens
+
+
+LATENCY = int(os.environ.get("BENCH_LLM_LATENCY_MS") or 200) / 1000
+STREAM_CHUNKS = int(os.environ.get("BENCH_STREAM_CHUNKS") or 10)
+SUMMARY_WORDS = int(os.environ.get("BENCH_SUMMARY_WORDS") or 300)
+
+PLAN = Plan.model_validate({
+  "goal": "Summarize the current sprint of the sentinels board",
+  "steps": [
+    {"id": 1, "description": "Find the sentinels board", "tool": "jira_get_agile_boards", "arguments": '{"board_name": "sentinels board"}'},
+    {"id": 2, "description": "Find the active sprint of the board", "depends_on": [1], "tool": "jira_get_sprints_from_board", "arguments": '{"board_id": "1", "state": "active"}'},
+    {"id": 3, "description": "Get the issues of the active sprint", "depends_on": [2], "tool": "jira_get_sprint_issues", "arguments": '{"sprint_id": "100"}'},
+    {"id": 4, "description": "Search the blocked issues of the board with jira_search", "depends_on": [1]},
+    {"id": 5, "description": "Format the sprint summary for Slack", "depends_on": [3, 4]},
+  ],
+})
+
+TOOL_ARGUMENTS = {
+  "jira_search": {"jql": "status = Blocked"},
+  "jira_get_sprint_issues": {"sprint_id": "100"},
+  "jira_get_sprints_from_board": {"board_id": "1", "state": "active"},
+  "jira_get_agile_boards": {"board_name": "sentinels board"},
+}
+
+SUMMARY = " ".join(f"word{index}" for index in range(SUMMARY_WORDS))
+
+
+def _scripted_reply(prompt: str, tool_names: list[str], has_result: bool, structured: bool) -> tuple[str, str | None]:
+  """(text, tool name) for the next turn of the script."""
+  if structured:
+    return PLAN.model_dump_json(), None
+  if not has_result:
+    for name in tool_names:
+      if name in prompt:
+        return "", name
+  return SUMMARY, None
+
+
+def _chunks(text: str) -> list[str]:
+  size = max(len(text) // STREAM_CHUNKS, 1)
+  return [text[index:index + size] for index in range(0, len(text), size)]
+
+
+class _GeminiModels:
+  def _reply(self, contents: list[types.Content], config: types.GenerateContentConfig | None) -> tuple[str, str | None]:
+    tool_names = [
+      declaration.name
+      for tool in (config.tools if config and config.tools else [])
+      for declaration in tool.function_declarations or []
+    ]
+    prompts = [part.text for content in contents if content.role == "user" for part in content.parts if part.text]
+    has_result = any(part.function_response for content in contents for part in content.parts)
+    return _scripted_reply(prompts[-1] if prompts else "", tool_names, has_result, bool(config and config.response_schema))
+
+  def _response(self, text: str, tool_name: str | None, parsed: Any = None) -> types.GenerateContentResponse:
+    if tool_name:
+      part = types.Part(function_call=types.FunctionCall(id=f"call_{tool_name}", name=tool_name, args=TOOL_ARGUMENTS.get(tool_name, {})))
+    else:
+      part = types.Part(text=text)
+    return types.GenerateContentResponse(
+      candidates=[types.Candidate(content=types.Content(role="model", parts=[part]), finish_reason=types.FinishReason.STOP)],
+      usage_metadata=types.GenerateContentResponseUsageMetadata(prompt_token_count=0, candidates_token_count=len(text) // 4),
+      parsed=parsed,
+    )
+
+  async def generate_content(self, model: str, contents: list[types.Content], config: types.GenerateContentConfig | None = None):
+    await asyncio.sleep(LATENCY)
+    text, tool_name = self._reply(contents, config)
+    return self._response(text, tool_name, PLAN if config and config.response_schema else None)
+
+  async def generate_content_stream(self, model: str, contents: list[types.Content], config: types.GenerateContentConfig | None = None):
+    text, tool_name = self._reply(contents, config)
+
+    async def stream() -> AsyncIterator[types.GenerateContentResponse]:
+      if tool_name:
+        await asyncio.sleep(LATENCY)
+        yield self._response("", tool_name)
+        return
+      chunks = _chunks(text)
+      for chunk in chunks:
+        await asyncio.sleep(LATENCY / len(chunks))
+        yield self._response(chunk, None)
+
+    return stream()
+
+  async def count_tokens(self, model: str, contents: list[types.Content]) -> types.CountTokensResponse:
+    return types.CountTokensResponse(total_tokens=approximate_tokens(contents))
+
+
+class FakeGeminiClient:
+  def __init__(self):
+    self.models = _GeminiModels()
+
+
+class _ClaudeStream:
+  def __init__(self, message: Message):
+    self._message = message
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, *exc_info):
+    return False
+
+  @property
+  async def text_stream(self) -> AsyncIterator[str]:
+    text = "".join(content.text for content in self._message.content if content.type == "text")
+    chunks = _chunks(text) if text else [""]
+    for chunk in chunks:
+      await asyncio.sleep(LATENCY / len(chunks))
+      if chunk:
+        yield chunk
+
+  async def get_final_message(self) -> Message:
+    return self._message
+
+
+class _ClaudeMessages:
+  def _message(self, messages: list[dict], tools: list[dict] | None = None, **kwargs) -> Message:
+    blocks = [block for message in messages for block in message["content"]]
+    prompts = [block.text for block in blocks if getattr(block, "type", None) == "text"]
+    has_result = any(isinstance(block, dict) and block.get("type") == "tool_result" for block in blocks)
+    # Claude gets the response schema in its system prompt
+    structured = "JSON schema" in json.dumps(kwargs.get("system") or "")
+    text, tool_name = _scripted_reply(prompts[0] if prompts else "", [tool["name"] for tool in tools or []], has_result, structured)
+
+    if tool_name:
+      content = [ToolUseBlock(id=f"toolu_{tool_name}", name=tool_name, input=TOOL_ARGUMENTS.get(tool_name, {}), type="tool_use")]
+    else:
+      content = [TextBlock(text=text, type="text")]
+    return Message(
+      id="msg_benchmark",
+      content=content,
+      model=kwargs.get("model", "benchmark"),
+      role="assistant",
+      stop_reason="tool_use" if tool_name else "end_turn",
+      stop_sequence=None,
+      type="message",
+      usage=Usage(input_tokens=0, output_tokens=len(text) // 4),
+    )
+
+  async def create(self, **kwargs) -> Message:
+    await asyncio.sleep(LATENCY)
+    return self._message(**kwargs)
+
+  def stream(self, **kwargs) -> _ClaudeStream:
+    return _ClaudeStream(self._message(**kwargs))
+
+  async def count_tokens(self, **kwargs) -> MessageTokensCount:
+    return MessageTokensCount(input_tokens=approximate_tokens(kwargs))
+
+
+class FakeAnthropicClient:
+  def __init__(self):
+    self.messages = _ClaudeMessages()
+
+
+def install():
+  """Route every `Claude` and `Gemini` instance to the scripted clients."""
+  Claude._create_client = classmethod(lambda cls: FakeAnthropicClient())
+  Gemini._create_client = classmethod(lambda cls: FakeGeminiClient())
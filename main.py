@@ -1,14 +1,22 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.infrastructure.telemetry import import_profile
+import_profile.install()
+
 from src.application.commands import register_all_commands
+from src.application.services.scheduler import get_scheduler
 from src.config.env import Env
 from src.infrastructure.messaging.slack.notifier import initialize as initialize_notifier
+from src.infrastructure.mcp.tool_catalog import get_tool_catalog
+from src.infrastructure.runtime.worker_pool import get_runtime
+from src.infrastructure.telemetry import metrics
 
 from slack_sdk import WebClient
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
+import atexit
 import ssl
 
 custom_ca_path = Env["CA_CERTIFICATE_PATH"]
@@ -18,9 +26,24 @@ client = WebClient(token=Env["SLACK_BOT_TOKEN"], ssl=ssl_context)
 app = App(token=Env["SLACK_BOT_TOKEN"], client=client)
 initialize_notifier(app)
 
+# Command modules, provider SDKs and custom tools are imported on first use
 register_all_commands(app)
+import_profile.report()
+
+
+def close_mcp_sessions():
+    from src.infrastructure.mcp.session_pool import get_pool
+    # MCP sessions live on the background runtime, so they are closed there while it still runs
+    get_runtime().run(get_pool().close_all()).result(timeout=30)
+
 
 if __name__ == "__main__":
+    if Env["METRICS_PORT"]:
+        metrics.start_http_server(int(Env["METRICS_PORT"]))
+    # Build the tool catalog in the background so the first plan does not wait for it
+    get_tool_catalog().start()
+    get_scheduler().start()
+    atexit.register(close_mcp_sessions)
     print("🤖 Slack bot is running...")
     handler = SocketModeHandler(app, Env["SLACK_APP_TOKEN"])
     handler.start()
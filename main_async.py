@@ -0,0 +1,90 @@
+from dotenv import load_dotenv
+load_dotenv()
+
+from src.infrastructure.telemetry import import_profile
+import_profile.install()
+
+import asyncio
+import multiprocessing
+import ssl
+
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.application.commands import register_all_commands, run_job
+from src.application.services.scheduler import get_scheduler
+from src.config.env import Env
+from src.infrastructure.messaging.slack.notifier import initialize as initialize_notifier
+from src.infrastructure.mcp.tool_catalog import get_tool_catalog
+from src.infrastructure.runtime.job_queue import JobQueue, set_job_queue
+from src.infrastructure.runtime.worker_pool import DEFAULT_CONCURRENCY, DEFAULT_MAX_QUEUE
+from src.infrastructure.telemetry import metrics
+
+# Slack allows up to 10 open Socket Mode connections per app and spreads events across them
+DEFAULT_CONNECTIONS = 2
+DEFAULT_WORKER_PROCESSES = 1
+
+
+def create_app() -> AsyncApp:
+  ssl_context = ssl.create_default_context(cafile=Env["CA_CERTIFICATE_PATH"])
+  client = AsyncWebClient(token=Env["SLACK_BOT_TOKEN"], ssl=ssl_context)
+  app = AsyncApp(token=Env["SLACK_BOT_TOKEN"], client=client)
+  initialize_notifier(app)
+  # Listeners only ack and dispatch; command modules are imported by whoever runs the job
+  register_all_commands(app)
+  return app
+
+
+async def serve(app: AsyncApp):
+  connections = int(Env["SOCKET_MODE_CONNECTIONS"] or DEFAULT_CONNECTIONS)
+  handlers = [AsyncSocketModeHandler(app, Env["SLACK_APP_TOKEN"]) for _ in range(connections)]
+  for handler in handlers:
+    await handler.connect_async()
+  print(f"🤖 Slack bot is running with {connections} connection(s)...")
+  try:
+    await asyncio.Event().wait()
+  finally:
+    from src.infrastructure.mcp.session_pool import get_pool
+    # Sessions opened here or on the background runtime are closed on their own loop before this one closes
+    await get_pool().close_all()
+
+
+def run_worker(jobs=None, index: int = 0):
+  if Env["METRICS_PORT"]:
+    # Each worker process exposes its own registry on consecutive ports
+    metrics.start_http_server(int(Env["METRICS_PORT"]) + index)
+  # Jobs post through the notifier, so the app that sets it up comes before the first job is taken
+  app = create_app()
+  if jobs is not None:
+    job_queue = JobQueue(jobs)
+    set_job_queue(job_queue)
+    job_queue.consume(run_job, int(Env["COMMAND_WORKER_CONCURRENCY"] or DEFAULT_CONCURRENCY))
+  import_profile.report()
+  # Build the tool catalog in the background so the first plan does not wait for it
+  get_tool_catalog().start()
+  if index == 0:
+    # Only one process runs the schedule; the digests it stores are shared on disk
+    get_scheduler().start()
+  asyncio.run(serve(app))
+
+
+def main():
+  processes = int(Env["WORKER_PROCESSES"] or DEFAULT_WORKER_PROCESSES)
+  if processes <= 1:
+    run_worker()
+    return
+
+  # Every process keeps its own connections, runtime and MCP sessions, and they all
+  # share one job queue so a command can run wherever there is a free slot
+  context = multiprocessing.get_context("spawn")
+  jobs = context.Queue(maxsize=int(Env["COMMAND_QUEUE_MAX"] or DEFAULT_MAX_QUEUE))
+  workers = [context.Process(target=run_worker, args=(jobs, i), name=f"slack-worker-{i}") for i in range(processes)]
+  for worker in workers:
+    worker.start()
+  for worker in workers:
+    worker.join()
+
+
+if __name__ == "__main__":
+  main()
@@ -1,21 +1,103 @@
 import os
+import ast
+import asyncio
 from slack_bolt import App
+from slack_bolt.context.respond import Respond
 import importlib
 import pkgutil
-from src.infrastructure.messaging.slack.notifier import post_message
+from src.config.env import Env
+from src.infrastructure.messaging.slack.notifier import enqueue_message, send_message
+from src.infrastructure.runtime.job_queue import CommandJob, get_job_queue
+from src.infrastructure.runtime.worker_pool import get_runtime
+from src.infrastructure.telemetry.report import format_breakdown
+from src.infrastructure.telemetry.tracer import Span, span
 
 
-def _decorate_handler(handler_fn):
+BUSY_MESSAGE = "The bot is busy with other requests right now, please try again in a moment."
+
+
+def _command_span(command: dict) -> dict:
+  return {"command": command.get("command"), "channel": command.get("channel_id")}
+
+def _post_breakdown(command: dict, root: Span):
+  """Post the per-command timing tree when TRACE_POST_BREAKDOWN is set, threaded under the bot's reply if known."""
+  if (Env["TRACE_POST_BREAKDOWN"] or "").lower() not in ("1", "true", "yes"):
+    return
+  enqueue_message(command.get("channel_id"), format_breakdown(root), thread_ts=root.attributes.get("slack_ts"))
+
+async def _run_async_handler(handler_fn, ack, respond, command: dict):
+  try:
+    with span("command", **_command_span(command)) as root:
+      await handler_fn(ack, respond, command)
+  except Exception as e:
+    await send_message(command.get("channel_id"), f"Error handling command: {e}")
+  _post_breakdown(command, root)
+
+def _run_sync_handler(handler_fn, ack, respond, command: dict):
+  try:
+    with span("command", **_command_span(command)) as root:
+      handler_fn(ack, respond, command)
+  except Exception as e:
+    # respond expects a message text, not channel. Use the notifier for channel targeting
+    enqueue_message(command.get("channel_id"), f"Error handling command: {e}")
+  _post_breakdown(command, root)
+
+def _acked(*args, **kwargs):
+  """Stand-in `ack` for jobs whose listener already acknowledged the command."""
+
+async def run_job(job: CommandJob):
+  """Run a command handed over by an async listener, in this process or another worker process."""
+  command = job.command
+  try:
+    # The first import of a command pulls in its services and SDKs; keep it off the runtime's loop
+    module = await asyncio.to_thread(importlib.import_module, job.module)
+    handler_fn = getattr(module, job.handler)
+  except (ImportError, AttributeError) as e:
+    await send_message(command.get("channel_id"), f"Error handling command: {e}")
+    return
+
+  respond = Respond(response_url=command.get("response_url"))
+  if asyncio.iscoroutinefunction(handler_fn):
+    await _run_async_handler(handler_fn, _acked, respond, command)
+  else:
+    await asyncio.to_thread(_run_sync_handler, handler_fn, _acked, respond, command)
+
+def _dispatch(job: CommandJob) -> bool:
+  job_queue = get_job_queue()
+  if job_queue is not None:
+    return job_queue.put(job)
+  return get_runtime().submit(lambda: run_job(job))
+
+def _async_listener(module_name: str, handler_name: str):
+  async def listener(ack, command):
+    # Ack on the app's own loop before anything else; the command runs on the background runtime
+    # or in whichever worker process takes it from the shared queue
+    await ack()
+    if not _dispatch(CommandJob(module_name, handler_name, command)):
+      enqueue_message(command.get("channel_id"), BUSY_MESSAGE)
+  return listener
+
+def _defines_handler(path: str, handler_name: str) -> bool:
+  """Look for a top-level `handler_name` function in the module source without importing it."""
+  with open(path, "r", encoding="utf-8") as f:
+    tree = ast.parse(f.read(), filename=path)
+  return any(
+    isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == handler_name for node in tree.body
+  )
+
+def _lazy_handler(module_name: str, handler_name: str):
+  """
+  Ack first, then import the command module (and with it the services and
+  SDKs it needs) and run it on the background runtime, so a cold first
+  invocation cannot miss Slack's ack deadline.
+  """
   def wrapper(ack, respond, command):
     ack()
-    try:
-      handler_fn(ack, respond, command)
-    except Exception as e:
-      # respond expects a message text, not channel. Use post_message for channel targeting
-      post_message(command.get("channel_id"), f"Error handling command: {e}")  
+    if not _dispatch(CommandJob(module_name, handler_name, command)):
+      enqueue_message(command.get("channel_id"), BUSY_MESSAGE)
   return wrapper
 
-def _register_commands_recursive(app: App, package_name: str, package_path: str, prefix: str = ""):
+def _register_commands_recursive(app, package_name: str, package_path: str, prefix: str = "", listener=_lazy_handler):
   """Recursively register commands from packages and subpackages."""
   for _, name, ispkg in pkgutil.iter_modules(package_path):
     if name.startswith("_"):
@@ -27,24 +109,25 @@ def _register_commands_recursive(app: App, package_name: str, package_path: str,
       # Handle subpackage - recursively register commands with folder prefix
       subpackage = [os.path.join(package_path[0], name)]
       folder_prefix = f"{prefix}{name}-" if prefix else f"{name}-"
-      _register_commands_recursive(app, full_module_name, subpackage, folder_prefix)
+      _register_commands_recursive(app, full_module_name, subpackage, folder_prefix, listener)
     else:
-      # Handle module - try to register command
+      # Handle module - register the command without importing it
+      handler_name = f"handle_{name}"
       try:
-        module = importlib.import_module(full_module_name)
-        handler_name = f"handle_{name}"
-        handler_fn = getattr(module, handler_name, None)
-        
-        if callable(handler_fn):
-          # Create command name with folder prefix
-          command_name = f"{prefix}{name}"
-          slash_command = f"/{command_name}"
-          app.command(slash_command)(_decorate_handler(handler_fn))
-          print(f"Registered command: {slash_command}")
-      except ImportError as e:
-        print(f"Failed to import module {full_module_name}: {e}")
-
-def register_all_commands(app: App):
-  """Register all commands from the commands package and its subpackages."""
+        if not _defines_handler(os.path.join(package_path[0], f"{name}.py"), handler_name):
+          continue
+      except (OSError, SyntaxError) as e:
+        print(f"Failed to read module {full_module_name}: {e}")
+        continue
+
+      # Create command name with folder prefix
+      command_name = f"{prefix}{name}"
+      slash_command = f"/{command_name}"
+      app.command(slash_command)(listener(full_module_name, handler_name))
+      print(f"Registered command: {slash_command}")
+
+def register_all_commands(app):
+  """Register all commands from the commands package and its subpackages, on either a sync `App` or an `AsyncApp`."""
   package = __name__
-  _register_commands_recursive(app, package, __path__)
\ No newline at end of file
+  listener = _async_listener if hasattr(app, "async_dispatch") else _lazy_handler
+  _register_commands_recursive(app, package, __path__, listener=listener)
\ No newline at end of file
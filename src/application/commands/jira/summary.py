@@ -1,11 +1,26 @@
 from slack_bolt import App
 
-from src.application.services.jira.get_summary import get_summary
-from src.infrastructure.messaging.slack.notifier import post_message
+from src.application.services.jira.get_summary import stream_summary
+from src.infrastructure.llm.stream import StreamEventType
+from src.infrastructure.messaging.slack.stream import SlackStream
 
 
-def handle_summary(ack, respond, command):
+async def handle_summary(ack, respond, command):
   ack("Generating sprint summary...")
 
-  summary = get_summary(command.get("channel_id"), command.get("text"))
-  post_message(command.get("channel_id"), str(summary))
\ No newline at end of file
+  stream = SlackStream(command.get("channel_id"))
+  await stream.start("Generating sprint summary...")
+
+  try:
+    async for event in stream_summary(command.get("channel_id"), command.get("text")):
+      if event.type == StreamEventType.TEXT:
+        await stream.append(event.text)
+      elif event.type == StreamEventType.STATUS:
+        await stream.set_status(event.text)
+      elif event.type == StreamEventType.TOOL_CALL:
+        await stream.set_status(f"Calling {event.tool_name}...")
+      elif event.type == StreamEventType.DONE:
+        await stream.finish(event.text)
+  except Exception as e:
+    # Replace the placeholder instead of leaving a stale "Generating..." message behind
+    await stream.finish(f"Error handling command: {e}")
\ No newline at end of file
@@ -0,0 +1,37 @@
+import threading
+import time
+from typing import Any
+
+from src.config.env import Env
+from src.infrastructure.cache.base import Cache
+from src.infrastructure.cache.keys import make_key, normalize_prompt
+
+
+DEFAULT_PATH = ".cache/digests.sqlite3"
+DEFAULT_MAX_ENTRIES = 256
+
+_CACHE: Cache | None = None
+_LOCK = threading.Lock()
+
+
+def get_digest_cache() -> Cache:
+  """Precomputed summaries, on disk so every worker process and restart can serve them."""
+  global _CACHE
+  with _LOCK:
+    if _CACHE is None:
+      from src.infrastructure.cache.sqlite import SqliteCache
+      _CACHE = SqliteCache(Env["DIGEST_CACHE_PATH"] or DEFAULT_PATH, max_entries=DEFAULT_MAX_ENTRIES)
+    return _CACHE
+
+
+def _key(prompt: str) -> str:
+  return make_key("digest", normalize_prompt(prompt))
+
+
+def get_digest(prompt: str) -> dict[str, Any] | None:
+  """{"summary", "created_at"} of the latest scheduled run for this prompt, if it has not expired."""
+  return get_digest_cache().get(_key(prompt))
+
+
+def store_digest(prompt: str, summary: str, max_age: float):
+  get_digest_cache().set(_key(prompt), {"summary": summary, "created_at": time.time()}, max_age)
@@ -1,18 +1,57 @@
 import asyncio
+import time
+from typing import AsyncIterator
 
 from src.config.agent import Agent
 from src.config.env import Env
 
+from src.application.services.jira.digest import get_digest
+from src.application.services.single_flight import SingleFlight
 from src.domain.use_case import jira
+from src.infrastructure.cache.keys import make_key, normalize_prompt
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
 
 
 DEFAULT_PROMPT = "Summary current sprint of board name: sentinels board"
+FRESH_FLAG = "--fresh"
 
-def get_summary(channel_id: str | None, prompt: str | None = None) -> str:
+# Identical summaries requested while one is running share its result
+_FLIGHTS = SingleFlight()
+
+def parse_prompt(prompt: str | None) -> tuple[str, bool]:
+  """Strip the `--fresh` flag from the command text; it bypasses cached plans and tool results."""
+  words = (prompt or "").split()
+  fresh = FRESH_FLAG in words
+  prompt = " ".join(word for word in words if word != FRESH_FLAG)
+  return prompt or DEFAULT_PROMPT, fresh
+
+def _flight_key(prompt: str, fresh: bool) -> str:
+  return make_key("jira-summary", normalize_prompt(prompt), fresh)
+
+async def _stream_digest(digest: dict) -> AsyncIterator[StreamEvent]:
+  created_at = time.strftime("%H:%M", time.localtime(digest["created_at"]))
+  yield StreamEvent(type=StreamEventType.STATUS, text=f"Serving the digest prepared at {created_at}")
+  yield StreamEvent(type=StreamEventType.DONE, text=digest["summary"], response=digest["summary"])
+
+async def get_summary(channel_id: str | None, prompt: str | None = None) -> str:
   if channel_id is None:
     raise Exception("Channel_id can not be null")
   
-  if not prompt:
-    prompt = DEFAULT_PROMPT
+  prompt, fresh = parse_prompt(prompt)
+  digest = None if fresh else get_digest(prompt)
+  if digest is not None:
+    return digest["summary"]
   
-  return jira.get_summary(prompt)
+  return await _FLIGHTS.do(_flight_key(prompt, fresh), lambda: jira.get_summary(prompt, fresh=fresh))
+
+def stream_summary(channel_id: str | None, prompt: str | None = None) -> AsyncIterator[StreamEvent]:
+  if channel_id is None:
+    raise Exception("Channel_id can not be null")
+
+  prompt, fresh = parse_prompt(prompt)
+  # Scheduled runs stash their result, so the standup rush is served without running the pipeline
+  digest = None if fresh else get_digest(prompt)
+  if digest is not None:
+    return _stream_digest(digest)
+
+  return _FLIGHTS.stream(_flight_key(prompt, fresh), lambda: jira.stream_summary(prompt, fresh=fresh))
@@ -0,0 +1,90 @@
+import asyncio
+import random
+from concurrent.futures import Future
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from src.application.services.jira.digest import store_digest
+from src.config.schedule import Schedule
+from src.infrastructure.messaging.slack.notifier import send_message
+from src.infrastructure.runtime.cron import Cron
+from src.infrastructure.runtime.worker_pool import get_runtime
+from src.infrastructure.telemetry.tracer import span
+
+
+class Scheduler:
+  """
+  Runs the summary pipeline ahead of time for the jobs in config/schedule.json.
+
+  Each job wakes at its cron time plus a random jitter and then waits for one
+  of `max_concurrency` slots, so jobs sharing a time do not hit the model
+  providers at once. A run warms the plan, tool and snapshot caches, stashes
+  the summary as a digest the slash command serves, and optionally posts it
+  to the job's channel.
+  """
+
+  def __init__(self, jobs: list[dict], max_concurrency: int):
+    self._jobs = jobs
+    self._max_concurrency = max_concurrency
+    self._runner: Future | None = None
+
+  def start(self):
+    if self._runner is None and self._jobs:
+      self._runner = get_runtime().run(self._run_forever())
+      self._runner.add_done_callback(self._report)
+      print(f"Scheduled {len(self._jobs)} digest job(s)")
+
+  def _report(self, runner: Future):
+    if not runner.cancelled() and runner.exception() is not None:
+      print(f"Scheduler stopped: {runner.exception()}")
+
+  async def _run_forever(self):
+    slots = asyncio.Semaphore(self._max_concurrency)
+    await asyncio.gather(*[self._job_forever(job, slots) for job in self._jobs], return_exceptions=True)
+
+  async def _job_forever(self, job: dict, slots: asyncio.Semaphore):
+    try:
+      cron = Cron(job["cron"])
+      timezone = ZoneInfo(job["timezone"]) if job["timezone"] else None
+    except Exception as e:
+      print(f"Scheduled job {job['name']} disabled: {e}")
+      return
+
+    while True:
+      try:
+        now = datetime.now(timezone)
+        # Timestamps, not aware datetimes: subtracting those in one zone gives wall-clock time, off by an hour across DST
+        delay = cron.next_after(now).timestamp() - now.timestamp() + random.uniform(0, job["jitter_seconds"])
+        await asyncio.sleep(delay)
+        async with slots:
+          await self.run_job(job)
+      except Exception as e:
+        print(f"Scheduled job {job['name']} stopped: {e}")
+        return
+
+  async def run_job(self, job: dict):
+    # Imported on the first run so starting the scheduler does not load the whole pipeline at boot
+    from src.application.services.jira.get_summary import parse_prompt
+    from src.domain.use_case import jira
+
+    prompt, _ = parse_prompt(job["prompt"])
+    try:
+      with span("scheduler.job", job=job["name"]):
+        summary = await jira.get_summary(prompt)
+    except Exception as e:
+      print(f"Scheduled job {job['name']} failed: {e}")
+      return
+
+    store_digest(prompt, summary, job["max_age_seconds"])
+    if job["post"] and job["channel"]:
+      await send_message(job["channel"], summary)
+
+
+_SCHEDULER: Scheduler | None = None
+
+
+def get_scheduler() -> Scheduler:
+  global _SCHEDULER
+  if _SCHEDULER is None:
+    _SCHEDULER = Scheduler(Schedule.jobs(), Schedule.max_concurrency())
+  return _SCHEDULER
@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
+from src.infrastructure.telemetry.tracer import set_root_attributes
+
+
+JOINED_MESSAGE = "Joining an identical request that is already running..."
+
+
+class SingleFlight:
+  """
+  Coalesces identical in-flight service calls.
+
+  The first caller for a key runs the work; callers arriving with the same
+  key while it runs wait on its future and get the same result, so only one
+  set of planner, MCP and model calls is made. Keys are released as soon as
+  the work finishes, so nothing is cached. All callers must share one event
+  loop, which the background runtime guarantees within a process.
+  """
+
+  def __init__(self):
+    # Keyed by (kind, key): a streamed flight resolves to its DONE event, not to a plain result
+    self._flights: dict[tuple[str, str], asyncio.Future] = {}
+
+  def _begin(self, key: tuple[str, str]) -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    self._flights[key] = future
+    return future
+
+  def _end(self, key: tuple[str, str], future: asyncio.Future, error: BaseException | None = None):
+    if not future.done():
+      future.set_exception(error or RuntimeError("The request being joined stopped before finishing"))
+    # Reading the exception marks it retrieved, so a flight nobody joined does not log a warning
+    future.exception()
+    if self._flights.get(key) is future:
+      del self._flights[key]
+
+  async def do(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+    key = ("do", key)
+    future = self._flights.get(key)
+    if future is not None:
+      set_root_attributes(coalesced=True)
+      return await asyncio.shield(future)
+
+    future = self._begin(key)
+    error = None
+    try:
+      result = await work()
+      future.set_result(result)
+      return result
+    except Exception as e:
+      error = e
+      raise
+    finally:
+      self._end(key, future, error)
+
+  async def stream(self, key: str, source: Callable[[], AsyncIterator[StreamEvent]]) -> AsyncIterator[StreamEvent]:
+    """
+    Stream the events of `source`; a duplicate of a running stream gets a
+    status event and then the leader's DONE event once it arrives.
+    """
+    key = ("stream", key)
+    future = self._flights.get(key)
+    if future is not None:
+      set_root_attributes(coalesced=True)
+      yield StreamEvent(type=StreamEventType.STATUS, text=JOINED_MESSAGE)
+      yield await asyncio.shield(future)
+      return
+
+    future = self._begin(key)
+    error = None
+    try:
+      async for event in source():
+        if event.type == StreamEventType.DONE and not future.done():
+          future.set_result(event)
+        yield event
+    except Exception as e:
+      error = e
+      raise
+    finally:
+      self._end(key, future, error)
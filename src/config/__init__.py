@@ -1,3 +0,0 @@
-from .mcp import initialize as initialize_mcp
-
-initialize_mcp()
\ No newline at end of file
@@ -1,3 +1,10 @@
 class Agent:
   GEMINI = "gemini"
   CLAUDE = "claude"
+
+
+class Route:
+  """Request classes the router keeps separate latency figures for."""
+  PLANNING = "planning"
+  TOOLS = "tools"
+  FORMATTING = "formatting"
@@ -0,0 +1,24 @@
+class CacheTtl:
+  """Cache lifetimes in seconds. Tools not matched here are never cached."""
+  PLAN: float = 600
+  # Deterministic (temperature 0) model responses
+  LLM_RESPONSE: float = 3600
+
+  # Read-only MCP tools, matched by name prefix; first match wins
+  TOOLS: dict[str, float] = {
+    "jira_get_sprints_from_board": 900,
+    "jira_get_agile_boards": 3600,
+    "jira_get_board_issues": 120,
+    "jira_get_sprint_issues": 120,
+    "jira_search": 120,
+    "jira_get_": 300,
+    "confluence_search": 300,
+    "confluence_get_": 600,
+  }
+
+  @classmethod
+  def for_tool(cls, name: str) -> float:
+    for prefix, ttl in cls.TOOLS.items():
+      if name.startswith(prefix):
+        return ttl
+    return 0
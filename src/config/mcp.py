@@ -10,14 +10,17 @@ _CONFIG: Dict[str, Any] = {}
 _LOADED: bool = False
 ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 CONFIG_PATH: str = os.path.join(ROOT_DIR, "config", "mcp.json")
+# mcp-atlassian tool whose results also feed the sprint snapshots
+SPRINT_ISSUES_TOOL = "jira_get_sprint_issues"
 
 
-def initialize() -> None:
+def initialize(config_path: str | None = None) -> None:
   global _CONFIG, _LOADED, CONFIG_PATH
-  if not os.path.exists(CONFIG_PATH):
-    raise FileNotFoundError("MCP config not found at config/mcp.json")
+  config_path = config_path or CONFIG_PATH
+  if not os.path.exists(config_path):
+    raise FileNotFoundError(f"MCP config not found at {config_path}")
   try:
-    with open(CONFIG_PATH, "r") as f:
+    with open(config_path, "r") as f:
       data = json.load(f)
     if not isinstance(data.get("mcpServers"), dict):
       raise ValueError("missing 'mcpServers' object")
@@ -40,12 +43,17 @@ def initialize() -> None:
     raise ValueError(f"Invalid MCP config: {e}")
 
 
+def _ensure_loaded() -> None:
+  # Deferred until the first MCP lookup so importing `src.config` stays free of file I/O
+  if not _LOADED:
+    initialize()
+
+
 class Mcp:
   @classmethod
   def __class_getitem__(cls, key: str) -> Dict[str, Any]:
     try:
-      if not _LOADED:
-        raise RuntimeError("MCP config not initialized. Call initialize() at startup.")
+      _ensure_loaded()
       servers = _CONFIG["mcpServers"]
       server_cfg = servers[key]
       return server_cfg
@@ -55,8 +63,7 @@ class Mcp:
   @classmethod
   def to_dict(cls) -> dict[str, Any]:
     try:
-      if not _LOADED:
-        raise RuntimeError("MCP config not initialized. Call initialize() at startup.")
+      _ensure_loaded()
       return _CONFIG
     except Exception as e:
       raise ValueError(f"Invalid MCP config: {e}")
@@ -64,8 +71,7 @@ class Mcp:
 
 def providers() -> list[str]:
   try:
-    if not _LOADED:
-      raise RuntimeError("MCP config not initialized. Call initialize() at startup.")
+    _ensure_loaded()
     return list((_CONFIG.get("mcpServers") or {}).keys())
   except Exception as e:
     raise ValueError(f"Unable to list MCP providers: {e}")
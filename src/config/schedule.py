@@ -0,0 +1,75 @@
+import os
+import json
+from datetime import datetime
+from typing import Any, Dict, List
+from zoneinfo import ZoneInfo
+
+from src.infrastructure.runtime.cron import Cron
+
+
+_CONFIG: Dict[str, Any] = {}
+_LOADED: bool = False
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CONFIG_PATH: str = os.path.join(ROOT_DIR, "config", "schedule.json")
+
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_JITTER_SECONDS = 120
+DEFAULT_DIGEST_MAX_AGE_SECONDS = 3600
+
+
+def initialize(config_path: str | None = None) -> None:
+  """Load the schedule; without a config file nothing is scheduled."""
+  global _CONFIG, _LOADED
+  config_path = config_path or CONFIG_PATH
+  _LOADED = True
+  if not os.path.exists(config_path):
+    _CONFIG = {"jobs": {}}
+    return
+  try:
+    with open(config_path, "r") as f:
+      data = json.load(f)
+    if not isinstance(data.get("jobs"), dict):
+      raise ValueError("missing 'jobs' object")
+
+    for name, job in data["jobs"].items():
+      if not job.get("cron"):
+        raise ValueError(f"job '{name}' has no 'cron'")
+      timezone = job.get("timezone") or data.get("timezone")
+      try:
+        # Fail at load time rather than in the scheduler, where a bad job would only die silently
+        Cron(job["cron"]).next_after(datetime.now(ZoneInfo(timezone) if timezone else None))
+      except Exception as e:
+        raise ValueError(f"job '{name}': {e}")
+
+    _CONFIG = data
+  except Exception as e:
+    raise ValueError(f"Invalid schedule config: {e}")
+
+
+def _ensure_loaded() -> None:
+  if not _LOADED:
+    initialize()
+
+
+class Schedule:
+  @classmethod
+  def jobs(cls) -> List[Dict[str, Any]]:
+    """Every job with its name and the top-level defaults filled in."""
+    _ensure_loaded()
+    return [
+      {
+        "name": name,
+        "cron": job["cron"],
+        "timezone": job.get("timezone") or _CONFIG.get("timezone"),
+        "prompt": job.get("prompt"),
+        "channel": job.get("channel"),
+        "post": bool(job.get("post", False)),
+        "jitter_seconds": float(job.get("jitterSeconds", _CONFIG.get("jitterSeconds", DEFAULT_JITTER_SECONDS))),
+        "max_age_seconds": float(job.get("maxAgeSeconds", _CONFIG.get("maxAgeSeconds", DEFAULT_DIGEST_MAX_AGE_SECONDS))),
+      } for name, job in _CONFIG["jobs"].items() if job.get("enabled", True)
+    ]
+
+  @classmethod
+  def max_concurrency(cls) -> int:
+    _ensure_loaded()
+    return int(_CONFIG.get("maxConcurrency", DEFAULT_MAX_CONCURRENCY))
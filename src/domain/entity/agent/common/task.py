@@ -1,5 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class Task(BaseModel):
   id: int
-  description: str
\ No newline at end of file
+  description: str
+  depends_on: list[int] = Field(default_factory=list)
+  tool: str | None = None
+  arguments: str | None = None
\ No newline at end of file
@@ -0,0 +1,161 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
+from src.config.agent import Route
+from src.config.env import Env
+from src.infrastructure.llm.adapter import Adapter
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
+from src.domain.entity.agent.common.plan import Plan
+from src.domain.entity.agent.common.task import Task
+from src.domain.entity.custom_tool.jira.get_sprint_issues import GetSprintIssues
+from src.domain.entity.custom_tool.jira.omit_issue_data_for_summary import OmitIssueDataForSummary
+
+DEFAULT_CONCURRENCY = 4
+
+STEP_PROMPT = """You are executing one step of a plan.
+Overall goal: {goal}
+Current step: {description}
+{context}
+Use the available tools when this step needs data. Reply with the result of this step only."""
+
+
+class Executor:
+  """
+  Runs a `Plan` as a DAG: steps whose `depends_on` are satisfied run concurrently
+  on the current event loop, each with its own agent session, and the last step
+  (the formatting step) runs once everything else has finished. Steps are
+  routed between providers unless `agent` pins one.
+  """
+
+  def __init__(self, agent: str | None = None, concurrency: int | None = None):
+    self._agent_name = agent
+    self._concurrency = concurrency or int(Env["PLAN_STEP_CONCURRENCY"] or DEFAULT_CONCURRENCY)
+
+  def _config(self) -> dict:
+    return {
+      'temperature': 0,
+      'use_tools': True,
+      'custom_tools': [
+        GetSprintIssues,
+        OmitIssueDataForSummary
+      ]
+    }
+
+  def _dependencies(self, plan: Plan) -> dict[int, set[int]]:
+    """Resolve step edges; unknown ids are dropped and a cyclic plan falls back to running in id order."""
+    ids = [step.id for step in plan.steps]
+    known = set(ids)
+    final_id = ids[-1]
+    dependencies = {step.id: {dep for dep in step.depends_on if dep in known and dep != step.id} for step in plan.steps}
+    # The final formatting step waits for every other step
+    dependencies[final_id] = known - {final_id}
+
+    remaining = {step_id: set(deps) for step_id, deps in dependencies.items()}
+    while remaining:
+      ready = [step_id for step_id, deps in remaining.items() if not deps]
+      if not ready:
+        return {step_id: set(ids[:index]) for index, step_id in enumerate(ids)}
+      for step_id in ready:
+        del remaining[step_id]
+      for deps in remaining.values():
+        deps.difference_update(ready)
+
+    return dependencies
+
+  def _prompt(self, plan: Plan, step: Task, dependencies: set[int], outputs: dict[int, str], steps: dict[int, Task]) -> str:
+    context = ""
+    if dependencies:
+      context = "Results of the steps this one depends on:\n" + "\n".join(
+        f"### Step {dep}: {steps[dep].description}\n{outputs.get(dep, '')}" for dep in sorted(dependencies)
+      ) + "\n"
+    return STEP_PROMPT.format(goal=plan.goal, description=step.description, context=context)
+
+  async def _run_tool_step(self, agent: Adapter, step: Task, arguments: dict) -> str:
+    result = await agent.call_tool(step.tool, arguments)
+    return "\n".join(getattr(content, "text", str(content)) for content in result.content)
+
+  async def _run_step(self, plan: Plan, step: Task, dependencies: set[int], outputs: dict[int, str], steps: dict[int, Task], events: asyncio.Queue, stream_text: bool) -> str:
+    # The final step formats the answer; every other step is a tool loop
+    agent = Adapter(self._agent_name, Route.FORMATTING if stream_text else Route.TOOLS)
+    await agent.open_session()
+    try:
+      arguments = None
+      if step.tool and step.arguments:
+        try:
+          arguments = json.loads(step.arguments)
+        except json.JSONDecodeError:
+          # Malformed arguments; let the model make the call instead
+          pass
+      if isinstance(arguments, dict):
+        return await self._run_tool_step(agent, step, arguments)
+
+      output = ""
+      async for event in agent.stream_message(self._prompt(plan, step, dependencies, outputs, steps), self._config()):
+        if event.type == StreamEventType.DONE:
+          output = event.text
+        elif event.type != StreamEventType.TEXT or stream_text:
+          await events.put(event)
+      return output
+    finally:
+      await agent.close_session()
+
+  async def stream(self, plan: Plan) -> AsyncIterator[StreamEvent]:
+    """Yield step progress and the final step's text deltas, then DONE with the final step's output."""
+    if not plan.steps:
+      yield StreamEvent(type=StreamEventType.DONE)
+      return
+
+    steps = {step.id: step for step in plan.steps}
+    final_id = plan.steps[-1].id
+    dependencies = self._dependencies(plan)
+    outputs: dict[int, str] = {}
+    events: asyncio.Queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(self._concurrency)
+    running: dict[asyncio.Task, int] = {}
+
+    async def run(step: Task) -> str:
+      async with semaphore:
+        await events.put(StreamEvent(type=StreamEventType.STATUS, text=f"Step {step.id}: {step.description}"))
+        try:
+          return await self._run_step(plan, step, dependencies[step.id], outputs, steps, events, step.id == final_id)
+        except Exception as e:
+          return f"Step failed: {e}"
+
+    def launch_ready():
+      started = set(running.values())
+      for step_id, deps in dependencies.items():
+        if step_id not in outputs and step_id not in started and deps.issubset(outputs):
+          running[asyncio.create_task(run(steps[step_id]))] = step_id
+
+    launch_ready()
+    try:
+      while running:
+        waiter = asyncio.create_task(events.get())
+        done, _ = await asyncio.wait([waiter, *running], return_when=asyncio.FIRST_COMPLETED)
+
+        if waiter in done:
+          yield waiter.result()
+        else:
+          waiter.cancel()
+
+        for task in done:
+          if task is waiter:
+            continue
+          outputs[running.pop(task)] = task.result()
+        launch_ready()
+
+      while not events.empty():
+        yield events.get_nowait()
+    finally:
+      for task in running:
+        task.cancel()
+
+    yield StreamEvent(type=StreamEventType.DONE, text=outputs[final_id], response=outputs)
+
+  async def call(self, plan: Plan) -> str:
+    output = ""
+    async for event in self.stream(plan):
+      if event.type == StreamEventType.DONE:
+        output = event.text
+    return output
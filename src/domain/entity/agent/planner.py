@@ -1,11 +1,19 @@
-from src.config.agent import Agent
+from typing import AsyncIterator
+from src.config.agent import Route
+from src.config.cache import CacheTtl
+from src.infrastructure.cache.keys import make_key, normalize_prompt
+from src.infrastructure.cache.store import get_cache, is_bypassed
 from src.infrastructure.llm.adapter import Adapter
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType, isolated
+from src.infrastructure.mcp.tool_catalog import format_tools, get_tool_catalog
+from src.infrastructure.telemetry.tracer import span
 from src.domain.entity.agent.common.plan import Plan
 
 class Planner:
-  def __init__(self, template_path: str):
+  def __init__(self, template_path: str, domain: str | None = None):
     self._template_path = template_path
-    self._agent = Adapter(Agent.GEMINI)
+    self._domain = domain
+    self._agent = Adapter(route=Route.PLANNING)
 
   def _load_template(self) -> str:
     """Load the planning template and replace the user_goal placeholder."""
@@ -21,18 +29,78 @@ class Planner:
       Available tools: **available_tools**
       """
 
+  async def _available_tools(self) -> str:
+    """Tool list for the prompt, served from the catalog so planning does not spend a round trip on discovery."""
+    return format_tools(await get_tool_catalog().get(self._domain))
+
+  def _config(self, available_tools: str) -> dict:
+    # The template goes in the system prompt and the goal in the message, so the
+    # large, identical prefix can be served from the provider's prompt cache
+    return {
+      'temperature': 0,
+      'system_instruction': self._load_template()
+        .replace("**user_goal**", "Provided in the user message.")
+        .replace("**available_tools**", available_tools),
+      'response_mime_type': 'application/json',
+      'response_schema': Plan
+    }
+
+  def _parse(self, response) -> Plan:
+    # Gemini parses against the schema itself; Claude answers with the JSON text
+    return Plan.model_validate_json(response) if isinstance(response, str) else response.parsed
+
+  def _cache_key(self, prompt: str, available_tools: str) -> str:
+    return make_key("plan", self._template_path, available_tools, normalize_prompt(prompt))
+
+  def _cached_plan(self, prompt: str, available_tools: str) -> Plan | None:
+    if is_bypassed():
+      return None
+    cached = get_cache().get(self._cache_key(prompt, available_tools))
+    return Plan.model_validate_json(cached) if cached is not None else None
+
+  def _store_plan(self, prompt: str, available_tools: str, plan: Plan):
+    get_cache().set(self._cache_key(prompt, available_tools), plan.model_dump_json(), CacheTtl.PLAN)
+
   async def call(self, prompt: str) -> Plan:
-    await self._agent.open_session()
-
-    template = self._load_template()
-
-    response = await self._agent.send_message(
-      template.replace("*user_goal*", prompt),
-      {
-        'temperature': 0,
-        'response_mime_type': 'application/json',
-        'response_schema': Plan
-      }
-    )
-    await self._agent.close_session()
-    return response.parsed
+    with span("planner.call") as current:
+      available_tools = await self._available_tools()
+      plan = self._cached_plan(prompt, available_tools)
+      current.set(cached=plan is not None)
+      if plan is not None:
+        return plan
+
+      await self._agent.open_session()
+
+      try:
+        response = await self._agent.send_message(prompt, self._config(available_tools))
+      finally:
+        await self._agent.close_session()
+
+      plan = self._parse(response)
+      self._store_plan(prompt, available_tools, plan)
+      return plan
+
+  def stream(self, prompt: str) -> AsyncIterator[StreamEvent]:
+    """Stream planning progress; the final DONE event carries the parsed `Plan` as `response`."""
+    return isolated(self._stream(prompt))
+
+  async def _stream(self, prompt: str) -> AsyncIterator[StreamEvent]:
+    with span("planner.call") as current:
+      available_tools = await self._available_tools()
+      plan = self._cached_plan(prompt, available_tools)
+      current.set(cached=plan is not None)
+      if plan is not None:
+        yield StreamEvent(type=StreamEventType.DONE, text=plan.model_dump_json(), response=plan)
+        return
+
+      await self._agent.open_session()
+
+      try:
+        async for event in self._agent.stream_message(prompt, self._config(available_tools)):
+          if event.type == StreamEventType.DONE:
+            plan = Plan.model_validate_json(event.text)
+            self._store_plan(prompt, available_tools, plan)
+            event = StreamEvent(type=StreamEventType.DONE, text=event.text, response=plan)
+          yield event
+      finally:
+        await self._agent.close_session()
@@ -7,11 +7,13 @@ import importlib
 import pkgutil
 from typing import Dict, List, Type
 from .base import Base
+from .registry import PACKAGE_PATH, Registry
 
 
-def discover_tools(package_path: str = "src.infrastructure.mcp.custom_tool") -> Dict[str, Type[Base]]:
+def discover_tools(package_path: str = PACKAGE_PATH) -> Dict[str, Type[Base]]:
     """
     Dynamically discover and import all custom tools in the package.
+    Prefer `Registry`, which runs this scan once and caches the result.
     
     Args:
         package_path: The package path to search for tools
@@ -39,7 +41,8 @@ def discover_tools(package_path: str = "src.infrastructure.mcp.custom_tool") ->
                     attr = getattr(module, attr_name)
                     if (isinstance(attr, type) and 
                         issubclass(attr, Base) and 
-                        attr is not Base):
+                        attr is not Base and
+                        attr.__module__ == module.__name__):
                         
                         tool_name = attr.name()
                         tools[tool_name] = attr
@@ -64,13 +67,7 @@ def get_tool_by_name(name: str) -> Type[Base]:
     Raises:
         ValueError: If the tool is not found
     """
-    tools = discover_tools()
-    
-    if name not in tools:
-        available_tools = list(tools.keys())
-        raise ValueError(f"Tool '{name}' not found. Available tools: {available_tools}")
-    
-    return tools[name]
+    return Registry.get(name)
 
 
 def import_class_from_strings(module_name: str, class_name: str) -> Type[Base]:
@@ -133,12 +130,12 @@ def list_available_tools() -> List[str]:
     Returns:
         List of tool names
     """
-    tools = discover_tools()
-    return list(tools.keys())
+    return Registry.names()
 
 
 __all__ = [
     "Base", 
+    "Registry",
     "discover_tools", 
     "get_tool_by_name", 
     "list_available_tools",
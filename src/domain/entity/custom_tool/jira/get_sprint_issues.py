@@ -0,0 +1,136 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+from mcp import types
+
+from src.infrastructure.issue_tracking.jira.gateway import get_jira_gateway
+from ..base import Base
+from .projection import FIELD_PROFILES, profile, project_issue, source_fields
+from .sprint_snapshot import SNAPSHOT_PROFILE, aggregate, sync_sprint
+
+
+class GetSprintIssues(Base):
+    """
+    Custom tool fetching whole sprints straight from the Jira REST API.
+
+    Boards, sprints and every page of issues are fetched in one call, with only
+    the fields of the projection profile requested, instead of a model walking
+    the MCP tools one call at a time.
+    """
+
+    @classmethod
+    def inputSchema(cls) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "integer",
+                    "description": "Agile board id. Either board_id, project_key or sprint_id is required"
+                },
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key; every board of the project is used"
+                },
+                "sprint_id": {
+                    "type": "integer",
+                    "description": "A single sprint to fetch; board_id and project_key are then ignored"
+                },
+                "state": {
+                    "type": "string",
+                    "description": "Comma separated sprint states to fetch: future, active, closed. Defaults to active"
+                },
+                "jql": {
+                    "type": "string",
+                    "description": "Optional JQL filter applied to the sprint issues"
+                },
+                "use_case": {
+                    "type": "string",
+                    "enum": list(FIELD_PROFILES.keys()),
+                    "description": "Which field allow-list to keep. Defaults to sprint_summary"
+                },
+            },
+        }
+
+    @classmethod
+    def _error(cls, message: str) -> types.CallToolResult:
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=message)],
+            is_error=True
+        )
+
+    @classmethod
+    async def _sprints(cls, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+        gateway = get_jira_gateway()
+        if arguments.get("sprint_id"):
+            return [{"id": arguments["sprint_id"]}]
+
+        if arguments.get("board_id"):
+            board_ids = [arguments["board_id"]]
+        else:
+            board_ids = [board["id"] for board in await gateway.boards(project_key=arguments["project_key"])]
+
+        state = arguments.get("state") or "active"
+        results = await asyncio.gather(*[gateway.sprints(board_id, state) for board_id in board_ids], return_exceptions=True)
+        sprints = {}
+        for result in results:
+            # Kanban boards have no sprints and answer with an error
+            if isinstance(result, BaseException):
+                if len(board_ids) == 1:
+                    raise result
+                continue
+            for sprint in result:
+                sprints.setdefault(sprint["id"], sprint)
+        return list(sprints.values())
+
+    @classmethod
+    async def _issues(cls, sprint: Dict[str, Any], use_case: str, jql: str | None) -> Dict[str, Any]:
+        if use_case == SNAPSHOT_PROFILE and not jql:
+            # Served from the local snapshot, which only asks Jira for issues updated since the last sync
+            issues = await sync_sprint(sprint)
+        else:
+            fields = profile(use_case)
+            # Project each page as it arrives so raw issues never pile up
+            issues = [
+                project_issue(issue, fields)
+                async for issue in get_jira_gateway().iter_sprint_issues(sprint["id"], source_fields(use_case), jql)
+            ]
+        return {
+            "id": sprint["id"],
+            "name": sprint.get("name"),
+            "state": sprint.get("state"),
+            "goal": sprint.get("goal"),
+            "start_date": sprint.get("startDate"),
+            "end_date": sprint.get("endDate"),
+            "issues": issues,
+            "aggregates": aggregate(issues),
+        }
+
+    @classmethod
+    async def call(cls, arguments: dict[str, Any] | None = None) -> types.CallToolResult:
+        arguments = arguments or {}
+        if not get_jira_gateway().is_configured():
+            return cls._error("JIRA_URL is not configured")
+        if not any(arguments.get(key) for key in ("board_id", "project_key", "sprint_id")):
+            return cls._error("One of board_id, project_key or sprint_id is required")
+
+        use_case = arguments.get("use_case") or "sprint_summary"
+        try:
+            sprints = await cls._sprints(arguments)
+            result = await asyncio.gather(*[cls._issues(sprint, use_case, arguments.get("jql")) for sprint in sprints])
+        except (httpx.HTTPError, ValueError) as e:
+            return cls._error(f"Failed to fetch sprint issues from Jira: {e}")
+
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=json.dumps({"sprints": result}, default=str))],
+            is_error=False
+        )
+
+    @classmethod
+    def description(cls) -> str:
+        return (
+            "Fetches the issues of whole sprints directly from Jira in one call: by sprint_id, or the active "
+            "(or given state) sprints of a board or project. Returns only key, summary, status, assignee, "
+            "story points and dates per issue, plus issue and story point totals per status and assignee"
+        )
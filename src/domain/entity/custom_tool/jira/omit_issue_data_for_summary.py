@@ -1,6 +1,8 @@
+import json
 from typing import Any
 from mcp import types
 from ..base import Base
+from .projection import FIELD_PROFILES, project
 
 
 class OmitIssueDataForSummary(Base):
@@ -15,19 +17,33 @@ class OmitIssueDataForSummary(Base):
             "properties": {
                 "issues": {
                     "type": "object",
-                    "description": "The Jira issue data to process for summary"
+                    "description": "The Jira issue data to process for summary: a search result, an issue list or a single issue"
+                },
+                "use_case": {
+                    "type": "string",
+                    "enum": list(FIELD_PROFILES.keys()),
+                    "description": "Which field allow-list to keep. Defaults to sprint_summary"
                 },
             },
             "required": ["issues"]
         }
-    
+
     @classmethod
     async def call(cls, arguments: dict[str, Any] | None = None) -> types.CallToolResult:
+        arguments = arguments or {}
+        try:
+            result = project(arguments.get("issues", []), arguments.get("use_case") or "sprint_summary")
+        except (ValueError, TypeError) as e:
+            return types.CallToolResult(
+                content=[types.TextContent(type="text", text=str(e))],
+                is_error=True
+            )
+
         return types.CallToolResult(
-            content=[{}],
+            content=[types.TextContent(type="text", text=json.dumps(result.to_dict(), default=str))],
             is_error=False
         )
-    
+
     @classmethod
     def description(cls) -> str:
-        return "Omits fields from Jira issue data for summary"
+        return "Omits fields from Jira issue data for summary, keeping only key, summary, status, assignee, story points and dates"
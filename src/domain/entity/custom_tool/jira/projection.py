@@ -0,0 +1,143 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+
+from src.config.env import Env
+
+
+CHARS_PER_TOKEN = 4
+DEFAULT_STORY_POINTS_FIELDS = ("customfield_10016", "customfield_10026", "customfield_10002")
+
+# Output field -> candidate source paths, first non-empty wins. Paths cover both
+# the simplified mcp-atlassian issue shape and the raw Jira REST shape.
+FIELD_PROFILES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "sprint_summary": {
+        "key": ("key",),
+        "summary": ("summary", "fields.summary"),
+        "status": ("status.name", "fields.status.name", "status"),
+        "assignee": (
+            "assignee.display_name",
+            "assignee.displayName",
+            "assignee.name",
+            "fields.assignee.displayName",
+        ),
+        "story_points": (),
+        "created": ("created", "fields.created"),
+        "updated": ("updated", "fields.updated"),
+        "due_date": ("duedate", "due_date", "fields.duedate"),
+        "resolution_date": ("resolutiondate", "resolution_date", "fields.resolutiondate"),
+    },
+    "issue_list": {
+        "key": ("key",),
+        "summary": ("summary", "fields.summary"),
+        "status": ("status.name", "fields.status.name", "status"),
+        "issue_type": ("issue_type.name", "issuetype.name", "fields.issuetype.name"),
+        "priority": ("priority.name", "fields.priority.name"),
+    },
+}
+
+
+@dataclass
+class ProjectionResult:
+    issues: List[Dict[str, Any]] = field(default_factory=list)
+    original_bytes: int = 0
+    projected_bytes: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(self.original_bytes - self.projected_bytes, 0)
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.bytes_saved // CHARS_PER_TOKEN
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "issues": self.issues,
+            "total": len(self.issues),
+            "stats": {
+                "original_bytes": self.original_bytes,
+                "projected_bytes": self.projected_bytes,
+                "bytes_saved": self.bytes_saved,
+                "estimated_tokens_saved": self.tokens_saved,
+            },
+        }
+
+
+def _story_points_paths() -> Tuple[str, ...]:
+    configured = Env["JIRA_STORY_POINTS_FIELD"]
+    custom_fields = ((configured,) if configured else ()) + DEFAULT_STORY_POINTS_FIELDS
+    return ("story_points",) + tuple(
+        path for custom_field in custom_fields for path in (custom_field, f"fields.{custom_field}", f"custom_fields.{custom_field}.value")
+    )
+
+
+def _lookup(issue: Dict[str, Any], path: str) -> Any:
+    value: Any = issue
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+        if value is None:
+            return None
+    return value
+
+
+def _iter_issues(payload: Any) -> Iterator[Dict[str, Any]]:
+    """Yield issue dicts from a list, a search result ({"issues": [...]}) or a single issue, without copying."""
+    if isinstance(payload, list):
+        for item in payload:
+            yield from _iter_issues(item)
+    elif isinstance(payload, dict):
+        if isinstance(payload.get("issues"), list):
+            yield from payload["issues"]
+        elif "key" in payload:
+            yield payload
+
+
+def profile(use_case: str) -> Dict[str, Tuple[str, ...]]:
+    if use_case not in FIELD_PROFILES:
+        raise ValueError(f"Unknown projection profile '{use_case}'. Available: {list(FIELD_PROFILES.keys())}")
+    fields = dict(FIELD_PROFILES[use_case])
+    if "story_points" in fields:
+        fields["story_points"] = _story_points_paths()
+    return fields
+
+
+def source_fields(use_case: str) -> List[str]:
+    """Jira REST field ids a profile reads, for field selection when fetching issues directly."""
+    fields = []
+    for paths in profile(use_case).values():
+        for path in paths:
+            if path.startswith("fields.") and path.split(".")[1] not in fields:
+                fields.append(path.split(".")[1])
+    return fields
+
+
+def project_issue(issue: Dict[str, Any], fields: Dict[str, Tuple[str, ...]]) -> Dict[str, Any]:
+    projected = {}
+    for name, paths in fields.items():
+        for path in paths:
+            value = _lookup(issue, path)
+            if value not in (None, "", [], {}):
+                projected[name] = value
+                break
+    return projected
+
+
+def project(payload: Any, use_case: str = "sprint_summary") -> ProjectionResult:
+    """Keep only the allow-listed fields of every issue in `payload` (JSON string or parsed data)."""
+    if isinstance(payload, (str, bytes)):
+        original_bytes = len(payload)
+        payload = json.loads(payload)
+    else:
+        original_bytes = len(json.dumps(payload, separators=(",", ":"), default=str))
+
+    fields = profile(use_case)
+    issues = [project_issue(issue, fields) for issue in _iter_issues(payload)]
+
+    return ProjectionResult(
+        issues=issues,
+        original_bytes=original_bytes,
+        projected_bytes=len(json.dumps(issues, separators=(",", ":"), default=str)),
+    )
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Set
+
+from src.config.env import Env
+from src.infrastructure.issue_tracking.jira.gateway import get_jira_gateway
+from src.infrastructure.issue_tracking.jira.snapshot_store import get_snapshot_store
+from .projection import profile, project, project_issue, source_fields
+
+
+SNAPSHOT_PROFILE = "sprint_summary"
+DEFAULT_FULL_SYNC_INTERVAL = 6 * 3600
+# Extra minutes on the `updated >=` window; JQL dates only have minute precision
+SYNC_OVERLAP_MINUTES = 2
+SPRINT_META = ("name", "state", "goal", "startDate", "endDate")
+
+_TOUCHED: ContextVar[Set[int] | None] = ContextVar("touched_sprints", default=None)
+
+
+@contextmanager
+def track_sprints() -> Iterator[Set[int]]:
+    """Collect the ids of the sprints whose issues are fetched inside the block."""
+    touched: Set[int] = set()
+    token = _TOUCHED.set(touched)
+    try:
+        yield touched
+    finally:
+        _TOUCHED.reset(token)
+
+
+def _touch(sprint_id: int):
+    touched = _TOUCHED.get()
+    if touched is not None:
+        touched.add(sprint_id)
+
+
+async def sync_sprint(sprint: Dict[str, Any], full: bool = False) -> List[Dict[str, Any]]:
+    """
+    Bring the snapshot of a sprint up to date and return its issues.
+
+    Only issues updated since the last sync are fetched; every
+    JIRA_FULL_SYNC_INTERVAL seconds the whole sprint is fetched again to
+    notice issues that left it.
+    """
+    store = get_snapshot_store()
+    sprint_id = sprint["id"]
+    previous = store.sprint(sprint_id)
+    now = time.time()
+    interval = float(Env["JIRA_FULL_SYNC_INTERVAL"] or DEFAULT_FULL_SYNC_INTERVAL)
+    full = full or previous is None or not previous["full_synced_at"] or now - previous["full_synced_at"] > interval
+
+    jql = None
+    if not full:
+        # A relative date avoids guessing the timezone Jira evaluates absolute dates in
+        jql = f"updated >= -{math.ceil((now - previous['synced_at']) / 60) + SYNC_OVERLAP_MINUTES}m"
+
+    fields = profile(SNAPSHOT_PROFILE)
+    issues = [
+        project_issue(issue, fields)
+        async for issue in get_jira_gateway().iter_sprint_issues(sprint_id, source_fields(SNAPSHOT_PROFILE), jql)
+    ]
+    store.upsert_issues(sprint_id, issues)
+    if full:
+        store.retain_issues(sprint_id, {issue["key"] for issue in issues})
+
+    meta = {key: (sprint if sprint.get("name") else previous or {}).get(key) for key in SPRINT_META}
+    store.save_sprint(sprint_id, meta, synced_at=now, full_synced_at=now if full else None)
+    _touch(sprint_id)
+    return store.issues(sprint_id)
+
+
+def record_sprint_issues(arguments: Dict[str, Any] | None, text: str):
+    """Feed a page of `jira_get_sprint_issues` results from the MCP server into the snapshot."""
+    try:
+        sprint_id = int((arguments or {})["sprint_id"])
+        issues = [issue for issue in project(text, SNAPSHOT_PROFILE).issues if issue.get("key")]
+    except (KeyError, TypeError, ValueError):
+        return
+
+    store = get_snapshot_store()
+    # A page proves nothing about issues that left the sprint, so no sync time is recorded
+    if store.sprint(sprint_id) is None:
+        store.save_sprint(sprint_id, {})
+    store.upsert_issues(sprint_id, issues)
+    _touch(sprint_id)
+
+
+def _points(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def aggregate(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Issue counts and story points, overall, per status and per assignee."""
+    result: Dict[str, Any] = {"issues": len(issues), "story_points": 0.0, "by_status": {}, "by_assignee": {}}
+    for issue in issues:
+        points = _points(issue.get("story_points"))
+        result["story_points"] += points
+        for group, value, default in (("by_status", issue.get("status"), "Unknown"), ("by_assignee", issue.get("assignee"), "Unassigned")):
+            bucket = result[group].setdefault(str(value or default), {"issues": 0, "story_points": 0.0})
+            bucket["issues"] += 1
+            bucket["story_points"] += points
+    return result
+
+
+async def sprint_deltas(summary_key: str, sprint_ids: List[int]) -> List[Dict[str, Any]] | None:
+    """
+    Sync the sprints incrementally; returns each one's aggregates and its
+    changes since the summary under `summary_key`, or None when they are no
+    longer exactly the active sprints of their boards.
+    """
+    gateway = get_jira_gateway()
+    # Fetched again rather than read from the store so a sprint that closed is noticed
+    sprints = await asyncio.gather(*[gateway.sprint(sprint_id) for sprint_id in sprint_ids])
+    boards = {sprint.get("originBoardId") for sprint in sprints}
+    if None in boards:
+        return None
+    listings = await asyncio.gather(*[gateway.sprints(board, state="active") for board in boards])
+    if {sprint["id"] for listing in listings for sprint in listing} != set(sprint_ids):
+        return None
+
+    store = get_snapshot_store()
+    results = await asyncio.gather(*[sync_sprint(sprint) for sprint in sprints])
+    return [
+        {
+            "id": sprint["id"],
+            "name": sprint.get("name"),
+            "state": sprint.get("state"),
+            "aggregates": aggregate(issues),
+            "changes": store.changes(summary_key, sprint["id"]),
+        } for sprint, issues in zip(sprints, results)
+    ]
+
+
+def format_deltas(deltas: List[Dict[str, Any]]) -> tuple[str, str]:
+    """(aggregates, changes) as compact JSON for a prompt."""
+    aggregates = {delta["id"]: {"name": delta["name"], "state": delta["state"], **delta["aggregates"]} for delta in deltas}
+    changes = {delta["id"]: delta["changes"] for delta in deltas if delta["changes"]}
+    return json.dumps(aggregates, default=str), json.dumps(changes, default=str)
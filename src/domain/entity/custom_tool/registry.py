@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, List, Type
+
+from .base import Base
+
+
+PACKAGE_PATH = "src.domain.entity.custom_tool"
+
+
+class Registry:
+    """
+    Index of custom tools by `Base.name()`.
+
+    The custom_tool package is scanned once; lookups and schema payloads are
+    served from memory afterwards so tool dispatch never touches the import
+    machinery.
+    """
+
+    _tools: Dict[str, Type[Base]] | None = None
+    _payloads: Dict[str, Dict[str, dict]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, package_path: str = PACKAGE_PATH) -> Dict[str, Type[Base]]:
+        if cls._tools is not None:
+            return cls._tools
+
+        with cls._lock:
+            if cls._tools is None:
+                # Imported here to avoid a cycle with the package __init__
+                from . import discover_tools
+
+                tools = discover_tools(package_path)
+                cls._payloads = {
+                    name: {
+                        "input_schema": {
+                            "name": name,
+                            "description": tool.description(),
+                            "input_schema": tool.inputSchema(),
+                        },
+                        "parameters": {
+                            "name": name,
+                            "description": tool.description(),
+                            "parameters": tool.inputSchema(),
+                        },
+                    } for name, tool in tools.items()
+                }
+                cls._tools = tools
+        return cls._tools
+
+    @classmethod
+    def get(cls, name: str) -> Type[Base]:
+        tools = cls.load()
+        if name not in tools:
+            raise ValueError(f"Tool '{name}' not found. Available tools: {list(tools.keys())}")
+        return tools[name]
+
+    @classmethod
+    def names(cls) -> List[str]:
+        return list(cls.load().keys())
+
+    @classmethod
+    def payload(cls, name: str, flavor: str) -> dict:
+        """Return the precomputed tool declaration for a model flavor ("input_schema" or "parameters")."""
+        cls.get(name)
+        return cls._payloads[name][flavor]
@@ -1,5 +1,6 @@
-from .get_summary import get_summary
+from .get_summary import get_summary, stream_summary
 
 __all__ = [
   "get_summary",
+  "stream_summary",
 ]
\ No newline at end of file
@@ -1,17 +1,121 @@
-import asyncio
+import time
+from typing import AsyncIterator
 
+from src.config.agent import Route
+from src.config.env import Env
+from src.domain.entity.agent.executor import Executor
 from src.domain.entity.agent.planner import Planner
+from src.domain.entity.custom_tool.jira.sprint_snapshot import format_deltas, sprint_deltas, track_sprints
 from src.config.template import Template
+from src.infrastructure.cache.keys import make_key, normalize_prompt
+from src.infrastructure.cache.store import bypass_cache
+from src.infrastructure.issue_tracking.jira.gateway import get_jira_gateway
+from src.infrastructure.issue_tracking.jira.snapshot_store import get_snapshot_store
+from src.infrastructure.llm.adapter import Adapter
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType, isolated
+from src.infrastructure.telemetry.tracer import span
 
-def get_summary(prompt: str) -> str:
-  planner = Planner(template_path=Template.JIRA_PLAN)
+UPDATE_PROMPT = """You wrote the sprint summary below earlier. Since then the issues under "Changes" were added, changed or removed: "before" is null for issues new to the sprint and "after" is null for issues that left it. "Aggregates" holds the current totals per sprint.
+Rewrite the summary so it describes the current state, keeping its format. Reply with the summary only.
 
-  plan = asyncio.run(planner.call(prompt))
-  
-  response = ""
-  for step in plan.steps:
-    str_step = f"Step {step.id}: {step.description}"
-    print(str_step)
-    response += str_step + "\n"
+## Previous summary
+{summary}
 
-  return response
\ No newline at end of file
+## Aggregates
+{aggregates}
+
+## Changes
+{changes}"""
+
+# A stored summary older than this is written again from scratch instead of updated
+DEFAULT_SUMMARY_MAX_AGE = 24 * 3600
+
+def _summary_key(prompt: str) -> str:
+  return make_key("summary", Template.JIRA_PLAN, normalize_prompt(prompt))
+
+def _remember(prompt: str, sprint_ids: list[int], summary: str):
+  get_snapshot_store().save_summary(_summary_key(prompt), sprint_ids, summary)
+
+async def _stream_update(prompt: str, sprint_ids: list[int], summary: str, deltas: list[dict]) -> AsyncIterator[StreamEvent]:
+  """Bring a previous summary up to date from the sprint changes alone: no planning, no tool calls."""
+  if not any(delta["changes"] for delta in deltas):
+    yield StreamEvent(type=StreamEventType.STATUS, text="No changes since the last summary")
+    yield StreamEvent(type=StreamEventType.DONE, text=summary, response=summary)
+    return
+
+  yield StreamEvent(type=StreamEventType.STATUS, text=f"Updating the summary with {sum(len(delta['changes']) for delta in deltas)} changed issues")
+  aggregates, changes = format_deltas(deltas)
+  agent = Adapter(route=Route.FORMATTING)
+  await agent.open_session()
+  try:
+    async for event in agent.stream_message(
+      UPDATE_PROMPT.format(summary=summary, aggregates=aggregates, changes=changes), {'temperature': 0}
+    ):
+      if event.type == StreamEventType.DONE:
+        _remember(prompt, sprint_ids, event.text)
+        yield StreamEvent(type=StreamEventType.DONE, text=event.text, response=event.text)
+      else:
+        yield event
+  finally:
+    await agent.close_session()
+
+async def _previous_summary(prompt: str) -> tuple[list[int], str, list[dict]] | None:
+  """
+  The last summary for this prompt with the changes of its sprints since
+  then, when Jira can be read directly, the summary is younger than
+  JIRA_SUMMARY_MAX_AGE seconds and its sprints are still the active ones.
+  """
+  if not get_jira_gateway().is_configured():
+    return None
+  previous = get_snapshot_store().summary(_summary_key(prompt))
+  if previous is None:
+    return None
+  sprint_ids, summary, created_at = previous
+  if time.time() - created_at > float(Env["JIRA_SUMMARY_MAX_AGE"] or DEFAULT_SUMMARY_MAX_AGE):
+    return None
+  try:
+    with span("jira.sprint_deltas", sprints=len(sprint_ids)) as current:
+      deltas = await sprint_deltas(_summary_key(prompt), sprint_ids)
+      current.set(sprints_moved=deltas is None)
+  except Exception:
+    # The span records the error; the full pipeline summarizes from scratch instead
+    return None
+  if deltas is None:
+    return None
+  return sprint_ids, summary, deltas
+
+async def get_summary(prompt: str, fresh: bool = False) -> str:
+  output = ""
+  async for event in stream_summary(prompt, fresh=fresh):
+    if event.type == StreamEventType.DONE:
+      output = event.text
+  return output
+
+def stream_summary(prompt: str, fresh: bool = False) -> AsyncIterator[StreamEvent]:
+  """Yield planning and step progress, the final step's text as it streams, then DONE with the summary."""
+  # The cache bypass and sprint tracking are set for the whole run, so keep them out of the caller's context
+  return isolated(_stream_summary(prompt, fresh))
+
+async def _stream_summary(prompt: str, fresh: bool) -> AsyncIterator[StreamEvent]:
+  previous = None if fresh else await _previous_summary(prompt)
+  if previous is not None:
+    async for event in _stream_update(prompt, *previous):
+      yield event
+    return
+
+  planner = Planner(template_path=Template.JIRA_PLAN, domain="jira")
+
+  with bypass_cache(fresh), track_sprints() as sprint_ids:
+    plan = None
+    async for event in planner.stream(prompt):
+      if event.type == StreamEventType.DONE:
+        plan = event.response
+        yield StreamEvent(type=StreamEventType.STATUS, text=f"Planned {len(plan.steps)} steps")
+      elif event.type in (StreamEventType.TOOL_CALL, StreamEventType.TOOL_RESULT):
+        yield event
+
+    async for event in Executor().stream(plan):
+      # Later runs of the same request only send what changed in these sprints
+      if event.type == StreamEventType.DONE and sprint_ids and event.text:
+        _remember(prompt, sorted(sprint_ids), event.text)
+      yield event
@@ -0,0 +1,3 @@
+"""Memoization caches (in-memory LRU, SQLite) for plans, tool results and model responses."""
+
+
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Cache(ABC):
+  """Key/value cache with per-entry TTL. `get` returns None on a miss, so None is never stored."""
+
+  @abstractmethod
+  def get(self, key: str) -> Any | None:
+    pass
+
+  @abstractmethod
+  def set(self, key: str, value: Any, ttl: float | None = None):
+    pass
+
+  @abstractmethod
+  def delete(self, key: str):
+    pass
+
+  @abstractmethod
+  def clear(self):
+    pass
@@ -0,0 +1,22 @@
+import hashlib
+import json
+import re
+from typing import Any
+
+
+def normalize_whitespace(text: str) -> str:
+  return re.sub(r"\s+", " ", text).strip()
+
+
+def normalize_prompt(prompt: str) -> str:
+  return normalize_whitespace(prompt).lower()
+
+
+def canonicalize(value: Any) -> str:
+  """Stable JSON form: sorted keys, no whitespace, unknown objects via str()."""
+  return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+  digest = hashlib.sha256(canonicalize(list(parts)).encode("utf-8")).hexdigest()
+  return f"{namespace}:{digest}"
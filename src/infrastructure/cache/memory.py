@@ -0,0 +1,45 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .base import Cache
+
+
+class MemoryCache(Cache):
+  """In-process LRU cache bounded by entry count."""
+
+  def __init__(self, max_entries: int = 512):
+    self._max_entries = max_entries
+    self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key: str) -> Any | None:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      expires_at, value = entry
+      if expires_at is not None and time.time() > expires_at:
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+      return value
+
+  def set(self, key: str, value: Any, ttl: float | None = None):
+    if value is None:
+      return
+    expires_at = time.time() + ttl if ttl else None
+    with self._lock:
+      self._entries[key] = (expires_at, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+
+  def delete(self, key: str):
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
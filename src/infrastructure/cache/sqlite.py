@@ -0,0 +1,89 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from .base import Cache
+
+
+class SqliteCache(Cache):
+  """
+  On-disk cache that survives restarts. Values are pickled; the least
+  recently read entries are evicted once `max_entries`, or the optional
+  `max_bytes` of pickled values, is exceeded.
+  """
+
+  def __init__(self, path: str, max_entries: int = 2048, max_bytes: int | None = None):
+    self._max_entries = max_entries
+    self._max_bytes = max_bytes
+    self._lock = threading.Lock()
+    directory = os.path.dirname(path)
+    if directory:
+      os.makedirs(directory, exist_ok=True)
+    self._connection = sqlite3.connect(path, check_same_thread=False)
+    self._connection.execute(
+      "CREATE TABLE IF NOT EXISTS cache ("
+      "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+    )
+    self._connection.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+    self._connection.commit()
+
+  def get(self, key: str) -> Any | None:
+    now = time.time()
+    with self._lock:
+      row = self._connection.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+      if row is None:
+        return None
+      value, expires_at = row
+      if expires_at is not None and now > expires_at:
+        self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+        self._connection.commit()
+        return None
+      self._connection.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+      self._connection.commit()
+    try:
+      return pickle.loads(value)
+    except Exception:
+      self.delete(key)
+      return None
+
+  def set(self, key: str, value: Any, ttl: float | None = None):
+    if value is None:
+      return
+    now = time.time()
+    expires_at = now + ttl if ttl else None
+    try:
+      payload = pickle.dumps(value)
+    except Exception as e:
+      print(f"Skipping unpicklable cache value for {key}: {e}")
+      return
+    with self._lock:
+      self._connection.execute(
+        "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+        (key, payload, expires_at, now)
+      )
+      self._connection.execute(
+        "DELETE FROM cache WHERE key IN ("
+        "SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+        (self._max_entries,)
+      )
+      if self._max_bytes:
+        self._connection.execute(
+          "DELETE FROM cache WHERE key IN ("
+          "SELECT key FROM (SELECT key, SUM(LENGTH(value)) OVER (ORDER BY accessed_at DESC, key) AS total FROM cache) "
+          "WHERE total > ?)",
+          (self._max_bytes,)
+        )
+      self._connection.commit()
+
+  def delete(self, key: str):
+    with self._lock:
+      self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+      self._connection.commit()
+
+  def clear(self):
+    with self._lock:
+      self._connection.execute("DELETE FROM cache")
+      self._connection.commit()
@@ -0,0 +1,44 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from src.config.env import Env
+from .base import Cache
+from .memory import MemoryCache
+
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_SQLITE_PATH = ".cache/sentinels.sqlite3"
+
+_CACHE: Cache | None = None
+_LOCK = threading.Lock()
+_BYPASS: ContextVar[bool] = ContextVar("cache_bypass", default=False)
+
+
+def get_cache() -> Cache:
+  """Process-wide cache; CACHE_BACKEND selects "memory" (default) or "sqlite"."""
+  global _CACHE
+  with _LOCK:
+    if _CACHE is None:
+      max_entries = int(Env["CACHE_MAX_ENTRIES"] or DEFAULT_MAX_ENTRIES)
+      if (Env["CACHE_BACKEND"] or "memory") == "sqlite":
+        from .sqlite import SqliteCache
+        _CACHE = SqliteCache(Env["CACHE_SQLITE_PATH"] or DEFAULT_SQLITE_PATH, max_entries=max_entries)
+      else:
+        _CACHE = MemoryCache(max_entries=max_entries)
+    return _CACHE
+
+
+def is_bypassed() -> bool:
+  return _BYPASS.get()
+
+
+@contextmanager
+def bypass_cache(enabled: bool = True) -> Iterator[None]:
+  """Skip cache reads (results are still written) for everything run inside the block."""
+  token = _BYPASS.set(enabled)
+  try:
+    yield
+  finally:
+    _BYPASS.reset(token)
@@ -0,0 +1,162 @@
+import asyncio
+import ssl
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Iterable
+
+import httpx
+
+from src.config.env import Env
+from src.infrastructure.llm.model.shared_client import get_shared_client
+from src.infrastructure.telemetry.tracer import span
+
+
+AGILE_API = "/rest/agile/1.0"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PAGE_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 30.0
+MAX_CONNECTIONS = 10
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+  """Seconds to wait before retrying; Retry-After may be a number of seconds or an HTTP date."""
+  if retry_after:
+    try:
+      return max(float(retry_after), 0.0)
+    except ValueError:
+      pass
+    try:
+      return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+      pass
+  return BACKOFF_SECONDS * 2 ** attempt
+
+
+class JiraGateway:
+  """
+  Direct async access to the Jira REST API, next to the MCP server.
+
+  Uses the same JIRA_URL / JIRA_USERNAME / JIRA_API_TOKEN settings as the
+  mcp-atlassian container (JIRA_PERSONAL_TOKEN for Server/Data Center). One
+  HTTP client per event loop keeps connections alive across calls. Paginated
+  endpoints that report a total fetch their remaining pages concurrently and
+  yield them in order, so callers can process issues as they arrive.
+  """
+
+  def __init__(self, page_size: int = DEFAULT_PAGE_SIZE, page_concurrency: int = DEFAULT_PAGE_CONCURRENCY):
+    self._page_size = page_size
+    self._page_concurrency = page_concurrency
+
+  @staticmethod
+  def is_configured() -> bool:
+    return bool(Env["JIRA_URL"])
+
+  @staticmethod
+  def _create_client() -> httpx.AsyncClient:
+    if Env["JIRA_USERNAME"]:
+      auth, headers = httpx.BasicAuth(Env["JIRA_USERNAME"], Env["JIRA_API_TOKEN"] or ""), {}
+    else:
+      auth, headers = None, {"Authorization": f"Bearer {Env['JIRA_PERSONAL_TOKEN'] or Env['JIRA_API_TOKEN'] or ''}"}
+
+    ca_path = Env["CA_CERTIFICATE_PATH"]
+    return httpx.AsyncClient(
+      base_url=Env["JIRA_URL"].rstrip("/"),
+      auth=auth,
+      headers={"Accept": "application/json", **headers},
+      verify=ssl.create_default_context(cafile=ca_path) if ca_path else True,
+      timeout=float(Env["JIRA_TIMEOUT"] or DEFAULT_TIMEOUT),
+      limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+    )
+
+  @property
+  def _client(self) -> httpx.AsyncClient:
+    return get_shared_client("jira", self._create_client)
+
+  async def _get(self, path: str, params: dict[str, Any]) -> dict:
+    with span("jira.request", path=path, start_at=params.get("startAt", 0)) as current:
+      for attempt in range(MAX_RETRIES + 1):
+        response = await self._client.get(path, params=params)
+        retryable = response.status_code == 429 or response.status_code >= 500
+        if not retryable or attempt == MAX_RETRIES:
+          break
+        await asyncio.sleep(_retry_delay(response.headers.get("Retry-After"), attempt))
+      current.set(status=response.status_code, payload_bytes=len(response.content))
+      response.raise_for_status()
+      return response.json()
+
+  async def _pages(self, path: str, params: dict[str, Any], items_key: str) -> AsyncIterator[list[dict]]:
+    first = await self._get(path, {**params, "startAt": 0, "maxResults": self._page_size})
+    items = first.get(items_key) or []
+    yield items
+
+    # Jira may cap maxResults below what was asked for, so step by what it returned
+    page_size = first.get("maxResults") or len(items)
+    total = first.get("total")
+    if not items or first.get("isLast") or not page_size:
+      return
+
+    if total is None:
+      # Sprint listings only report isLast; walk them one page at a time
+      start, page = len(items), first
+      while not page.get("isLast", True):
+        page = await self._get(path, {**params, "startAt": start, "maxResults": page_size})
+        page_items = page.get(items_key) or []
+        if not page_items:
+          return
+        start += len(page_items)
+        yield page_items
+      return
+
+    semaphore = asyncio.Semaphore(self._page_concurrency)
+
+    async def fetch(start: int) -> list[dict]:
+      async with semaphore:
+        page = await self._get(path, {**params, "startAt": start, "maxResults": page_size})
+        return page.get(items_key) or []
+
+    tasks = [asyncio.create_task(fetch(start)) for start in range(page_size, total, page_size)]
+    try:
+      for task in tasks:
+        yield await task
+    finally:
+      for task in tasks:
+        task.cancel()
+
+  async def _collect(self, path: str, params: dict[str, Any], items_key: str) -> list[dict]:
+    return [item async for page in self._pages(path, params, items_key) for item in page]
+
+  async def boards(self, project_key: str | None = None, name: str | None = None) -> list[dict]:
+    params = {key: value for key, value in (("projectKeyOrId", project_key), ("name", name)) if value}
+    return await self._collect(f"{AGILE_API}/board", params, "values")
+
+  async def sprints(self, board_id: int, state: str | None = None) -> list[dict]:
+    """Sprints of a board; `state` is a comma separated list of future, active and closed."""
+    params = {"state": state} if state else {}
+    return await self._collect(f"{AGILE_API}/board/{board_id}/sprint", params, "values")
+
+  async def sprint(self, sprint_id: int) -> dict:
+    return await self._get(f"{AGILE_API}/sprint/{sprint_id}", {})
+
+  async def iter_sprint_issues(self, sprint_id: int, fields: Iterable[str] | None = None, jql: str | None = None) -> AsyncIterator[dict]:
+    """Yield the issues of a sprint page by page, with only `fields` requested from Jira."""
+    params = {"fields": ",".join(fields)} if fields else {}
+    if jql:
+      params["jql"] = jql
+    async for page in self._pages(f"{AGILE_API}/sprint/{sprint_id}/issue", params, "issues"):
+      for issue in page:
+        yield issue
+
+
+_GATEWAY: JiraGateway | None = None
+
+
+def get_jira_gateway() -> JiraGateway:
+  global _GATEWAY
+  if _GATEWAY is None:
+    _GATEWAY = JiraGateway(
+      page_size=int(Env["JIRA_PAGE_SIZE"] or DEFAULT_PAGE_SIZE),
+      page_concurrency=int(Env["JIRA_PAGE_CONCURRENCY"] or DEFAULT_PAGE_CONCURRENCY),
+    )
+  return _GATEWAY
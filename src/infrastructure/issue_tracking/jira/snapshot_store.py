@@ -0,0 +1,150 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from src.config.env import Env
+
+
+DEFAULT_PATH = ".cache/jira_snapshots.sqlite3"
+
+
+class SnapshotStore:
+  """
+  Last-seen state of every issue of the sprints the bot has looked at.
+
+  Issues are stored as projected records keyed by their `updated` timestamp.
+  Summaries are kept per request key with the sprints they covered and a
+  baseline of every issue as it was when that summary was written, so the
+  changes since a given summary can be listed without asking Jira. Requests
+  that cover the same sprint each keep their own baseline.
+  """
+
+  def __init__(self, path: str):
+    self._lock = threading.Lock()
+    directory = os.path.dirname(path)
+    if directory:
+      os.makedirs(directory, exist_ok=True)
+    self._connection = sqlite3.connect(path, check_same_thread=False)
+    self._connection.executescript(
+      "CREATE TABLE IF NOT EXISTS sprints ("
+      "sprint_id INTEGER PRIMARY KEY, meta TEXT NOT NULL, synced_at REAL, full_synced_at REAL);"
+      "CREATE TABLE IF NOT EXISTS issues ("
+      "sprint_id INTEGER NOT NULL, key TEXT NOT NULL, updated TEXT, data TEXT, "
+      "PRIMARY KEY (sprint_id, key));"
+      "CREATE TABLE IF NOT EXISTS summaries ("
+      "key TEXT PRIMARY KEY, sprint_ids TEXT NOT NULL, summary TEXT NOT NULL, created_at REAL NOT NULL);"
+      "CREATE TABLE IF NOT EXISTS baselines ("
+      "summary_key TEXT NOT NULL, sprint_id INTEGER NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, "
+      "PRIMARY KEY (summary_key, sprint_id, key));"
+    )
+    self._connection.commit()
+
+  def sprint(self, sprint_id: int) -> dict[str, Any] | None:
+    with self._lock:
+      row = self._connection.execute(
+        "SELECT meta, synced_at, full_synced_at FROM sprints WHERE sprint_id = ?", (sprint_id,)
+      ).fetchone()
+    if row is None:
+      return None
+    return {**json.loads(row[0]), "id": sprint_id, "synced_at": row[1], "full_synced_at": row[2]}
+
+  def save_sprint(self, sprint_id: int, meta: dict, synced_at: float | None = None, full_synced_at: float | None = None):
+    """Store sprint metadata; sync times that are not given keep their previous value."""
+    with self._lock:
+      self._connection.execute(
+        "INSERT INTO sprints (sprint_id, meta, synced_at, full_synced_at) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (sprint_id) DO UPDATE SET meta = excluded.meta, "
+        "synced_at = COALESCE(excluded.synced_at, synced_at), "
+        "full_synced_at = COALESCE(excluded.full_synced_at, full_synced_at)",
+        (sprint_id, json.dumps(meta, default=str), synced_at, full_synced_at)
+      )
+      self._connection.commit()
+
+  def upsert_issues(self, sprint_id: int, issues: list[dict]) -> int:
+    """Store issues whose `updated` timestamp moved; returns how many changed."""
+    changed = 0
+    with self._lock:
+      for issue in issues:
+        cursor = self._connection.execute(
+          "INSERT INTO issues (sprint_id, key, updated, data) VALUES (?, ?, ?, ?) "
+          "ON CONFLICT (sprint_id, key) DO UPDATE SET updated = excluded.updated, data = excluded.data "
+          "WHERE issues.data IS NULL OR issues.updated IS NOT excluded.updated",
+          (sprint_id, issue["key"], issue.get("updated"), json.dumps(issue, default=str))
+        )
+        changed += cursor.rowcount
+      self._connection.commit()
+    return changed
+
+  def retain_issues(self, sprint_id: int, keys: set[str]):
+    """After a full fetch, drop issues that are no longer in the sprint; baselines still remember them."""
+    with self._lock:
+      rows = self._connection.execute("SELECT key FROM issues WHERE sprint_id = ?", (sprint_id,)).fetchall()
+      removed = [(sprint_id, key) for (key,) in rows if key not in keys]
+      self._connection.executemany("DELETE FROM issues WHERE sprint_id = ? AND key = ?", removed)
+      self._connection.commit()
+
+  def issues(self, sprint_id: int) -> list[dict]:
+    with self._lock:
+      rows = self._connection.execute(
+        "SELECT data FROM issues WHERE sprint_id = ? AND data IS NOT NULL ORDER BY key", (sprint_id,)
+      ).fetchall()
+    return [json.loads(data) for (data,) in rows]
+
+  def changes(self, summary_key: str, sprint_id: int) -> list[dict]:
+    """Issues added, changed or removed since the summary stored under `summary_key` was written."""
+    with self._lock:
+      rows = self._connection.execute(
+        "SELECT issues.key, baselines.data, issues.data FROM issues LEFT JOIN baselines "
+        "ON baselines.summary_key = ? AND baselines.sprint_id = issues.sprint_id AND baselines.key = issues.key "
+        "WHERE issues.sprint_id = ? AND issues.data IS NOT NULL AND baselines.data IS NOT issues.data "
+        "UNION ALL "
+        "SELECT baselines.key, baselines.data, NULL FROM baselines LEFT JOIN issues "
+        "ON issues.sprint_id = baselines.sprint_id AND issues.key = baselines.key "
+        "WHERE baselines.summary_key = ? AND baselines.sprint_id = ? AND issues.data IS NULL "
+        "ORDER BY 1",
+        (summary_key, sprint_id, summary_key, sprint_id)
+      ).fetchall()
+    return [
+      {
+        "key": key,
+        "before": json.loads(before) if before else None,
+        "after": json.loads(after) if after else None,
+      } for key, before, after in rows
+    ]
+
+  def summary(self, key: str) -> tuple[list[int], str, float] | None:
+    """(sprint ids, summary, creation time) of the summary stored under `key`."""
+    with self._lock:
+      row = self._connection.execute("SELECT sprint_ids, summary, created_at FROM summaries WHERE key = ?", (key,)).fetchone()
+    return (json.loads(row[0]), row[1], row[2]) if row else None
+
+  def save_summary(self, key: str, sprint_ids: list[int], summary: str):
+    """Store a summary and the current state of its sprints as the baseline for its next update."""
+    with self._lock:
+      self._connection.execute(
+        "INSERT OR REPLACE INTO summaries (key, sprint_ids, summary, created_at) VALUES (?, ?, ?, ?)",
+        (key, json.dumps(sorted(sprint_ids)), summary, time.time())
+      )
+      self._connection.execute("DELETE FROM baselines WHERE summary_key = ?", (key,))
+      for sprint_id in sprint_ids:
+        self._connection.execute(
+          "INSERT INTO baselines (summary_key, sprint_id, key, data) "
+          "SELECT ?, sprint_id, key, data FROM issues WHERE sprint_id = ? AND data IS NOT NULL",
+          (key, sprint_id)
+        )
+      self._connection.commit()
+
+
+_STORE: SnapshotStore | None = None
+_LOCK = threading.Lock()
+
+
+def get_snapshot_store() -> SnapshotStore:
+  global _STORE
+  with _LOCK:
+    if _STORE is None:
+      _STORE = SnapshotStore(Env["JIRA_SNAPSHOT_PATH"] or DEFAULT_PATH)
+    return _STORE
@@ -1,31 +1,147 @@
-from src.config.agent import Agent
-from src.infrastructure.llm.model.base import Base
-from src.infrastructure.llm.model.gemini import Gemini
-from src.infrastructure.llm.model.claude import Claude
-from google.genai import types
+from typing import TYPE_CHECKING, Any, AsyncIterator
+from src.config.agent import Agent, Route
+from src.infrastructure.cache.store import is_bypassed
+from src.infrastructure.llm import response_cache
+from src.infrastructure.llm.router import get_router
+from src.infrastructure.llm.stream import StreamEvent
+from src.infrastructure.telemetry.tracer import span
+
+if TYPE_CHECKING:
+  from src.infrastructure.llm.model.base import Base
 
 class Adapter:
-  _agent: Base | None = None
-  
-  def __init__(self, agent: str):
-    self._agent = self._get_agent(agent)
-
-  def _get_agent(self, agent: str) -> Base:
-    if self._agent is not None:
-      return self._agent
+  """
+  Model calls for one conversation. Pinned to `agent` when one is given;
+  otherwise every message goes through the router, which picks the provider
+  for `route` and may hedge it or fail over to another one. Configs are
+  written once and translated by each model's `_parse_config`.
+  """
+
+  def __init__(self, agent: str | None = None, route: str = Route.TOOLS):
+    self._pinned = agent
+    self._route = route
+    self._agents: dict[str, "Base"] = {}
+    self._session: tuple[tuple, dict] | None = None
+    self._agent_name = agent or get_router().candidates(route)[0]
+    self._agent = self._get_agent(self._agent_name)
+
+  def _get_agent(self, agent: str) -> "Base":
+    if agent in self._agents:
+      return self._agents[agent]
     
+    # Provider SDKs are imported on first use so startup only pays for the ones a command needs
     if agent == Agent.GEMINI:
-      return Gemini() 
+      from src.infrastructure.llm.model.gemini import Gemini
+      model = Gemini()
     elif agent == Agent.CLAUDE:
-      return Claude()
+      from src.infrastructure.llm.model.claude import Claude
+      model = Claude()
     else:
       raise ValueError(f"Agent {agent} not supported")
+    self._agents[agent] = model
+    return model
+
+  def _providers(self) -> list[str]:
+    return [self._pinned] if self._pinned else get_router().candidates(self._route)
+
+  async def _use(self, agent: str) -> "Base":
+    """The model for `agent`, with the conversation's MCP session opened on it when there is one."""
+    model = self._get_agent(agent)
+    if self._session is not None and not model.is_session_opened():
+      args, kwargs = self._session
+      await model.open_session(*args, **kwargs)
+    return model
+
+  def _answered(self, agent: str, model: "Base"):
+    self._agent_name, self._agent = agent, model
+
+  def _history_lengths(self) -> dict[str, int]:
+    return {agent: model.history_length for agent, model in self._agents.items()}
+
+  def _rollback_others(self, answered: "Base", lengths: dict[str, int]):
+    """Drop the turns that attempts which were not used, e.g. a hedge that lost, left in their models."""
+    for agent, model in self._agents.items():
+      if model is not answered:
+        model.rollback(lengths.get(agent, 0))
 
-  async def open_session(self):
-    return await self._agent.open_session()
+  async def open_session(self, *args, **kwargs):
+    self._session = (args, kwargs)
+    return await self._agent.open_session(*args, **kwargs)
 
   async def close_session(self):
-    return await self._agent.close_session()
+    self._session = None
+    for model in self._agents.values():
+      await model.close_session()
+
+  async def call_tool(self, name: str, arguments: dict | None = None):
+    return await self._agent.call_tool(name=name, arguments=arguments)
 
   async def send_message(self, message: str, config: dict | None = None) -> str:
-    return await self._agent.send_message(message, config)
\ No newline at end of file
+    lengths = self._history_lengths()
+    agent, model, response = await get_router().call(
+      self._route, self._providers(), lambda agent: self._send_message(agent, message, config)
+    )
+    self._answered(agent, model)
+    self._rollback_others(model, lengths)
+    return response
+
+  async def _send_message(self, agent: str, message: str, config: dict | None) -> tuple[str, "Base", Any]:
+    model = await self._use(agent)
+    length = model.history_length
+    try:
+      with span("llm.send_message", provider=agent, route=self._route) as current:
+        if not response_cache.is_deterministic(config):
+          return agent, model, await model.send_message(message, config)
+
+        key = response_cache.response_key(
+          agent, model.model, config, await model.tool_fingerprint(config), message, model.history_length
+        )
+        cached = None if is_bypassed() else response_cache.get_response(key)
+        current.set(cached=cached is not None)
+        if cached is not None:
+          model.record_exchange(message, cached)
+          return agent, model, cached
+
+        tool_calls = model.tool_calls
+        response = await model.send_message(message, config)
+        # Answers built from tool results depend on live data, not just on the prompt
+        if model.tool_calls == tool_calls:
+          response_cache.store_response(key, response)
+        return agent, model, response
+    except BaseException:
+      # An attempt that failed or lost the race must not leave its turn in the conversation
+      model.rollback(length)
+      raise
+
+  async def stream_message(self, message: str, config: dict | None = None) -> AsyncIterator[StreamEvent]:
+    """Yield text deltas and tool events as they arrive, ending with a DONE event."""
+    lengths = self._history_lengths()
+    async for event in get_router().stream(
+      self._route, self._providers(), lambda agent: self._stream_message(agent, message, config)
+    ):
+      yield event
+    # The stream that was used finishes last, so it is the one answered
+    self._rollback_others(self._agent, lengths)
+
+  async def _stream_message(self, agent: str, message: str, config: dict | None) -> AsyncIterator[StreamEvent]:
+    model = await self._use(agent)
+    length = model.history_length
+    try:
+      with span("llm.stream_message", provider=agent, route=self._route):
+        async for event in model.stream_message(message, config):
+          yield event
+    except BaseException:
+      model.rollback(length)
+      raise
+    self._answered(agent, model)
+
+  def usage(self) -> dict[str, int]:
+    """Token counts over every provider this conversation used, including attempts that lost a race."""
+    usage: dict[str, int] = {}
+    for model in self._agents.values():
+      for field, count in model.usage().items():
+        usage[field] = usage.get(field, 0) + count
+    return usage
+
+  def payload_sizes(self) -> list[int]:
+    return [size for model in self._agents.values() for size in model.payload_sizes()]
\ No newline at end of file
@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+
+from src.config.env import Env
+from src.infrastructure.cache.keys import canonicalize
+
+
+DEFAULT_MAX_TOKENS = 50000
+CHARS_PER_TOKEN = 4
+TRUNCATED_RESULT_CHARS = 2000
+KEEP_RECENT_ITEMS = 2
+SUPERSEDED_RESULT = "[Superseded by a later call with the same arguments]"
+TRUNCATED_SUFFIX = "\n...[truncated to fit the context budget]"
+
+
+def truncate(text: str) -> str:
+  return text[:TRUNCATED_RESULT_CHARS] + TRUNCATED_SUFFIX
+
+
+class History(ABC):
+  """
+  Conversation history for one model session with a token budget.
+
+  Before every round trip `payload()` compacts the history: tool results that
+  a later identical call superseded are replaced by a short marker, then the
+  oldest tool results are truncated until the estimate fits `max_tokens`.
+  The size sent per turn is recorded in `payload_sizes`.
+  """
+
+  def __init__(self, max_tokens: int | None = None):
+    self._items: list[Any] = []
+    self._max_tokens = max_tokens or int(Env["LLM_HISTORY_MAX_TOKENS"] or DEFAULT_MAX_TOKENS)
+    self.payload_sizes: list[int] = []
+
+  def __iter__(self) -> Iterator[Any]:
+    return iter(self._items)
+
+  def __len__(self) -> int:
+    return len(self._items)
+
+  def __delitem__(self, index: int | slice):
+    del self._items[index]
+
+  def append(self, item: Any):
+    self._items.append(item)
+
+  def extend(self, items: list[Any]):
+    self._items.extend(items)
+
+  def clear(self):
+    self._items = []
+    self.payload_sizes = []
+
+  def size(self) -> int:
+    return sum(self._size(item) for item in self._items)
+
+  def estimate_tokens(self) -> int:
+    return self.size() // CHARS_PER_TOKEN
+
+  def payload(self) -> list[Any]:
+    """Compact, record the payload size and return the items to send."""
+    self.compact()
+    self.payload_sizes.append(self.size())
+    return list(self._items)
+
+  def compact(self, max_tokens: int | None = None, keep_recent: int = KEEP_RECENT_ITEMS):
+    """Fit the estimate into `max_tokens`; `keep_recent=0` lets even the latest tool results be truncated."""
+    max_tokens = max_tokens or self._max_tokens
+    self._drop_superseded()
+
+    if self.estimate_tokens() <= max_tokens:
+      return
+
+    for index in range(max(len(self._items) - keep_recent, 0)):
+      for part_index, length in self._results(self._items[index]):
+        if length > TRUNCATED_RESULT_CHARS + len(TRUNCATED_SUFFIX):
+          self._items[index] = self._replace_result(self._items[index], part_index, None)
+      if self.estimate_tokens() <= max_tokens:
+        return
+
+  def _drop_superseded(self):
+    pending: dict[str, list[str]] = {}
+    located: list[tuple[str, int, int]] = []
+
+    for index, item in enumerate(self._items):
+      for call_id, name, arguments in self._calls(item):
+        pending.setdefault(call_id or name, []).append(f"{name}:{canonicalize(arguments)}")
+      for part_index, call_id, name in self._result_refs(item):
+        queue = pending.get(call_id or name)
+        if queue:
+          located.append((queue.pop(0), index, part_index))
+
+    latest = {key: (index, part_index) for key, index, part_index in located}
+    for key, index, part_index in located:
+      if latest[key] != (index, part_index):
+        self._items[index] = self._replace_result(self._items[index], part_index, SUPERSEDED_RESULT)
+
+  def _results(self, item: Any) -> list[tuple[int, int]]:
+    return [(part_index, self._result_length(item, part_index)) for part_index, _, _ in self._result_refs(item)]
+
+  @abstractmethod
+  def _size(self, item: Any) -> int:
+    """Serialized size of an item in bytes."""
+
+  @abstractmethod
+  def _calls(self, item: Any) -> list[tuple[str | None, str, Any]]:
+    """(call id, tool name, arguments) for every tool call in the item."""
+
+  @abstractmethod
+  def _result_refs(self, item: Any) -> list[tuple[int, str | None, str]]:
+    """(part index, call id, tool name) for every tool result in the item."""
+
+  @abstractmethod
+  def _result_length(self, item: Any, part_index: int) -> int:
+    pass
+
+  @abstractmethod
+  def _replace_result(self, item: Any, part_index: int, text: str | None) -> Any:
+    """Return a copy of the item with one tool result replaced by `text`, or truncated when `text` is None."""
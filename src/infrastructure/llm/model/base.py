@@ -1,16 +1,117 @@
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 
-from google.genai import types
-
+from src.domain.entity.custom_tool.registry import Registry
+from src.infrastructure.cache.keys import make_key
+from src.infrastructure.llm.history import History
+from src.infrastructure.llm.stream import StreamEvent
+from src.infrastructure.llm.tokens import TokenBudget, approximate_tokens
 from src.infrastructure.mcp.mcp_mixin import McpMixin
+from src.infrastructure.mcp.tool_cache import get_tool_cache
+from src.infrastructure.telemetry.tracer import set_attributes, span
 
 
 class Base(McpMixin):
+  PROVIDER = ""
+  TOOL_FLAVOR = "input_schema"
+
+  USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+    "cache_hits",
+    "cache_misses",
+  )
+
   def __init__(self):
     super().__init__()
     self._mcp_client = None
+    self._budget = TokenBudget(self.PROVIDER)
+    self._approximate_tokens = 0
+    self.reset_usage()
+
+  def reset_usage(self):
+    self._usage = {field: 0 for field in self.USAGE_FIELDS}
+    self._payload_sizes = []
+
+  def usage(self) -> dict[str, int]:
+    """Token counts accumulated over every round trip since the last `reset_usage`."""
+    return dict(self._usage)
+
+  def payload_sizes(self) -> list[int]:
+    """Bytes of conversation history sent on each round trip since the last `reset_usage`."""
+    return list(self._payload_sizes)
+
+  def _payload(self, history: History) -> list:
+    items = history.payload()
+    self._payload_sizes.append(history.payload_sizes[-1])
+    set_attributes(payload_bytes=history.payload_sizes[-1])
+    return items
+
+  async def _prepare(self, history: History, fixed_tokens: int, config: Any = None, cap: int | None = None) -> tuple[list, int]:
+    """
+    Fit the history into the context window next to `fixed_tokens` of system
+    prompt and tool schemas; returns the payload and the max_tokens to ask for.
+    """
+    history.compact()
+    approximate = fixed_tokens + history.estimate_tokens()
+    input_tokens = self._budget.scale(approximate)
+    if self._budget.needs_exact_count(input_tokens):
+      try:
+        input_tokens = await self._count_tokens(list(history), config, fixed_tokens)
+      except Exception as e:
+        print(f"Failed to count tokens with {self.PROVIDER}, using the estimate: {e}")
+
+    if input_tokens > self._budget.input_budget:
+      # Work in the units History budgets in, corrected by how the estimate compared to the real count
+      ratio = input_tokens / max(approximate, 1)
+      history.compact(max(int(self._budget.input_budget / ratio) - fixed_tokens, 1), keep_recent=0)
+      approximate = fixed_tokens + history.estimate_tokens()
+      input_tokens = int(approximate * ratio)
+      if input_tokens > self._budget.input_budget:
+        print(f"Prompt of about {input_tokens} tokens still exceeds the {self._budget.context_window} token context of {self._model}")
+
+    self._approximate_tokens = approximate
+    max_tokens = self._budget.max_tokens(input_tokens, cap)
+    set_attributes(estimated_input_tokens=input_tokens, max_tokens=max_tokens)
+    return self._payload(history), max_tokens
+
+  async def _count_tokens(self, items: list, config: Any, fixed_tokens: int) -> int:
+    """Exact prompt size from the provider, used when the estimate is close to the budget."""
+    return self._budget.scale(fixed_tokens + sum(approximate_tokens(item) for item in items))
+
+  def _observe_prompt_tokens(self, prompt_tokens: int | None):
+    self._budget.observe(self._approximate_tokens, prompt_tokens)
+
+  def _round_trip_span(self):
+    return span("llm.round_trip", provider=self.PROVIDER, model=self._model)
+
+  def _record_usage(self, input_tokens: int = 0, output_tokens: int = 0, cache_read_input_tokens: int = 0, cache_creation_input_tokens: int = 0):
+    set_attributes(
+      input_tokens=input_tokens,
+      output_tokens=output_tokens,
+      cache_read_input_tokens=cache_read_input_tokens,
+      cache_creation_input_tokens=cache_creation_input_tokens,
+    )
+    self._usage["input_tokens"] += input_tokens or 0
+    self._usage["output_tokens"] += output_tokens or 0
+    self._usage["cache_read_input_tokens"] += cache_read_input_tokens or 0
+    self._usage["cache_creation_input_tokens"] += cache_creation_input_tokens or 0
+    if cache_read_input_tokens:
+      self._usage["cache_hits"] += 1
+    elif cache_creation_input_tokens:
+      self._usage["cache_misses"] += 1
 
   async def _get_converted_mcp_tools(self, config: dict | None = None) -> list[dict]:
+    if not self.is_session_opened():
+      return []
+
+    return await get_tool_cache().get_or_build(
+      self._mcp_provider, self.TOOL_FLAVOR, self._convert_mcp_tools
+    )
+
+  async def _convert_mcp_tools(self) -> list[dict]:
     return [{
       "name": tool.name,
       "description": tool.description,
@@ -23,23 +124,48 @@ class Base(McpMixin):
       
     tools = config["custom_tools"]
 
-    return [
-      {
-        "name": tool.name(),
-        "description": tool.description(),
-        "parameters": tool.inputSchema()
-      } for tool in tools
-    ]
+    return [Registry.payload(tool.name(), self.TOOL_FLAVOR) for tool in tools]
   
+  @property
+  def model(self) -> str:
+    return self._model
+
+  @property
+  def history_length(self) -> int:
+    """Turns already in the conversation before the next message."""
+    return len(self._history)
+
+  def rollback(self, length: int):
+    """Drop what was added to the history after it held `length` turns."""
+    del self._history[length:]
+
+  async def tool_fingerprint(self, config: dict | None = None) -> str:
+    """Hash of the tool declarations a config would send, so cached responses follow tool catalog changes."""
+    if not config or not config.get("use_tools"):
+      return ""
+    return make_key(
+      "tools", await self._get_converted_mcp_tools(config), await self._get_converted_custom_tools(config)
+    )
+
   @abstractmethod
   async def send_message(self, prompt: str, config: dict | None = None):
     pass
 
+  def record_exchange(self, prompt: str, response: Any):
+    """Add a prompt and its cached response to the history, as `send_message` would have."""
+    pass
+
+  @abstractmethod
+  def stream_message(self, prompt: str, config: dict | None = None) -> AsyncIterator[StreamEvent]:
+    pass
+
   async def available_tools(self) -> list[dict]:
     if not self.is_session_opened():
       return []
     
-    tools = await self._mcp_client.list_tools()
+    tools = await get_tool_cache().get_or_build(
+      self._mcp_provider, "list_tools", self._mcp_client.list_tools
+    )
 
     return tools
 
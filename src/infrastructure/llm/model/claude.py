@@ -1,15 +1,80 @@
 import asyncio
-from anthropic import Anthropic
+import json
+import re
+from typing import Any, AsyncIterator
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from anthropic.types import ToolResultBlockParam, ToolUseBlock, TextBlock, Message
 from src.config.env import Env
+from src.infrastructure.llm.history import History, truncate
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
+from src.infrastructure.llm.tokens import approximate_tokens, jsonable
 from .base import Base
+from .shared_client import get_shared_client
+
+
+# Anthropic only accepts these characters in tool names; custom tools are named "custom_tool.<name>"
+INVALID_TOOL_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+MAX_TOOL_NAME_LENGTH = 128
+
+
+class ClaudeHistory(History):
+  def _size(self, item: dict) -> int:
+    return len(json.dumps(item, default=jsonable))
+
+  def _calls(self, item: dict) -> list[tuple[str | None, str, Any]]:
+    return [
+      (block.id, block.name, block.input)
+      for block in item["content"] if getattr(block, "type", None) == "tool_use"
+    ]
+
+  def _result_refs(self, item: dict) -> list[tuple[int, str | None, str]]:
+    return [
+      (index, block["tool_use_id"], "")
+      for index, block in enumerate(item["content"]) if isinstance(block, dict) and block.get("type") == "tool_result"
+    ]
+
+  def _result_length(self, item: dict, part_index: int) -> int:
+    return len(json.dumps(item["content"][part_index].get("content"), default=jsonable))
+
+  def _replace_result(self, item: dict, part_index: int, text: str | None) -> dict:
+    block = item["content"][part_index]
+    if text is None:
+      text = truncate(json.dumps(block.get("content"), default=jsonable))
+
+    content = list(item["content"])
+    content[part_index] = {**block, "content": text}
+    return {**item, "content": content}
+
 
 class Claude(Base):
+  PROVIDER = "claude"
   STOP_REASON = ['end_turn', 'stop_sequence', 'max_tokens']
+  MAX_CONNECTIONS = 20
+  CACHE_CONTROL = {"type": "ephemeral"}
+  STRUCTURED_OUTPUT_PROMPT = "Reply with only a JSON object, without code fences, that matches this JSON schema:\n{schema}"
+
   def __init__(self, model: str = "claude-3-5-haiku-20241022"):
     super().__init__()
     self._model = model
-    self._client = Anthropic(api_key=Env["ANTHROPIC_API_KEY"])
+    # Names sent to Anthropic -> the names the tools are called by
+    self._tool_names: dict[str, str] = {}
+
+  @classmethod
+  def _create_client(cls) -> AsyncAnthropic:
+    return AsyncAnthropic(
+      api_key=Env["ANTHROPIC_API_KEY"],
+      http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+          max_connections=cls.MAX_CONNECTIONS,
+          max_keepalive_connections=cls.MAX_CONNECTIONS
+        )
+      )
+    )
+
+  @property
+  def _client(self) -> AsyncAnthropic:
+    return get_shared_client("anthropic", self._create_client)
 
   async def _parse_config(self, config: dict | None) -> dict | None:
     if config is None:
@@ -17,18 +82,30 @@ class Claude(Base):
     
     claude_config = config.copy()
 
-    if "system_instruction" in claude_config:
+    # Claude has no response schema parameter, so a schema becomes part of the system prompt
+    system = [claude_config.pop("system_instruction", None)]
+    claude_config.pop("response_mime_type", None)
+    schema = claude_config.pop("response_schema", None)
+    if schema is not None:
+      schema = schema.model_json_schema() if hasattr(schema, "model_json_schema") else schema
+      system.append(Claude.STRUCTURED_OUTPUT_PROMPT.format(schema=json.dumps(schema)))
+
+    if any(system):
       claude_config["system"] = [
         {
           "type": "text",
-          "text": config["system_instruction"],
+          "text": "\n\n".join(text for text in system if text),
+          "cache_control": Claude.CACHE_CONTROL,
         }
       ]
-      del claude_config["system_instruction"]
     
     if "use_tools" in claude_config:
       if claude_config["use_tools"] == True:
-        claude_config["tools"] = await self._get_converted_mcp_tools(config) + await self._get_converted_custom_tools(config)
+        tools = [self._sendable_tool(tool) for tool in await self._get_converted_mcp_tools(config) + await self._get_converted_custom_tools(config)]
+        if tools:
+          # Breakpoint on the last tool caches the whole tool list; copy so the shared catalog stays untouched
+          tools[-1] = {**tools[-1], "cache_control": Claude.CACHE_CONTROL}
+        claude_config["tools"] = tools
         del claude_config["use_tools"]
 
     if "custom_tools" in claude_config:
@@ -41,13 +118,16 @@ class Claude(Base):
       raise Exception("Conversation not opened")
 
     claude_config = await self._parse_config(config)
+    max_tokens_cap = claude_config.pop("max_tokens", None)
+    fixed_tokens = self._fixed_tokens(claude_config)
     
-    messages = [
+    messages = ClaudeHistory()
+    messages.append(
       {
         "role": "user",
         "content": [TextBlock(text=prompt, type="text")]
       }
-    ]
+    )
 
     final_responses = []
     response = None
@@ -57,12 +137,15 @@ class Claude(Base):
       if stop_reason in Claude.STOP_REASON:
         break
 
-      response = self._client.messages.create(
-        model=self._model,
-        messages=messages,
-        max_tokens=1000,
-        **claude_config
-      )
+      with self._round_trip_span():
+        payload, max_tokens = await self._prepare(messages, fixed_tokens, claude_config, max_tokens_cap)
+        response = await self._client.messages.create(
+          model=self._model,
+          messages=payload,
+          max_tokens=max_tokens,
+          **claude_config
+        )
+        self._record_response_usage(response)
 
       stop_reason = response.stop_reason
 
@@ -75,7 +158,106 @@ class Claude(Base):
       
       messages.extend(self._merge_messages(t_messages))
 
-    return "\n".join(final_responses)    
+    return self._final_text(final_responses, config)
+
+  async def stream_message(self, prompt: str, config: dict | None = None) -> AsyncIterator[StreamEvent]:
+    if not self.is_session_opened():
+      raise Exception("Conversation not opened")
+
+    claude_config = await self._parse_config(config)
+    max_tokens_cap = claude_config.pop("max_tokens", None)
+    fixed_tokens = self._fixed_tokens(claude_config)
+
+    messages = ClaudeHistory()
+    messages.append(
+      {
+        "role": "user",
+        "content": [TextBlock(text=prompt, type="text")]
+      }
+    )
+
+    final_responses = []
+    stop_reason = None
+
+    while stop_reason not in Claude.STOP_REASON:
+      with self._round_trip_span():
+        payload, max_tokens = await self._prepare(messages, fixed_tokens, claude_config, max_tokens_cap)
+        async with self._client.messages.stream(
+          model=self._model,
+          messages=payload,
+          max_tokens=max_tokens,
+          **claude_config
+        ) as stream:
+          async for text in stream.text_stream:
+            yield StreamEvent(type=StreamEventType.TEXT, text=text)
+          response = await stream.get_final_message()
+        self._record_response_usage(response)
+
+      stop_reason = response.stop_reason
+
+      tool_uses = [content for content in response.content if content.type == 'tool_use']
+      for content in tool_uses:
+        yield StreamEvent(type=StreamEventType.TOOL_CALL, tool_name=self._tool_name(content.name), arguments=content.input)
+
+      result = await self._handle_response(response)
+
+      for content in tool_uses:
+        yield StreamEvent(type=StreamEventType.TOOL_RESULT, tool_name=self._tool_name(content.name))
+
+      t_messages = []
+      for item in result:
+        t_messages.extend(item["messages"])
+        final_responses.extend(item["responses"])
+
+      messages.extend(self._merge_messages(t_messages))
+
+    final_text = self._final_text(final_responses, config)
+    yield StreamEvent(type=StreamEventType.DONE, text=final_text, response=final_text)
+
+  def _final_text(self, responses: list[str], config: dict | None) -> str:
+    text = "\n".join(responses)
+    if config is not None and config.get("response_schema") is not None:
+      # Asked for bare JSON, but a fenced block still comes back now and then
+      text = text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    return text
+
+  def _fixed_tokens(self, claude_config: dict) -> int:
+    return approximate_tokens([claude_config.get("system"), claude_config.get("tools")])
+
+  async def _count_tokens(self, items: list, config: dict, fixed_tokens: int) -> int:
+    response = await self._client.messages.count_tokens(
+      model=self._model,
+      messages=items,
+      **{key: config[key] for key in ("system", "tools", "tool_choice") if key in config}
+    )
+    return response.input_tokens
+
+  def _record_response_usage(self, response: Message):
+    if response.usage is None:
+      return
+    # input_tokens leaves out the cached part of the prompt
+    self._observe_prompt_tokens(
+      response.usage.input_tokens
+      + (response.usage.cache_read_input_tokens or 0)
+      + (response.usage.cache_creation_input_tokens or 0)
+    )
+    self._record_usage(
+      input_tokens=response.usage.input_tokens,
+      output_tokens=response.usage.output_tokens,
+      cache_read_input_tokens=response.usage.cache_read_input_tokens,
+      cache_creation_input_tokens=response.usage.cache_creation_input_tokens,
+    )
+
+  def _sendable_tool(self, tool: dict) -> dict:
+    name = INVALID_TOOL_NAME_CHARS.sub("_", tool["name"])[:MAX_TOOL_NAME_LENGTH]
+    if name == tool["name"]:
+      return tool
+    self._tool_names[name] = tool["name"]
+    # Copied so the shared catalog keeps the real name
+    return {**tool, "name": name}
+
+  def _tool_name(self, name: str) -> str:
+    return self._tool_names.get(name, name)
 
   async def _handle_response(self, response: Message | None):
     if response is None or response.content is None:
@@ -83,18 +265,19 @@ class Claude(Base):
     
     result = []
 
+    tool_uses = [content for content in response.content if content.type == 'tool_use']
+    tool_results = iter(await self.call_tools([(self._tool_name(content.name), content.input) for content in tool_uses]))
+
     for content in response.content:
       if content.type == 'tool_use':
-        result.append(await self._handle_tool_use(content))
+        result.append(self._handle_tool_use(content, next(tool_results)))
       elif content.type == 'text':
         result.append(self._handle_text(content))
 
 
     return result
 
-  async def _handle_tool_use(self, content: ToolUseBlock):
-    tool_result = await self.call_tool(name=content.name, arguments=content.input)
-  
+  def _handle_tool_use(self, content: ToolUseBlock, tool_result):
     return {
         "messages": [
           {
@@ -113,7 +296,7 @@ class Claude(Base):
             ]
           }
         ],
-        "responses": [f"Call {content.name} with args {content.input}: {tool_result.content}"]
+        "responses": [f"Call {self._tool_name(content.name)} with args {content.input}: {tool_result.content}"]
       }
 
   def _handle_text(self, content: TextBlock):
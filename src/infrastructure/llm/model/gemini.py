@@ -1,18 +1,69 @@
 import json
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from google import genai
 from google.genai import types
 
 from src.config.env import Env
+from src.infrastructure.llm.history import History, truncate
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
+from src.infrastructure.llm.tokens import approximate_tokens
+from src.infrastructure.mcp.tool_cache import get_tool_cache
 from .base import Base
+from .shared_client import get_shared_client
+
+
+class GeminiHistory(History):
+  def _size(self, item: types.Content) -> int:
+    return len(item.model_dump_json(exclude_none=True))
+
+  def _calls(self, item: types.Content) -> list[tuple[str | None, str, Any]]:
+    return [
+      (part.function_call.id, part.function_call.name, part.function_call.args)
+      for part in item.parts or [] if part.function_call is not None
+    ]
+
+  def _result_refs(self, item: types.Content) -> list[tuple[int, str | None, str]]:
+    return [
+      (index, part.function_response.id, part.function_response.name)
+      for index, part in enumerate(item.parts or []) if part.function_response is not None
+    ]
+
+  def _result_length(self, item: types.Content, part_index: int) -> int:
+    return len(json.dumps(item.parts[part_index].function_response.response, default=str))
+
+  def _replace_result(self, item: types.Content, part_index: int, text: str | None) -> types.Content:
+    function_response = item.parts[part_index].function_response
+    if text is None:
+      text = truncate(json.dumps(function_response.response, default=str))
+
+    parts = list(item.parts)
+    parts[part_index] = types.Part(
+      function_response=types.FunctionResponse(
+        id=function_response.id,
+        name=function_response.name,
+        response={"result": text}
+      )
+    )
+    return item.model_copy(update={"parts": parts})
 
 
 class Gemini(Base):
+  PROVIDER = "gemini"
+  TOOL_FLAVOR = "parameters"
+
   def __init__(self, model: str = "gemini-2.5-flash"):
     super().__init__()
     self._model = model
-    self._client = genai.Client(api_key=Env["GEMINI_API_TOKEN"])
     self._conversation: Optional[types.ChatMessage] = None
+    self._history = GeminiHistory()
+
+  @classmethod
+  def _create_client(cls) -> genai.client.AsyncClient:
+    return genai.Client(api_key=Env["GEMINI_API_TOKEN"]).aio
+
+  @property
+  def _client(self) -> genai.client.AsyncClient:
+    return get_shared_client("gemini", self._create_client)
 
   def _clean_schema(self, schema: dict) -> dict:
     """Clean MCP tool schema to be compatible with Gemini API"""
@@ -40,7 +91,7 @@ class Gemini(Base):
 
     return cleaned
       
-  async def _get_converted_mcp_tools(self, config: dict | None = None) -> list[dict]:
+  async def _convert_mcp_tools(self) -> list[dict]:
     tools = await self.available_tools()
 
     return [
@@ -51,6 +102,23 @@ class Gemini(Base):
       } for tool in tools
     ]
 
+  async def _get_tool_payload(self, config: dict) -> list[types.Tool]:
+    """Build (or reuse) the `types.Tool` list for the MCP session plus the requested custom tools."""
+    async def build():
+      return [
+        types.Tool(
+          function_declarations=(
+            await self._get_converted_mcp_tools(config) + await self._get_converted_custom_tools(config)
+          )
+        )
+      ]
+
+    if not self.is_session_opened():
+      return await build()
+
+    custom_tools = ",".join(tool.name() for tool in config.get("custom_tools", []))
+    return await get_tool_cache().get_or_build(self._mcp_provider, f"tool:{custom_tools}", build)
+
   async def _parse_config(self, config: dict | None) -> dict | None:
     if config is None:
       return None
@@ -60,18 +128,15 @@ class Gemini(Base):
     
     if "use_tools" in gemini_config:
       if gemini_config["use_tools"] == True:
-        gemini_config["tools"] = [
-          types.Tool(
-            function_declarations=(
-              await self._get_converted_mcp_tools(config) + await self._get_converted_custom_tools(config)
-            )
-          )
-        ]
+        gemini_config["tools"] = await self._get_tool_payload(config)
       del gemini_config["use_tools"]
       
     if "custom_tools" in gemini_config:
       del gemini_config["custom_tools"]
 
+    if "max_tokens" in gemini_config:
+      gemini_config["max_output_tokens"] = gemini_config.pop("max_tokens")
+
     return types.GenerateContentConfig(**gemini_config)
   
   async def send_message(self, prompt: str, config: dict | None = None) -> types.GenerateContentResponse:
@@ -79,6 +144,7 @@ class Gemini(Base):
       raise Exception("Conversation not opened")
 
     gemini_config = await self._parse_config(config)
+    fixed_tokens = self._fixed_tokens(gemini_config)
 
     self._history.append(
       types.Content(
@@ -96,11 +162,14 @@ class Gemini(Base):
       if stop_reason is not None and not has_function_calls:
         break
 
-      response = self._client.models.generate_content(
-        model=self._model,
-        contents=self._history,
-        config=gemini_config
-      )
+      with self._round_trip_span():
+        contents, round_config = await self._prepare_round(gemini_config, fixed_tokens)
+        response = await self._client.models.generate_content(
+          model=self._model,
+          contents=contents,
+          config=round_config
+        )
+        self._record_response_usage(response)
 
       final_response = response
 
@@ -121,28 +190,144 @@ class Gemini(Base):
       )
     
     return final_response
+
+  def record_exchange(self, prompt: str, response: types.GenerateContentResponse):
+    self._history.append(
+      types.Content(
+        role="user",
+        parts=[types.Part(text=prompt)]
+      )
+    )
+    # Only answers without tool calls are cached, so the final candidate's text is the whole turn
+    content = response.candidates[0].content if response.candidates else None
+    parts = [part for part in (content.parts or []) if part.text is not None] if content else []
+    if parts:
+      self._history.append(types.Content(role="model", parts=parts))
+
+  async def stream_message(self, prompt: str, config: dict | None = None) -> AsyncIterator[StreamEvent]:
+    if not self.is_session_opened():
+      raise Exception("Conversation not opened")
+
+    gemini_config = await self._parse_config(config)
+    fixed_tokens = self._fixed_tokens(gemini_config)
+
+    self._history.append(
+      types.Content(
+        role="user",
+        parts=[types.Part(text=prompt)]
+      )
+    )
+
+    final_text = ""
+    final_response = None
+    has_function_calls = True
+
+    while has_function_calls:
+      parts = []
+      turn_text = ""
+      last_chunk = None
+
+      with self._round_trip_span():
+        contents, round_config = await self._prepare_round(gemini_config, fixed_tokens)
+        async for chunk in await self._client.models.generate_content_stream(
+          model=self._model,
+          contents=contents,
+          config=round_config
+        ):
+          last_chunk = chunk
+          if not chunk.candidates or chunk.candidates[0].content is None:
+            continue
+          for part in chunk.candidates[0].content.parts or []:
+            parts.append(part)
+            if part.text and not part.thought:
+              turn_text += part.text
+              yield StreamEvent(type=StreamEventType.TEXT, text=part.text)
+        if last_chunk is not None:
+          self._record_response_usage(last_chunk)
+
+      if turn_text:
+        final_text = turn_text
+      if last_chunk is not None:
+        final_response = last_chunk
+
+      candidate = types.Candidate(content=types.Content(role="model", parts=parts))
+      function_calls = [part.function_call for part in parts if part.function_call is not None]
+      for function_call in function_calls:
+        yield StreamEvent(type=StreamEventType.TOOL_CALL, tool_name=function_call.name, arguments=function_call.args)
+
+      result, has_function_calls = await self._handle_response(candidate)
+
+      for function_call in function_calls:
+        yield StreamEvent(type=StreamEventType.TOOL_RESULT, tool_name=function_call.name)
+
+      t_messages = []
+      for item in result:
+        t_messages.extend(item["messages"])
+
+      self._history.extend(
+        self._make_messages(
+          self._merge_messages(t_messages)
+        )
+      )
+
+    yield StreamEvent(type=StreamEventType.DONE, text=final_text, response=final_response)
   
-  async def _handle_response(self, candidate: types.Candidate) -> list[dict]:
+  def _fixed_tokens(self, gemini_config: types.GenerateContentConfig | None) -> int:
+    if gemini_config is None:
+      return 0
+    return approximate_tokens([gemini_config.system_instruction, gemini_config.tools])
+
+  async def _prepare_round(self, gemini_config: types.GenerateContentConfig | None, fixed_tokens: int) -> tuple[list, types.GenerateContentConfig]:
+    gemini_config = gemini_config or types.GenerateContentConfig()
+    contents, max_tokens = await self._prepare(self._history, fixed_tokens, gemini_config, gemini_config.max_output_tokens)
+    return contents, gemini_config.model_copy(update={"max_output_tokens": max_tokens})
+
+  async def _count_tokens(self, items: list, config: types.GenerateContentConfig, fixed_tokens: int) -> int:
+    # The Gemini API counts contents only; system instruction and tools stay estimated
+    response = await self._client.models.count_tokens(model=self._model, contents=items)
+    return response.total_tokens + self._budget.scale(fixed_tokens)
+
+  def _record_response_usage(self, response: types.GenerateContentResponse):
+    usage = response.usage_metadata
+    if usage is None:
+      return
+    self._observe_prompt_tokens(usage.prompt_token_count)
+    # Gemini reports implicit/explicit cache reads only; there is no separate cache write count
+    self._record_usage(
+      input_tokens=usage.prompt_token_count,
+      output_tokens=usage.candidates_token_count,
+      cache_read_input_tokens=usage.cached_content_token_count,
+    )
+
+  async def _handle_response(self, candidate: types.Candidate) -> tuple[list[dict], bool]:
     if candidate.content is None:
-      return []
+      return [], False
     
     result = []
-    has_function_calls = False
+    function_calls = [part for part in candidate.content.parts if part.function_call is not None]
+    has_function_calls = len(function_calls) > 0
+    tool_results = iter(await self.call_tools([
+      (part.function_call.name, part.function_call.args) for part in function_calls
+    ]))
     
     for part in candidate.content.parts:
       if part.function_call is not None:
-        has_function_calls = True
-        result.append(await self._handle_tool_use(part))
+        result.append(self._handle_tool_use(part, next(tool_results)))
       elif part.text is not None:
         result.append(self._handle_text(part))
 
     return result, has_function_calls
 
-  async def _handle_tool_use(self, part: types.Part):
-    tool_result = await self.call_tool(name=part.function_call.name, arguments=part.function_call.args)
+  def _handle_tool_use(self, part: types.Part, tool_result):
+    if tool_result.is_error:
+      content = {"error": tool_result.content[0].text}
+    else:
+      try:
+        content = json.loads(tool_result.content[0].text)
+      except json.JSONDecodeError:
+        # Plain-text output is passed on as it is
+        content = {"result": tool_result.content[0].text}
 
-    content = json.loads(tool_result.content[0].text)
-  
     if type(content) == list:
       response = content[0]
     else:
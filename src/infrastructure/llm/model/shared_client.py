@@ -0,0 +1,23 @@
+import asyncio
+import threading
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+
+_CLIENTS: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]] = WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+
+def get_shared_client(key: str, factory: Callable[[], Any]) -> Any:
+  """
+  Return the SDK client registered under `key` for the running event loop.
+
+  Async HTTP connection pools are bound to the loop they were first used on,
+  so clients are shared by every model instance on the same loop.
+  """
+  loop = asyncio.get_running_loop()
+  with _LOCK:
+    clients = _CLIENTS.setdefault(loop, {})
+    if key not in clients:
+      clients[key] = factory()
+    return clients[key]
@@ -0,0 +1,68 @@
+import threading
+from typing import Any
+
+from src.config.cache import CacheTtl
+from src.config.env import Env
+from src.infrastructure.cache.base import Cache
+from src.infrastructure.cache.keys import make_key, normalize_whitespace
+from src.infrastructure.cache.memory import MemoryCache
+
+
+DEFAULT_BACKEND = "sqlite"
+DEFAULT_PATH = ".cache/llm_responses.sqlite3"
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_CACHE: Cache | None = None
+_LOCK = threading.Lock()
+
+
+def get_response_cache() -> Cache:
+  """
+  Store for model responses, separate from the plan/tool cache so it can
+  persist on disk by default. LLM_CACHE_BACKEND selects "sqlite" (default)
+  or "memory"; LLM_CACHE_MAX_ENTRIES and LLM_CACHE_MAX_BYTES bound it.
+  """
+  global _CACHE
+  with _LOCK:
+    if _CACHE is None:
+      max_entries = int(Env["LLM_CACHE_MAX_ENTRIES"] or DEFAULT_MAX_ENTRIES)
+      if (Env["LLM_CACHE_BACKEND"] or DEFAULT_BACKEND) == "sqlite":
+        from src.infrastructure.cache.sqlite import SqliteCache
+        _CACHE = SqliteCache(
+          Env["LLM_CACHE_PATH"] or DEFAULT_PATH,
+          max_entries=max_entries,
+          max_bytes=int(Env["LLM_CACHE_MAX_BYTES"] or DEFAULT_MAX_BYTES),
+        )
+      else:
+        _CACHE = MemoryCache(max_entries=max_entries)
+    return _CACHE
+
+
+def is_deterministic(config: dict | None) -> bool:
+  return config is not None and config.get("temperature") == 0
+
+
+def _normalize_config(config: dict) -> dict[str, Any]:
+  normalized = {}
+  for key, value in config.items():
+    if key == "custom_tools":
+      value = sorted(tool.name() for tool in value)
+    elif key == "response_schema" and hasattr(value, "model_json_schema"):
+      value = value.model_json_schema()
+    normalized[key] = value
+  return normalized
+
+
+def response_key(agent: str, model: str, config: dict, tools: str, prompt: str, history_length: int = 0) -> str:
+  # Case is kept: step prompts carry issue keys, statuses and names from upstream data.
+  # A hit skips appending to the conversation, so its length is part of the key too
+  return make_key("llm", agent, model, _normalize_config(config), tools, normalize_whitespace(prompt), history_length)
+
+
+def get_response(key: str) -> Any | None:
+  return get_response_cache().get(key)
+
+
+def store_response(key: str, response: Any):
+  get_response_cache().set(key, response, CacheTtl.LLM_RESPONSE)
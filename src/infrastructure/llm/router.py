@@ -0,0 +1,245 @@
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from src.config.agent import Agent, Route
+from src.config.env import Env
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
+from src.infrastructure.telemetry.tracer import set_attributes
+
+
+DEFAULT_PROVIDERS = f"{Agent.GEMINI},{Agent.CLAUDE}"
+CREDENTIALS = {Agent.GEMINI: "GEMINI_API_TOKEN", Agent.CLAUDE: "ANTHROPIC_API_KEY"}
+# Tool steps are not hedged by default: a tool loop routinely outlasts any deadline, and a hedge
+# repeats every MCP call and model turn on a second session
+DEFAULT_HEDGE_SECONDS = {Route.PLANNING: 10, Route.TOOLS: 0, Route.FORMATTING: 10}
+DEFAULT_COOLDOWN_SECONDS = 30
+THROTTLED_STATUSES = {429, 503, 529}
+SMOOTHING = 0.2
+MAX_ERROR_RATE = 0.5
+STALE_SECONDS = 300
+
+
+def _status(error: BaseException) -> int | None:
+  # Anthropic errors carry status_code, google-genai errors carry code
+  status = getattr(error, "status_code", None) or getattr(error, "code", None)
+  return status if isinstance(status, int) else None
+
+
+class _Attempt:
+  """One provider's stream, pumped by its own task so it can be raced against a hedge."""
+
+  def __init__(self, provider: str, source: AsyncIterator[StreamEvent]):
+    self.provider = provider
+    self.started = time.monotonic()
+    self.events: asyncio.Queue = asyncio.Queue()
+    self.ready = asyncio.get_running_loop().create_future()
+    self.task = asyncio.create_task(self._pump(source))
+
+  def _put(self, item: StreamEvent | Exception | None):
+    self.events.put_nowait(item)
+    if not self.ready.done():
+      self.ready.set_result(None)
+
+  async def _pump(self, source: AsyncIterator[StreamEvent]):
+    try:
+      async for event in source:
+        self._put(event)
+      self._put(None)
+    except Exception as e:
+      self._put(e)
+
+  def elapsed(self) -> float:
+    return time.monotonic() - self.started
+
+
+class Router:
+  """
+  Picks the provider for each model request and moves off one that is slow or failing.
+
+  Latency is smoothed per provider and request class (`Route`), since a
+  planning call and a tool loop take very different times; errors are
+  smoothed per provider, and a 429/503 benches the provider for a cooldown.
+  Healthy providers are tried fastest first, and one without recent figures
+  is tried as soon as its turn comes so it gets measured again. A request
+  still waiting on its provider after the route's hedge deadline is raced
+  against the next one, and a failure before any text has been streamed
+  falls over to the next provider.
+  """
+
+  def __init__(self, providers: list[str], hedge_seconds: dict[str, float], cooldown: float):
+    self._providers = providers
+    self._hedge_seconds = hedge_seconds
+    self._cooldown = cooldown
+    # (smoothed value, monotonic time of the last sample)
+    self._latency: dict[tuple[str, str], tuple[float, float]] = {}
+    self._errors: dict[str, tuple[float, float]] = {}
+    self._benched_until: dict[str, float] = {}
+    self._lock = threading.Lock()
+
+  def _healthy(self, provider: str, now: float) -> bool:
+    if self._benched_until.get(provider, 0.0) > now:
+      return False
+    rate, updated = self._errors.get(provider, (0.0, 0.0))
+    return rate <= MAX_ERROR_RATE or now - updated > STALE_SECONDS
+
+  def _expected_latency(self, provider: str, route: str, now: float) -> float:
+    latency, updated = self._latency.get((provider, route), (0.0, 0.0))
+    # Stale figures count as unknown, so a provider that lost a while ago gets another try
+    return latency if now - updated <= STALE_SECONDS else 0.0
+
+  def candidates(self, route: str) -> list[str]:
+    """Providers to try for `route` in order; every configured one when none is healthy."""
+    now = time.monotonic()
+    with self._lock:
+      healthy = [provider for provider in self._providers if self._healthy(provider, now)]
+      return sorted(healthy or self._providers, key=lambda provider: self._expected_latency(provider, route, now))
+
+  def hedge_after(self, route: str) -> float | None:
+    return self._hedge_seconds.get(route) or None
+
+  def observe_latency(self, provider: str, route: str, seconds: float):
+    now = time.monotonic()
+    with self._lock:
+      previous, updated = self._latency.get((provider, route), (None, 0.0))
+      if previous is not None and now - updated <= STALE_SECONDS:
+        seconds = previous + SMOOTHING * (seconds - previous)
+      self._latency[(provider, route)] = (seconds, now)
+
+  def observe_result(self, provider: str, error: BaseException | None = None):
+    now = time.monotonic()
+    with self._lock:
+      rate, _ = self._errors.get(provider, (0.0, 0.0))
+      self._errors[provider] = (rate + SMOOTHING * ((error is not None) - rate), now)
+      if error is not None and _status(error) in THROTTLED_STATUSES:
+        self._benched_until[provider] = now + self._cooldown
+
+  async def call(self, route: str, providers: list[str], attempt: Callable[[str], Awaitable[Any]]) -> Any:
+    """Result of `attempt(provider)` from the first provider to answer."""
+    remaining = list(providers)
+    running: dict[asyncio.Task, tuple[str, float]] = {}
+    error = None
+
+    def launch():
+      provider = remaining.pop(0)
+      running[asyncio.create_task(attempt(provider))] = (provider, time.monotonic())
+
+    try:
+      while running or remaining:
+        if not running:
+          if error is not None:
+            set_attributes(failover=True)
+          launch()
+
+        hedge = self.hedge_after(route) if remaining and len(running) == 1 else None
+        done, _ = await asyncio.wait(running, timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+        if not done:
+          set_attributes(hedged=True)
+          launch()
+          continue
+
+        for task in done:
+          provider, started = running.pop(task)
+          if task.exception() is None:
+            self.observe_latency(provider, route, time.monotonic() - started)
+            self.observe_result(provider)
+            return task.result()
+          error = task.exception()
+          self.observe_result(provider, error)
+      raise error
+    finally:
+      for task, (provider, started) in running.items():
+        if not task.done():
+          task.cancel()
+          # The provider that lost the race still gets the time it took so far
+          self.observe_latency(provider, route, time.monotonic() - started)
+      await asyncio.gather(*running, return_exceptions=True)
+
+  async def stream(self, route: str, providers: list[str], attempt: Callable[[str], AsyncIterator[StreamEvent]]) -> AsyncIterator[StreamEvent]:
+    """
+    Events of `attempt(provider)` from the first provider to produce one;
+    latency here is the time to that first event.
+    """
+    remaining = list(providers)
+    racing: list[_Attempt] = []
+    current = None
+    error = None
+
+    def launch():
+      provider = remaining.pop(0)
+      racing.append(_Attempt(provider, attempt(provider)))
+
+    try:
+      while racing or remaining:
+        if not racing:
+          if error is not None:
+            set_attributes(failover=True)
+          launch()
+
+        hedge = self.hedge_after(route) if remaining and len(racing) == 1 else None
+        done, _ = await asyncio.wait([racer.ready for racer in racing], timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+        if not done:
+          set_attributes(hedged=True)
+          launch()
+          continue
+
+        current = next(racer for racer in racing if racer.ready.done())
+        racing.remove(current)
+        item = current.events.get_nowait()
+        if isinstance(item, Exception):
+          error = item
+          self.observe_result(current.provider, error)
+          continue
+
+        self.observe_latency(current.provider, route, current.elapsed())
+        for racer in racing:
+          racer.task.cancel()
+          self.observe_latency(racer.provider, route, racer.elapsed())
+        await asyncio.gather(*[racer.task for racer in racing], return_exceptions=True)
+        racing.clear()
+
+        sent_text = False
+        while isinstance(item, StreamEvent):
+          yield item
+          sent_text = sent_text or item.type == StreamEventType.TEXT
+          item = await current.events.get()
+
+        if item is None:
+          self.observe_result(current.provider)
+          return
+        error = item
+        self.observe_result(current.provider, error)
+        # Text already shown cannot be taken back, so only a failure before it falls over
+        if sent_text:
+          raise error
+      raise error
+    finally:
+      tasks = [racer.task for racer in racing] + ([current.task] if current is not None else [])
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_ROUTER: Router | None = None
+_LOCK = threading.Lock()
+
+
+def get_router() -> Router:
+  """
+  LLM_PROVIDERS lists the providers to route between (default "gemini,claude");
+  those without an API key are left out. LLM_HEDGE_<ROUTE>_SECONDS sets a
+  route's hedge deadline (0 disables hedging, the default for tool steps) and
+  LLM_COOLDOWN_SECONDS how long a throttled provider is benched.
+  """
+  global _ROUTER
+  with _LOCK:
+    if _ROUTER is None:
+      providers = [provider.strip() for provider in (Env["LLM_PROVIDERS"] or DEFAULT_PROVIDERS).split(",") if provider.strip()]
+      configured = [provider for provider in providers if provider in CREDENTIALS and Env[CREDENTIALS[provider]]]
+      _ROUTER = Router(
+        configured or providers,
+        {route: float(Env[f"LLM_HEDGE_{route.upper()}_SECONDS"] or seconds) for route, seconds in DEFAULT_HEDGE_SECONDS.items()},
+        float(Env["LLM_COOLDOWN_SECONDS"] or DEFAULT_COOLDOWN_SECONDS),
+      )
+    return _ROUTER
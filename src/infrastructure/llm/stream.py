@@ -0,0 +1,58 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+
+class StreamEventType:
+  TEXT = "text"
+  TOOL_CALL = "tool_call"
+  TOOL_RESULT = "tool_result"
+  STATUS = "status"
+  DONE = "done"
+
+
+@dataclass
+class StreamEvent:
+  """
+  One item yielded by `stream_message`.
+
+  TEXT carries a token delta, TOOL_CALL / TOOL_RESULT bracket a tool
+  invocation, STATUS is a progress line, and DONE carries the full text plus
+  the final raw response.
+  """
+  type: str
+  text: str = ""
+  tool_name: str | None = None
+  arguments: dict[str, Any] | None = None
+  is_error: bool = False
+  response: Any = None
+
+
+async def isolated(source: AsyncIterator[StreamEvent]) -> AsyncIterator[StreamEvent]:
+  """
+  Relay `source` from a task of its own. Spans and context variables the
+  source sets stay in that task instead of leaking into the consumer between
+  events, and they are always reset in the context that set them.
+  """
+  events: asyncio.Queue = asyncio.Queue()
+
+  async def pump():
+    try:
+      async for event in source:
+        events.put_nowait(event)
+      events.put_nowait(None)
+    except Exception as e:
+      events.put_nowait(e)
+
+  task = asyncio.create_task(pump())
+  try:
+    while True:
+      item = await events.get()
+      if item is None:
+        return
+      if isinstance(item, Exception):
+        raise item
+      yield item
+  finally:
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
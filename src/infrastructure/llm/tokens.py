@@ -0,0 +1,82 @@
+import json
+import threading
+from typing import Any
+
+from src.config.env import Env
+from src.infrastructure.llm.history import CHARS_PER_TOKEN
+
+
+# (context window, largest output) per provider; LLM_<PROVIDER>_CONTEXT_TOKENS and
+# LLM_<PROVIDER>_MAX_OUTPUT_TOKENS override them, since one call can be routed to either provider
+MODEL_LIMITS: dict[str, tuple[int, int]] = {
+  "claude": (200_000, 8_192),
+  "gemini": (1_048_576, 65_536),
+}
+DEFAULT_LIMITS = (128_000, 4_096)
+MIN_OUTPUT_TOKENS = 1_024
+# The provider's count_tokens endpoint is only asked once the estimate gets this close to the input budget
+EXACT_COUNT_RATIO = 0.8
+# Weight of the latest round trip when correcting the local approximation
+CALIBRATION_WEIGHT = 0.2
+MIN_RATIO, MAX_RATIO = 0.25, 4.0
+
+_RATIOS: dict[str, float] = {}
+_LOCK = threading.Lock()
+
+
+def jsonable(value: Any) -> Any:
+  return value.model_dump(exclude_none=True) if hasattr(value, "model_dump") else str(value)
+
+
+def approximate_tokens(value: Any) -> int:
+  """Fast local estimate: serialized characters over CHARS_PER_TOKEN, the same unit `History` budgets in."""
+  if value is None:
+    return 0
+  text = value if isinstance(value, str) else json.dumps(value, default=jsonable)
+  return len(text) // CHARS_PER_TOKEN
+
+
+class TokenBudget:
+  """
+  Sizes the round trips of one provider.
+
+  Local estimates are scaled by how far off they were on earlier round trips
+  of the same provider, learned from the usage each response reports. The
+  input budget is the context window minus room for a minimal answer, and
+  `max_tokens` gives the answer whatever the prompt leaves, up to the
+  model's output limit.
+  """
+
+  def __init__(self, provider: str):
+    context_window, max_output_tokens = MODEL_LIMITS.get(provider, DEFAULT_LIMITS)
+    self.provider = provider
+    prefix = f"LLM_{provider.upper()}"
+    self.context_window = int(Env[f"{prefix}_CONTEXT_TOKENS"] or context_window)
+    self.max_output_tokens = int(Env[f"{prefix}_MAX_OUTPUT_TOKENS"] or max_output_tokens)
+
+  @property
+  def input_budget(self) -> int:
+    return self.context_window - MIN_OUTPUT_TOKENS
+
+  @property
+  def ratio(self) -> float:
+    return _RATIOS.get(self.provider, 1.0)
+
+  def scale(self, approximate: int) -> int:
+    return int(approximate * self.ratio)
+
+  def needs_exact_count(self, estimate: int) -> bool:
+    return estimate >= self.input_budget * EXACT_COUNT_RATIO
+
+  def observe(self, approximate: int, actual: int | None):
+    """Correct later estimates with the prompt tokens a provider reported for an approximated payload."""
+    if approximate <= 0 or not actual:
+      return
+    observed = min(max(actual / approximate, MIN_RATIO), MAX_RATIO)
+    with _LOCK:
+      current = _RATIOS.get(self.provider)
+      _RATIOS[self.provider] = observed if current is None else current + (observed - current) * CALIBRATION_WEIGHT
+
+  def max_tokens(self, input_tokens: int, cap: int | None = None) -> int:
+    room = self.context_window - input_tokens
+    return max(MIN_OUTPUT_TOKENS, min(cap or self.max_output_tokens, self.max_output_tokens, room))
@@ -1,36 +1,129 @@
+import asyncio
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from fastmcp import Client
+from fastmcp.client.client import CallToolResult
 from mcp import types
-from src.config.mcp import Mcp
+from src.config.cache import CacheTtl
+from src.config.env import Env
+from src.config.mcp import SPRINT_ISSUES_TOOL
 from src.domain.entity.custom_tool.adapter import Adapter
+from src.infrastructure.cache.keys import make_key
+from src.infrastructure.cache.store import get_cache, is_bypassed
+from src.infrastructure.mcp.session_pool import ALL_PROVIDERS, get_pool
+from src.infrastructure.telemetry.tracer import Span, span
+
+CUSTOM_TOOL_PROVIDER = "custom_tool"
+DEFAULT_TOOL_CONCURRENCY = 4
+DEFAULT_TOOL_TIMEOUT = 60.0
+
+_TOOL_SEMAPHORES: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = WeakKeyDictionary()
+
+
+def _tool_semaphore(provider: str) -> asyncio.Semaphore:
+  semaphores = _TOOL_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+  if provider not in semaphores:
+    semaphores[provider] = asyncio.Semaphore(int(Env["MCP_TOOL_CONCURRENCY"] or DEFAULT_TOOL_CONCURRENCY))
+  return semaphores[provider]
+
 
 class McpMixin:
   _mcp_client: Client | None = None
-  _history: list[Any] = []
+  _mcp_provider: str = ALL_PROVIDERS
+  _mcp_session_error: bool = False
+
+  def __init__(self):
+    super().__init__()
+    # Per instance: a class-level list would be shared by every model in the process
+    self._history = []
+    self.tool_calls = 0
 
   def is_session_opened(self):
     return self._mcp_client is not None and self._mcp_client.is_connected()
 
-  async def open_session(self):
-    config = Mcp.to_dict()
+  async def open_session(self, provider: str = ALL_PROVIDERS):
+    if self._mcp_client is not None:
+      await self.close_session()
 
-    self._mcp_client = Client(config)
-    await self._mcp_client.__aenter__()
-    self._history = []
+    self._mcp_provider = provider
+    self._mcp_client = await get_pool().acquire(provider)
+    self._mcp_session_error = False
+    self._history.clear()
     return self._mcp_client
 
   async def close_session(self):
-    if self.is_session_opened():
-      await self._mcp_client.__aexit__(None, None, None)
+    if self._mcp_client is not None:
+      await get_pool().release(self._mcp_client, error=self._mcp_session_error)
       self._mcp_client = None
-      self._history = []
+      self._history.clear()
 
   def _is_custom_tool(self, tool_name: str) -> bool:
     return tool_name.startswith("custom_tool.")
 
+  def _tool_provider(self, tool_name: str) -> str:
+    return CUSTOM_TOOL_PROVIDER if self._is_custom_tool(tool_name) else self._mcp_provider
+
+  def _error_result(self, message: str) -> CallToolResult:
+    return CallToolResult(
+      content=[types.TextContent(type="text", text=message)],
+      structured_content=None,
+      is_error=True
+    )
+
+  async def _call_tool_limited(self, name: str, arguments: dict[str, Any] | None, timeout: float) -> CallToolResult:
+    async with _tool_semaphore(self._tool_provider(name)):
+      try:
+        return await asyncio.wait_for(self.call_tool(name=name, arguments=arguments), timeout)
+      except asyncio.TimeoutError:
+        return self._error_result(f"Tool {name} timed out after {timeout}s")
+      except Exception as e:
+        return self._error_result(f"Tool {name} failed: {e}")
+
+  async def call_tools(self, calls: list[tuple[str, dict[str, Any] | None]]) -> list[CallToolResult]:
+    """Run independent tool calls concurrently; results keep the order of `calls`."""
+    timeout = float(Env["MCP_TOOL_TIMEOUT"] or DEFAULT_TOOL_TIMEOUT)
+    self.tool_calls += len(calls)
+    return await asyncio.gather(*[
+      self._call_tool_limited(name, arguments, timeout) for name, arguments in calls
+    ])
+
+  def _result_bytes(self, result: types.CallToolResult) -> int:
+    return sum(len(getattr(content, "text", "") or "") for content in result.content or [])
+
   async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> types.CallToolResult:
+    with span("mcp.call_tool", tool=name, provider=self._tool_provider(name)) as current:
+      result = await self._call_tool(name, arguments, current)
+      current.set(payload_bytes=self._result_bytes(result))
+      self._record_result(name, arguments, result)
+      return result
+
+  def _record_result(self, name: str, arguments: dict[str, Any] | None, result: types.CallToolResult):
+    if name != SPRINT_ISSUES_TOOL or result.is_error or not result.content:
+      return
+    # Imported here so sessions that never touch sprints skip the Jira modules
+    from src.domain.entity.custom_tool.jira.sprint_snapshot import record_sprint_issues
+    record_sprint_issues(arguments, getattr(result.content[0], "text", "") or "")
+
+  async def _call_tool(self, name: str, arguments: dict[str, Any] | None, current: Span) -> types.CallToolResult:
     if self._is_custom_tool(name):
       return await Adapter.call_tool(name=name, arguments=arguments)
-    else:
-      return await self._mcp_client.call_tool(name=name, arguments=arguments)
\ No newline at end of file
+
+    ttl = CacheTtl.for_tool(name)
+    key = make_key("tool", self._mcp_provider, name, arguments or {})
+    if ttl and not is_bypassed():
+      cached = get_cache().get(key)
+      current.set(cached=cached is not None)
+      if cached is not None:
+        return cached
+
+    try:
+      result = await self._mcp_client.call_tool(name=name, arguments=arguments)
+      if ttl and not result.is_error:
+        get_cache().set(key, result, ttl)
+      return result
+    except Exception:
+      # Recycle the pooled session instead of handing a broken one to the next caller
+      if not self.is_session_opened():
+        self._mcp_session_error = True
+      raise
@@ -0,0 +1,192 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastmcp import Client
+
+from src.config.env import Env
+from src.config.mcp import Mcp
+from src.infrastructure.mcp.tool_cache import ToolListChangedHandler
+
+
+ALL_PROVIDERS = "*"
+DEFAULT_POOL_SIZE = 2
+DEFAULT_IDLE_TIMEOUT = 600.0
+# Set in each server's environment so its process can be found if its loop dies first
+SESSION_MARKER = "MCP_POOL_SESSION"
+
+
+def _child_pids() -> set[int]:
+  # Linux only; elsewhere a server whose loop is gone is left to exit with the process
+  pids = set()
+  try:
+    for task in os.listdir(f"/proc/{os.getpid()}/task"):
+      with open(f"/proc/{os.getpid()}/task/{task}/children") as f:
+        pids.update(int(pid) for pid in f.read().split())
+  except OSError:
+    pass
+  return pids
+
+
+def _server_pids(marker: str) -> list[int]:
+  entry = f"{SESSION_MARKER}={marker}".encode()
+  pids = []
+  for pid in _child_pids():
+    try:
+      with open(f"/proc/{pid}/environ", "rb") as f:
+        if entry in f.read().split(b"\0"):
+          pids.append(pid)
+    except OSError:
+      continue
+  return pids
+
+
+@dataclass
+class _PooledSession:
+  client: Client
+  provider: str
+  loop: asyncio.AbstractEventLoop
+  marker: str
+  created_at: float = field(default_factory=time.monotonic)
+  last_used_at: float = field(default_factory=time.monotonic)
+
+
+class SessionPool:
+  """
+  Process-wide pool of warm MCP clients, keyed by provider.
+
+  Clients stay connected between `acquire` / `release` so the stdio server
+  (e.g. the mcp-atlassian docker container) is only started once. Sessions
+  are bound to the event loop that opened them and are never handed out on
+  another loop.
+  """
+
+  def __init__(self, size: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+    self._size = size
+    self._idle_timeout = idle_timeout
+    self._idle: dict[str, deque[_PooledSession]] = {}
+    self._leased: dict[int, _PooledSession] = {}
+    self._lock = threading.Lock()
+
+  def _config(self, provider: str, marker: str) -> dict[str, Any]:
+    servers = Mcp.to_dict()["mcpServers"] if provider == ALL_PROVIDERS else {provider: Mcp[provider]}
+    return {"mcpServers": {
+      name: {**server, "env": {**(server.get("env") or {}), SESSION_MARKER: marker}}
+      for name, server in servers.items()
+    }}
+
+  def _is_expired(self, session: _PooledSession) -> bool:
+    return time.monotonic() - session.last_used_at > self._idle_timeout
+
+  def _is_usable(self, session: _PooledSession, loop: asyncio.AbstractEventLoop) -> bool:
+    if session.loop is not loop or session.loop.is_closed():
+      return False
+    if self._is_expired(session):
+      return False
+    return session.client.is_connected()
+
+  async def _open(self, provider: str, loop: asyncio.AbstractEventLoop) -> _PooledSession:
+    marker = uuid.uuid4().hex
+    client = Client(self._config(provider, marker), message_handler=ToolListChangedHandler(provider))
+    await client.__aenter__()
+    return _PooledSession(client=client, provider=provider, loop=loop, marker=marker)
+
+  def _kill(self, session: _PooledSession):
+    for pid in _server_pids(session.marker):
+      try:
+        # Servers are started in their own process group, so this reaches their children too
+        os.killpg(pid, signal.SIGTERM)
+      except OSError as e:
+        print(f"Failed to stop MCP server {pid} for {session.provider}: {e}")
+
+  async def _close(self, session: _PooledSession):
+    if session.loop.is_closed() or not session.loop.is_running():
+      # Nothing will run its transport tasks again, so the server has to be stopped directly
+      self._kill(session)
+      return
+    if session.loop is not asyncio.get_running_loop():
+      # Its transport tasks run on the owning loop, so the client has to be closed there
+      asyncio.run_coroutine_threadsafe(self._close(session), session.loop)
+      return
+    try:
+      await session.client.__aexit__(None, None, None)
+    except Exception as e:
+      print(f"Failed to close MCP session for {session.provider}: {e}")
+
+  async def acquire(self, provider: str = ALL_PROVIDERS) -> Client:
+    loop = asyncio.get_running_loop()
+    stale = []
+    session = None
+
+    with self._lock:
+      idle = self._idle.setdefault(provider, deque())
+      for candidate in reversed(list(idle)):
+        if candidate.loop is not loop and not candidate.loop.is_closed() and not self._is_expired(candidate):
+          # Still live on another loop, which will reuse it
+          continue
+        if not self._is_usable(candidate, loop):
+          stale.append(candidate)
+        elif session is None:
+          session = candidate
+        else:
+          continue
+        idle.remove(candidate)
+
+    for candidate in stale:
+      await self._close(candidate)
+
+    if session is None:
+      session = await self._open(provider, loop)
+
+    with self._lock:
+      self._leased[id(session.client)] = session
+    return session.client
+
+  async def release(self, client: Client, error: bool = False):
+    """Return a client to the pool, or close it if it failed or the pool is full."""
+    with self._lock:
+      session = self._leased.pop(id(client), None)
+      if session is None:
+        return
+      session.last_used_at = time.monotonic()
+      idle = self._idle.setdefault(session.provider, deque())
+      keep = not error and len(idle) < self._size and client.is_connected()
+      if keep:
+        idle.append(session)
+
+    if not keep:
+      await self._close(session)
+
+  async def close_all(self):
+    """Close every session on the loop that opened it and wait until they are all closed."""
+    with self._lock:
+      sessions = [session for idle in self._idle.values() for session in idle]
+      sessions.extend(self._leased.values())
+      self._idle = {}
+      self._leased = {}
+
+    loop = asyncio.get_running_loop()
+    for session in sessions:
+      if session.loop is not loop and session.loop.is_running():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._close(session), session.loop))
+      else:
+        await self._close(session)
+
+
+_POOL: SessionPool | None = None
+
+
+def get_pool() -> SessionPool:
+  global _POOL
+  if _POOL is None:
+    _POOL = SessionPool(
+      size=int(Env["MCP_POOL_SIZE"] or DEFAULT_POOL_SIZE),
+      idle_timeout=float(Env["MCP_POOL_IDLE_TIMEOUT"] or DEFAULT_IDLE_TIMEOUT),
+    )
+  return _POOL
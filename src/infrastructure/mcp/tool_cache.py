@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+from fastmcp.client.messages import MessageHandler
+from mcp import types
+
+from src.config.env import Env
+
+
+DEFAULT_TTL = 300.0
+
+
+class ToolCache:
+  """
+  Tool catalog payloads keyed by MCP provider and model flavor.
+
+  A flavor is whatever shape a model needs (raw `list_tools()` result,
+  Claude `input_schema` dicts, Gemini `parameters` / `types.Tool`), so the
+  conversion only runs once per provider until the entry expires or the
+  server reports `tools/list_changed`.
+  """
+
+  def __init__(self, ttl: float = DEFAULT_TTL):
+    self._ttl = ttl
+    self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+    self._lock = threading.Lock()
+
+  def get(self, provider: str, flavor: str) -> Any | None:
+    with self._lock:
+      entry = self._entries.get((provider, flavor))
+      if entry is None:
+        return None
+      expires_at, value = entry
+      if time.monotonic() > expires_at:
+        del self._entries[(provider, flavor)]
+        return None
+      return value
+
+  def set(self, provider: str, flavor: str, value: Any):
+    with self._lock:
+      self._entries[(provider, flavor)] = (time.monotonic() + self._ttl, value)
+
+  async def get_or_build(self, provider: str, flavor: str, build: Callable[[], Awaitable[Any]]) -> Any:
+    value = self.get(provider, flavor)
+    if value is None:
+      value = await build()
+      self.set(provider, flavor, value)
+    return value
+
+  def invalidate(self, provider: str | None = None):
+    with self._lock:
+      if provider is None:
+        self._entries = {}
+        return
+      self._entries = {key: entry for key, entry in self._entries.items() if key[0] != provider}
+
+
+class ToolListChangedHandler(MessageHandler):
+  """Drops cached tool payloads for a provider when its server announces a new tool list."""
+
+  def __init__(self, provider: str):
+    super().__init__()
+    self._provider = provider
+
+  async def on_tool_list_changed(self, notification: types.ToolListChangedNotification) -> None:
+    from src.infrastructure.mcp.tool_catalog import get_tool_catalog
+
+    get_tool_cache().invalidate(self._provider)
+    get_tool_catalog().invalidate()
+
+
+_TOOL_CACHE: ToolCache | None = None
+
+
+def get_tool_cache() -> ToolCache:
+  global _TOOL_CACHE
+  if _TOOL_CACHE is None:
+    _TOOL_CACHE = ToolCache(ttl=float(Env["MCP_TOOL_CACHE_TTL"] or DEFAULT_TTL))
+  return _TOOL_CACHE
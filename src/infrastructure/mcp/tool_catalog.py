@@ -0,0 +1,120 @@
+import asyncio
+import re
+import time
+from concurrent.futures import Future
+
+from src.config.env import Env
+from src.infrastructure.runtime.worker_pool import get_runtime
+
+
+DEFAULT_REFRESH_INTERVAL = 600.0
+DESCRIPTION_CHARS = 200
+CUSTOM_TOOL_PREFIX = "custom_tool."
+
+
+def tool_domain(name: str) -> str:
+  """`jira_search` -> "jira", `custom_tool.jira.module.Class` -> "jira"."""
+  if name.startswith(CUSTOM_TOOL_PREFIX):
+    return name[len(CUSTOM_TOOL_PREFIX):].split(".")[0]
+  return name.split("_")[0]
+
+
+def _summary(description: str | None) -> str:
+  # First paragraph only: MCP descriptions often carry long argument docs after it
+  text = re.sub(r"\s+", " ", (description or "").strip().split("\n\n")[0])
+  return text if len(text) <= DESCRIPTION_CHARS else text[:DESCRIPTION_CHARS].rstrip() + "…"
+
+
+def _entry(name: str, description: str | None, schema: dict | None) -> dict:
+  return {
+    "name": name,
+    "description": _summary(description),
+    "domain": tool_domain(name),
+    "parameters": list(((schema or {}).get("properties") or {}).keys()),
+  }
+
+
+def format_tools(entries: list[dict]) -> str:
+  """One markdown bullet per tool, for prompts."""
+  return "\n".join(
+    f"- `{entry['name']}({', '.join(entry['parameters'])})`: {entry['description']}" for entry in entries
+  )
+
+
+class ToolCatalog:
+  """
+  Names, descriptions and parameters of every MCP and custom tool.
+
+  Built straight from `list_tools()` and the custom tool `Registry` instead
+  of asking a model, then kept fresh in the background by `start`. Without a
+  running refresher, `get` rebuilds on demand once the snapshot is older than
+  the refresh interval.
+  """
+
+  def __init__(self, refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+    self._refresh_interval = refresh_interval
+    self._entries: list[dict] | None = None
+    self._built_at = 0.0
+    self._refresher: Future | None = None
+
+  async def _mcp_entries(self) -> list[dict]:
+    from src.infrastructure.mcp.session_pool import ALL_PROVIDERS, get_pool
+    from src.infrastructure.mcp.tool_cache import get_tool_cache
+
+    client = await get_pool().acquire(ALL_PROVIDERS)
+    error = False
+    try:
+      tools = await get_tool_cache().get_or_build(ALL_PROVIDERS, "list_tools", client.list_tools)
+    except Exception:
+      error = True
+      raise
+    finally:
+      await get_pool().release(client, error=error)
+    return [_entry(tool.name, tool.description, tool.inputSchema) for tool in tools]
+
+  def _custom_entries(self) -> list[dict]:
+    from src.domain.entity.custom_tool.registry import Registry
+
+    return [_entry(name, tool.description(), tool.inputSchema()) for name, tool in Registry.load().items()]
+
+  async def refresh(self) -> list[dict]:
+    """Rebuild the catalog; on failure the previous snapshot is kept."""
+    try:
+      entries = await self._mcp_entries() + self._custom_entries()
+    except Exception as e:
+      print(f"Failed to refresh tool catalog: {e}")
+      return self._entries or []
+    self._entries = entries
+    self._built_at = time.monotonic()
+    return entries
+
+  def invalidate(self):
+    self._entries = None
+
+  async def get(self, domain: str | None = None) -> list[dict]:
+    entries = self._entries
+    if entries is None or time.monotonic() - self._built_at > self._refresh_interval:
+      entries = await self.refresh()
+    return [entry for entry in entries if domain is None or entry["domain"] == domain]
+
+  async def _refresh_forever(self):
+    while True:
+      await self.refresh()
+      await asyncio.sleep(self._refresh_interval)
+
+  def start(self):
+    """Build the catalog now and refresh it every interval on the background runtime."""
+    if self._refresher is None:
+      self._refresher = get_runtime().run(self._refresh_forever())
+
+
+_TOOL_CATALOG: ToolCatalog | None = None
+
+
+def get_tool_catalog() -> ToolCatalog:
+  global _TOOL_CATALOG
+  if _TOOL_CATALOG is None:
+    _TOOL_CATALOG = ToolCatalog(
+      refresh_interval=float(Env["TOOL_CATALOG_REFRESH_INTERVAL"] or DEFAULT_REFRESH_INTERVAL)
+    )
+  return _TOOL_CATALOG
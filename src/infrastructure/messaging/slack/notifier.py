@@ -1,25 +1,66 @@
+import asyncio
+from concurrent.futures import Future
+
+import aiohttp
 from slack_bolt import App
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from src.config.env import Env
+from src.infrastructure.messaging.slack.outbox import DEFAULT_MAX_RETRIES, POST, UPDATE, OutboundMessage, Outbox
+from src.infrastructure.runtime.worker_pool import get_runtime
+
+DEFAULT_POOL_SIZE = 20
 
 _LOADED_NOTIFIER: bool = False
-_SLACK_CLIENT: WebClient = None
+_OUTBOX: Outbox | None = None
 
-def initialize(app: App):
-  global _LOADED_NOTIFIER, _SLACK_CLIENT
+def _async_client_factory(app: App):
+  """One AsyncWebClient over one aiohttp session, so every Slack call reuses the same connection pool."""
+  def create() -> AsyncWebClient:
+    client = app.client
+    session = aiohttp.ClientSession(
+      connector=aiohttp.TCPConnector(limit=int(Env["SLACK_HTTP_POOL_SIZE"] or DEFAULT_POOL_SIZE), ssl=client.ssl or True)
+    )
+    return AsyncWebClient(token=client.token, base_url=client.base_url, ssl=client.ssl, session=session)
+  return create
+
+def initialize(app: App, client: AsyncWebClient | None = None):
+  global _LOADED_NOTIFIER, _OUTBOX
 
   if _LOADED_NOTIFIER:
     return
   _LOADED_NOTIFIER = True
-  _SLACK_CLIENT = app.client
+  _OUTBOX = Outbox(
+    (lambda: client) if client is not None else _async_client_factory(app),
+    max_retries=int(Env["SLACK_MAX_RETRIES"] or DEFAULT_MAX_RETRIES)
+  )
+
+
+def _submit(message: OutboundMessage) -> Future:
+  # The outbox lives on the background runtime loop; callers on any thread get a future back
+  return get_runtime().run(_OUTBOX.send(message))
+
+async def _send(message: OutboundMessage) -> str | None:
+  if asyncio.get_running_loop() is get_runtime().loop:
+    return await _OUTBOX.send(message)
+  return await asyncio.wrap_future(_submit(message))
+
+
+async def send_message(channel_id: str, text: str, thread_ts: str | None = None) -> str | None:
+  """Post through the outbox and return the message ts once Slack has accepted it."""
+  return await _send(OutboundMessage(POST, channel_id, text, thread_ts=thread_ts))
 
+async def edit_message(channel_id: str, ts: str, text: str):
+  await _send(OutboundMessage(UPDATE, channel_id, text, ts=ts))
 
-def post_message(channel_id: str, text: str):
-  try:
-    _SLACK_CLIENT.chat_postMessage(channel=channel_id, text=text)
-  except SlackApiError as e:
-    print(f"Error posting message to Slack: {e.response['error']}")
+def enqueue_message(channel_id: str, text: str, thread_ts: str | None = None):
+  """Fire-and-forget post for synchronous callers that must not wait on Slack."""
+  _submit(OutboundMessage(POST, channel_id, text, thread_ts=thread_ts, coalesce=True))
 
 
+def post_message(channel_id: str, text: str, thread_ts: str | None = None) -> str | None:
+  return _submit(OutboundMessage(POST, channel_id, text, thread_ts=thread_ts)).result()
 
 
+def update_message(channel_id: str, ts: str, text: str):
+  _submit(OutboundMessage(UPDATE, channel_id, text, ts=ts)).result()
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import aiohttp
+from slack_sdk.errors import SlackApiError
+
+
+POST = "chat.postMessage"
+UPDATE = "chat.update"
+
+# (requests per second, burst, per channel). chat.postMessage allows about one
+# message per second per channel; chat.update is Tier 3, about 50 per minute per workspace.
+RATE_LIMITS: dict[str, tuple[float, int, bool]] = {
+  POST: (1.0, 3, True),
+  UPDATE: (50 / 60, 5, False),
+}
+RETRYABLE_ERRORS = {"ratelimited", "internal_error", "fatal_error", "service_unavailable", "request_timeout"}
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0
+
+# A section block holds at most 3000 characters and a message at most 50 blocks
+SECTION_CHARS = 3000
+MAX_BLOCKS = 50
+
+
+def split_text(text: str, limit: int = SECTION_CHARS) -> list[str]:
+  """Split at line breaks where possible so every chunk fits in one section block."""
+  chunks = []
+  while len(text) > limit:
+    cut = text.rfind("\n", 0, limit)
+    if cut <= 0:
+      cut = limit
+    chunks.append(text[:cut])
+    text = text[cut:].lstrip("\n")
+  if text or not chunks:
+    chunks.append(text)
+  return chunks
+
+
+def _blocks(chunks: list[str]) -> list[dict]:
+  return [{"type": "section", "text": {"type": "mrkdwn", "text": chunk}} for chunk in chunks]
+
+
+class TokenBucket:
+  def __init__(self, rate: float, capacity: int):
+    self._rate = rate
+    self._capacity = capacity
+    self._tokens = float(capacity)
+    self._updated = time.monotonic()
+
+  async def acquire(self):
+    while True:
+      now = time.monotonic()
+      self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+      self._updated = now
+      if self._tokens >= 1:
+        self._tokens -= 1
+        return
+      await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+@dataclass
+class OutboundMessage:
+  method: str
+  channel: str
+  text: str
+  thread_ts: str | None = None
+  ts: str | None = None
+  # Only posts nobody waits on may be joined; a caller that keeps the ts to edit its message needs its own
+  coalesce: bool = False
+  futures: list[asyncio.Future] = field(default_factory=list)
+
+  def absorb(self, other: "OutboundMessage") -> bool:
+    """Merge a later message into this queued one when Slack would only need one call for both."""
+    if self.method != other.method:
+      return False
+    if self.method == POST and self.coalesce and other.coalesce and self.thread_ts == other.thread_ts:
+      self.text = f"{self.text}\n{other.text}"
+    elif self.method == UPDATE and self.ts == other.ts:
+      self.text = other.text
+    else:
+      return False
+    self.futures.extend(other.futures)
+    return True
+
+
+class Outbox:
+  """
+  Outbound Slack queue living on one event loop.
+
+  Each channel has a lane that is drained in order, so channels proceed in
+  parallel while messages within a channel keep their order. Messages still
+  waiting in a lane are coalesced: fire-and-forget posts to the same thread
+  are joined and updates to the same message keep only the latest text. Calls go through
+  per-method token buckets and are retried on `ratelimited` (honouring
+  Retry-After) and transient errors.
+  """
+
+  def __init__(self, client_factory: Callable[[], Any], max_retries: int = DEFAULT_MAX_RETRIES):
+    self._client_factory = client_factory
+    self._client = None
+    self._max_retries = max_retries
+    self._lanes: dict[str, deque[OutboundMessage]] = {}
+    self._buckets: dict[tuple[str, str], TokenBucket] = {}
+
+  def _get_client(self):
+    # Created on first use so its HTTP session belongs to the outbox loop
+    if self._client is None:
+      self._client = self._client_factory()
+    return self._client
+
+  def _bucket(self, method: str, channel: str) -> TokenBucket:
+    rate, capacity, per_channel = RATE_LIMITS[method]
+    key = (method, channel if per_channel else "")
+    if key not in self._buckets:
+      self._buckets[key] = TokenBucket(rate, capacity)
+    return self._buckets[key]
+
+  async def send(self, message: OutboundMessage) -> str | None:
+    """Queue a message and wait until it is delivered; returns the message ts, or None if Slack refused it."""
+    future = asyncio.get_running_loop().create_future()
+    message.futures.append(future)
+
+    lane = self._lanes.get(message.channel)
+    if lane is None:
+      lane = self._lanes[message.channel] = deque([message])
+      asyncio.create_task(self._drain(message.channel, lane))
+    elif not (lane and lane[-1].absorb(message)):
+      lane.append(message)
+    return await future
+
+  async def _drain(self, channel: str, lane: deque[OutboundMessage]):
+    try:
+      while lane:
+        # Popped messages are in flight and no longer absorb later ones
+        message = lane.popleft()
+        try:
+          result = await self._deliver(message)
+        except Exception as e:
+          print(f"Error sending message to Slack: {e}")
+          result = None
+        for future in message.futures:
+          if not future.done():
+            future.set_result(result)
+    finally:
+      del self._lanes[channel]
+
+  async def _deliver(self, message: OutboundMessage) -> str | None:
+    chunks = split_text(message.text)
+    if message.method == UPDATE:
+      # An update can only replace one message, so anything past the block limit is dropped
+      return await self._call(UPDATE, message.channel, ts=message.ts, **self._content(chunks[:MAX_BLOCKS]))
+
+    first_ts = None
+    for start in range(0, len(chunks), MAX_BLOCKS):
+      ts = await self._call(POST, message.channel, thread_ts=message.thread_ts, **self._content(chunks[start:start + MAX_BLOCKS]))
+      first_ts = first_ts or ts
+    return first_ts
+
+  def _content(self, chunks: list[str]) -> dict:
+    if len(chunks) == 1:
+      return {"text": chunks[0]}
+    # `text` becomes the notification fallback when blocks are present
+    return {"text": chunks[0], "blocks": _blocks(chunks)}
+
+  async def _call(self, method: str, channel: str, **kwargs) -> str | None:
+    client = self._get_client()
+    call = client.chat_postMessage if method == POST else client.chat_update
+
+    for attempt in range(self._max_retries + 1):
+      await self._bucket(method, channel).acquire()
+      try:
+        response = await call(channel=channel, **kwargs)
+        return response.get("ts")
+      except SlackApiError as e:
+        error = e.response.get("error")
+        if error not in RETRYABLE_ERRORS or attempt == self._max_retries:
+          print(f"Error calling {method} on Slack: {error}")
+          return None
+        delay = BACKOFF_SECONDS * 2 ** attempt
+        if error == "ratelimited":
+          delay = float(getattr(e.response, "headers", {}).get("Retry-After", delay))
+      except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+        if attempt == self._max_retries:
+          print(f"Error calling {method} on Slack: {e}")
+          return None
+        delay = BACKOFF_SECONDS * 2 ** attempt
+      await asyncio.sleep(delay)
+    return None
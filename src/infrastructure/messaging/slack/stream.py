@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from src.infrastructure.messaging.slack.notifier import edit_message, send_message
+from src.infrastructure.telemetry.tracer import set_root_attributes
+
+
+DEFAULT_MIN_INTERVAL = 1.0
+MAX_TEXT_LENGTH = 39000
+
+
+class SlackStream:
+  """
+  Incrementally updated Slack message.
+
+  `start` posts a placeholder right away; deltas from `append` are buffered
+  and flushed with `chat_update` at most once per `min_interval` seconds to
+  stay inside Slack's rate tier. `finish` always writes the final text.
+  """
+
+  def __init__(self, channel_id: str, min_interval: float = DEFAULT_MIN_INTERVAL):
+    self._channel_id = channel_id
+    self._min_interval = min_interval
+    self._ts: str | None = None
+    self._text = ""
+    self._status = ""
+    self._rendered = ""
+    self._last_update = 0.0
+    self._pending_flush: asyncio.Task | None = None
+
+  async def start(self, placeholder: str):
+    self._status = placeholder
+    self._rendered = self._render()
+    self._ts = await send_message(self._channel_id, self._rendered)
+    self._last_update = time.monotonic()
+    set_root_attributes(slack_ts=self._ts)
+
+  async def append(self, text: str):
+    self._text += text
+    await self._schedule_flush()
+
+  async def set_status(self, status: str):
+    self._status = status
+    await self._schedule_flush()
+
+  async def finish(self, text: str | None = None):
+    if self._pending_flush is not None:
+      self._pending_flush.cancel()
+      self._pending_flush = None
+    if text is not None:
+      self._text = text
+    self._status = ""
+    await self._flush()
+
+  def _render(self) -> str:
+    text = self._text
+    if len(text) > MAX_TEXT_LENGTH:
+      text = text[:MAX_TEXT_LENGTH] + "…"
+    if self._status:
+      text = f"{text}\n\n_{self._status}_" if text else f"_{self._status}_"
+    return text or "…"
+
+  async def _schedule_flush(self):
+    if self._pending_flush is not None:
+      return
+    delay = self._last_update + self._min_interval - time.monotonic()
+    if delay <= 0:
+      await self._flush()
+      return
+    self._pending_flush = asyncio.create_task(self._flush_later(delay))
+
+  async def _flush_later(self, delay: float):
+    await asyncio.sleep(delay)
+    self._pending_flush = None
+    await self._flush()
+
+  async def _flush(self):
+    rendered = self._render()
+    if rendered == self._rendered:
+      return
+    self._rendered = rendered
+    self._last_update = time.monotonic()
+
+    if self._ts is None:
+      self._ts = await send_message(self._channel_id, rendered)
+    else:
+      await edit_message(self._channel_id, self._ts, rendered)
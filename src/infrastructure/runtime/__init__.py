@@ -0,0 +1,3 @@
+"""Background asyncio runtime for long-running command jobs."""
+
+
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+
+# (lowest, highest) for minute, hour, day of month, month and day of week
+FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+# Bound on the search so an impossible expression like "0 0 31 2 *" fails instead of spinning
+MAX_LOOKAHEAD_DAYS = 366 * 4
+
+
+def _parse_field(field: str, lowest: int, highest: int) -> set[int]:
+  values = set()
+  for part in field.split(","):
+    spec, _, step = part.partition("/")
+    if spec == "*":
+      start, end = lowest, highest
+    elif "-" in spec:
+      start, end = (int(value) for value in spec.split("-", 1))
+    else:
+      start = end = int(spec)
+      if step:
+        end = highest
+    if start < lowest or end > highest or start > end:
+      raise ValueError(f"'{part}' is outside {lowest}-{highest}")
+    values.update(range(start, end + 1, int(step or 1)))
+  return values
+
+
+class Cron:
+  """
+  Standard five-field cron expression: minute, hour, day of month, month and
+  day of week (0 or 7 is Sunday), with `*`, lists, ranges and steps. As in
+  cron, when both day fields are restricted a day matching either one runs.
+  """
+
+  def __init__(self, expression: str):
+    fields = expression.split()
+    if len(fields) != 5:
+      raise ValueError(f"Cron expression '{expression}' must have 5 fields")
+    self.expression = expression
+    try:
+      self._minutes, self._hours, self._days, self._months, self._weekdays = (
+        _parse_field(field, lowest, highest) for field, (lowest, highest) in zip(fields, FIELD_RANGES)
+      )
+    except ValueError as e:
+      raise ValueError(f"Invalid cron expression '{expression}': {e}")
+    if 7 in self._weekdays:
+      self._weekdays = (self._weekdays - {7}) | {0}
+    self._any_day = fields[2] == "*"
+    self._any_weekday = fields[4] == "*"
+
+  def _day_matches(self, moment: datetime) -> bool:
+    day = moment.day in self._days
+    # datetime counts Monday as 0, cron counts Sunday as 0
+    weekday = (moment.weekday() + 1) % 7 in self._weekdays
+    if self._any_day or self._any_weekday:
+      return day and weekday
+    return day or weekday
+
+  def next_after(self, moment: datetime) -> datetime:
+    """First matching minute strictly after `moment`, in the same timezone."""
+    candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = candidate + timedelta(days=MAX_LOOKAHEAD_DAYS)
+    while candidate < limit:
+      if candidate.month not in self._months or not self._day_matches(candidate):
+        candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+      elif candidate.hour not in self._hours:
+        candidate = candidate.replace(minute=0) + timedelta(hours=1)
+      elif candidate.minute not in self._minutes:
+        candidate += timedelta(minutes=1)
+      else:
+        return candidate
+    raise ValueError(f"Cron expression '{self.expression}' never matches")
@@ -0,0 +1,65 @@
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from src.infrastructure.runtime.worker_pool import DEFAULT_CONCURRENCY, get_runtime
+
+
+@dataclass(frozen=True)
+class CommandJob:
+  """A slash command handed from a listener to whichever process runs it; only names travel, so it pickles."""
+  module: str
+  handler: str
+  command: dict
+
+
+class JobQueue:
+  """
+  Command queue shared by every worker process of the async entry point.
+
+  Listeners in any process `put` jobs without waiting; each process runs a
+  consumer thread that takes at most `concurrency` jobs at a time and runs
+  them on its own background runtime, so a busy process leaves work for the
+  others.
+  """
+
+  def __init__(self, jobs: Any):
+    # A multiprocessing Queue created before the workers were started
+    self._jobs = jobs
+    self._consumer: threading.Thread | None = None
+
+  def put(self, job: CommandJob) -> bool:
+    """Queue a job; returns False when the queue is full so callers can push back."""
+    try:
+      self._jobs.put_nowait(job)
+    except queue.Full:
+      return False
+    return True
+
+  def consume(self, run: Callable[[CommandJob], Awaitable[Any]], concurrency: int = DEFAULT_CONCURRENCY):
+    if self._consumer is None:
+      self._consumer = threading.Thread(target=self._consume, args=(run, concurrency), name="command-job-consumer", daemon=True)
+      self._consumer.start()
+
+  def _consume(self, run: Callable[[CommandJob], Awaitable[Any]], concurrency: int):
+    slots = threading.BoundedSemaphore(concurrency)
+    while True:
+      # Only take a job once there is room for it, so idle processes pick up the rest
+      slots.acquire()
+      job = self._jobs.get()
+      future = get_runtime().run(run(job))
+      future.add_done_callback(lambda _: slots.release())
+
+
+_JOB_QUEUE: JobQueue | None = None
+
+
+def set_job_queue(job_queue: JobQueue | None):
+  global _JOB_QUEUE
+  _JOB_QUEUE = job_queue
+
+
+def get_job_queue() -> JobQueue | None:
+  """The shared queue when running as one of several worker processes, otherwise None."""
+  return _JOB_QUEUE
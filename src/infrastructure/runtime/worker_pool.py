@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine
+
+from src.config.env import Env
+
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_QUEUE = 20
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class WorkerPool:
+  """
+  One persistent event loop on a background thread, fed by a bounded job queue.
+
+  Slack listener threads only enqueue work; `concurrency` workers on the loop
+  run the jobs, so MCP sessions and HTTP clients bound to the loop are reused
+  across commands.
+  """
+
+  def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, max_queue: int = DEFAULT_MAX_QUEUE):
+    self._concurrency = concurrency
+    self._max_queue = max_queue
+    self._loop: asyncio.AbstractEventLoop | None = None
+    self._queue: asyncio.Queue | None = None
+    self._thread: threading.Thread | None = None
+    self._ready = threading.Event()
+    self._lock = threading.Lock()
+    self._pending = 0
+
+  @property
+  def loop(self) -> asyncio.AbstractEventLoop:
+    self.start()
+    return self._loop
+
+  def start(self):
+    with self._lock:
+      if self._thread is not None:
+        return
+      self._thread = threading.Thread(target=self._run, name="command-worker-pool", daemon=True)
+      self._thread.start()
+    self._ready.wait()
+
+  def _run(self):
+    self._loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(self._loop)
+    self._queue = asyncio.Queue()
+    for i in range(self._concurrency):
+      self._loop.create_task(self._worker(), name=f"command-worker-{i}")
+    self._ready.set()
+    self._loop.run_forever()
+
+  async def _worker(self):
+    while True:
+      job = await self._queue.get()
+      with self._lock:
+        self._pending -= 1
+      try:
+        await job()
+      except Exception as e:
+        print(f"Unhandled error in background job: {e}")
+      finally:
+        self._queue.task_done()
+
+  def submit(self, job: Job) -> bool:
+    """Queue a job; returns False when the queue is full so callers can push back."""
+    self.start()
+    with self._lock:
+      if self._pending >= self._max_queue:
+        return False
+      self._pending += 1
+    self._loop.call_soon_threadsafe(self._queue.put_nowait, job)
+    return True
+
+  def run(self, coro: Coroutine[Any, Any, Any]) -> Future:
+    """Schedule a coroutine on the runtime loop outside of the job queue."""
+    return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+  def queue_depth(self) -> int:
+    return self._pending
+
+  def stop(self):
+    if self._loop is not None:
+      self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+_RUNTIME: WorkerPool | None = None
+_RUNTIME_LOCK = threading.Lock()
+
+
+def get_runtime() -> WorkerPool:
+  global _RUNTIME
+  with _RUNTIME_LOCK:
+    if _RUNTIME is None:
+      _RUNTIME = WorkerPool(
+        concurrency=int(Env["COMMAND_WORKER_CONCURRENCY"] or DEFAULT_CONCURRENCY),
+        max_queue=int(Env["COMMAND_QUEUE_MAX"] or DEFAULT_MAX_QUEUE),
+      )
+    return _RUNTIME
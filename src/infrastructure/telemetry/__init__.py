@@ -0,0 +1,3 @@
+"""Tracing and metrics (spans, Prometheus, OpenTelemetry export, per-command breakdowns)."""
+
+
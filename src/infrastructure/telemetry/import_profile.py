@@ -0,0 +1,104 @@
+import atexit
+import importlib.abc
+import sys
+import threading
+import time
+from typing import Any
+
+from src.config.env import Env
+
+
+DEFAULT_TOP = 30
+
+_STATE = threading.local()
+_RECORDS: dict[str, tuple[float, float]] = {}
+_STARTED_AT: float | None = None
+
+
+class _TimedLoader(importlib.abc.Loader):
+  """Wraps a module loader and records how long executing the module took, with and without its own imports."""
+
+  def __init__(self, loader: Any, finder: "_ProfilingFinder"):
+    self._loader = loader
+    self._finder = finder
+
+  def __getattr__(self, name: str) -> Any:
+    return getattr(self._loader, name)
+
+  def create_module(self, spec):
+    return self._loader.create_module(spec)
+
+  def exec_module(self, module):
+    stack = self._finder.stack()
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+      self._loader.exec_module(module)
+    finally:
+      total = time.perf_counter() - start
+      nested = stack.pop()
+      if stack:
+        stack[-1] += total
+      _RECORDS[module.__name__] = (total - nested, total)
+
+
+class _ProfilingFinder(importlib.abc.MetaPathFinder):
+  def stack(self) -> list[float]:
+    if not hasattr(_STATE, "stack"):
+      _STATE.stack = []
+    return _STATE.stack
+
+  def find_spec(self, fullname, path, target=None):
+    if getattr(_STATE, "finding", False):
+      return None
+    _STATE.finding = True
+    try:
+      for finder in sys.meta_path:
+        if finder is self or not hasattr(finder, "find_spec"):
+          continue
+        spec = finder.find_spec(fullname, path, target)
+        if spec is not None:
+          break
+      else:
+        return None
+    finally:
+      _STATE.finding = False
+
+    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+      spec.loader = _TimedLoader(spec.loader, self)
+    return spec
+
+
+def enabled() -> bool:
+  return (Env["IMPORT_PROFILE"] or "").lower() in ("1", "true", "yes")
+
+
+def install():
+  """
+  Time every module imported from now on when IMPORT_PROFILE is set.
+
+  Call it before the imports worth measuring; `report` prints the slowest
+  modules, and the full picture, lazy provider imports included, is printed
+  again at exit.
+  """
+  global _STARTED_AT
+  if not enabled() or _STARTED_AT is not None:
+    return
+  _STARTED_AT = time.perf_counter()
+  sys.meta_path.insert(0, _ProfilingFinder())
+  atexit.register(report, "Imports at exit")
+
+
+def report(title: str = "Imports at startup", top: int | None = None):
+  if _STARTED_AT is None:
+    return
+  top = top or int(Env["IMPORT_PROFILE_TOP"] or DEFAULT_TOP)
+  records = sorted(_RECORDS.items(), key=lambda item: item[1][1], reverse=True)
+
+  lines = [
+    f"{title}: {len(records)} modules, {time.perf_counter() - _STARTED_AT:.2f}s since profiling started",
+    f"{'cumulative ms':>14} {'self ms':>9}  module",
+  ]
+  for name, (own, total) in records[:top]:
+    lines.append(f"{total * 1000:>14.1f} {own * 1000:>9.1f}  {name}")
+  print("\n".join(lines), file=sys.stderr)
@@ -0,0 +1,81 @@
+import threading
+from collections import defaultdict
+from typing import Any
+
+from .tracer import Span
+
+
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+TOKEN_ATTRIBUTES = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+try:
+  import prometheus_client
+except ImportError:
+  prometheus_client = None
+
+
+if prometheus_client is not None:
+  _DURATION = prometheus_client.Histogram(
+    "sentinels_span_duration_seconds", "Duration of traced operations", ["span", "tool"], buckets=DURATION_BUCKETS
+  )
+  _ERRORS = prometheus_client.Counter("sentinels_span_errors_total", "Traced operations that raised", ["span", "tool"])
+  _TOKENS = prometheus_client.Counter("sentinels_llm_tokens_total", "LLM tokens by kind", ["provider", "kind"])
+  _PAYLOAD = prometheus_client.Counter("sentinels_payload_bytes_total", "Bytes sent to or received from upstreams", ["span", "tool"])
+
+
+_LOCK = threading.Lock()
+_COUNTS: dict[tuple[str, str], int] = defaultdict(int)
+_DURATIONS: dict[tuple[str, str], float] = defaultdict(float)
+_ERROR_COUNTS: dict[tuple[str, str], int] = defaultdict(int)
+_TOKEN_COUNTS: dict[tuple[str, str], int] = defaultdict(int)
+
+
+def record(span: Span):
+  tool = str(span.attributes.get("tool", ""))
+  provider = str(span.attributes.get("provider", ""))
+  key = (span.name, tool)
+
+  with _LOCK:
+    _COUNTS[key] += 1
+    _DURATIONS[key] += span.duration
+    if span.error:
+      _ERROR_COUNTS[key] += 1
+    for kind in TOKEN_ATTRIBUTES:
+      if span.attributes.get(kind):
+        _TOKEN_COUNTS[(provider, kind)] += span.attributes[kind]
+
+  if prometheus_client is None:
+    return
+
+  _DURATION.labels(span.name, tool).observe(span.duration)
+  if span.error:
+    _ERRORS.labels(span.name, tool).inc()
+  if span.attributes.get("payload_bytes"):
+    _PAYLOAD.labels(span.name, tool).inc(span.attributes["payload_bytes"])
+  for kind in TOKEN_ATTRIBUTES:
+    # Counts are only set on the round trip that used them and never rolled up into parents
+    if span.attributes.get(kind):
+      _TOKENS.labels(provider, kind).inc(span.attributes[kind])
+
+
+def snapshot() -> dict[str, Any]:
+  """In-process totals, available whether or not prometheus_client is installed."""
+  with _LOCK:
+    return {
+      "spans": {
+        f"{name}[{tool}]" if tool else name: {
+          "count": count,
+          "total_seconds": round(_DURATIONS[(name, tool)], 3),
+          "errors": _ERROR_COUNTS[(name, tool)],
+        } for (name, tool), count in _COUNTS.items()
+      },
+      "tokens": {f"{provider}.{kind}": count for (provider, kind), count in _TOKEN_COUNTS.items()},
+    }
+
+
+def start_http_server(port: int) -> bool:
+  if prometheus_client is None:
+    print("prometheus_client is not installed; metrics endpoint disabled")
+    return False
+  prometheus_client.start_http_server(port)
+  return True
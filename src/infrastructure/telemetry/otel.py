@@ -0,0 +1,39 @@
+from src.config.env import Env
+
+from .tracer import Span
+
+try:
+  from opentelemetry import trace as otel_trace
+except ImportError:
+  otel_trace = None
+
+
+def enabled() -> bool:
+  return otel_trace is not None and (Env["OTEL_TRACES_ENABLED"] or "").lower() in ("1", "true", "yes")
+
+
+def export(root: Span):
+  """
+  Replay a finished trace into the globally configured OpenTelemetry tracer
+  provider. Exporter and provider setup are left to the deployment (e.g. the
+  opentelemetry-instrument launcher).
+  """
+  if not enabled():
+    return
+
+  tracer = otel_trace.get_tracer("sentinels_slack_bot")
+
+  def emit(span: Span, context=None):
+    attributes = {key: value for key, value in span.attributes.items() if isinstance(value, (str, bool, int, float))}
+    otel_span = tracer.start_span(span.name, context=context, start_time=span.start_time_ns, attributes=attributes)
+    if span.error:
+      otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, span.error))
+    child_context = otel_trace.set_span_in_context(otel_span)
+    for child in span.children:
+      emit(child, child_context)
+    otel_span.end(end_time=span.end_time_ns)
+
+  try:
+    emit(root)
+  except Exception as e:
+    print(f"Failed to export trace to OpenTelemetry: {e}")
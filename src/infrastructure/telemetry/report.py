@@ -0,0 +1,26 @@
+from .tracer import Span
+
+
+DETAIL_ATTRIBUTES = ("tool", "provider", "model", "input_tokens", "output_tokens", "cache_read_input_tokens", "payload_bytes", "cached")
+
+
+def format_breakdown(root: Span) -> str:
+  """Human-readable timing tree for one command, suitable for posting in-thread."""
+  lines = [f"*Timing breakdown* ({root.duration:.2f}s total)"]
+
+  def walk(span: Span, depth: int):
+    details = ", ".join(
+      f"{key}={span.attributes[key]}" for key in DETAIL_ATTRIBUTES if key in span.attributes
+    )
+    share = span.duration / root.duration * 100 if root.duration else 0
+    line = f"{'  ' * depth}• {span.name} {span.duration:.2f}s ({share:.0f}%)"
+    if details:
+      line += f" [{details}]"
+    if span.error:
+      line += f" ⚠️ {span.error}"
+    lines.append(line)
+    for child in span.children:
+      walk(child, depth + 1)
+
+  walk(root, 0)
+  return "\n".join(lines)
@@ -0,0 +1,94 @@
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+
+_IDS = itertools.count(1)
+_CURRENT: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+  name: str
+  attributes: dict[str, Any] = field(default_factory=dict)
+  parent: "Span | None" = None
+  children: list["Span"] = field(default_factory=list)
+  span_id: int = field(default_factory=lambda: next(_IDS))
+  start_time_ns: int = field(default_factory=time.time_ns)
+  start: float = field(default_factory=time.perf_counter)
+  end: float | None = None
+  error: str | None = None
+
+  @property
+  def duration(self) -> float:
+    return ((self.end or time.perf_counter()) - self.start)
+
+  @property
+  def end_time_ns(self) -> int:
+    return self.start_time_ns + int(self.duration * 1e9)
+
+  @property
+  def root(self) -> "Span":
+    span = self
+    while span.parent is not None:
+      span = span.parent
+    return span
+
+  def set(self, **attributes: Any):
+    self.attributes.update({key: value for key, value in attributes.items() if value is not None})
+
+  def add(self, key: str, amount: int | float):
+    self.attributes[key] = self.attributes.get(key, 0) + (amount or 0)
+
+
+def current_span() -> Span | None:
+  return _CURRENT.get()
+
+
+def set_attributes(**attributes: Any):
+  """Set attributes on the active span, if any."""
+  span = _CURRENT.get()
+  if span is not None:
+    span.set(**attributes)
+
+
+def set_root_attributes(**attributes: Any):
+  span = _CURRENT.get()
+  if span is not None:
+    span.root.set(**attributes)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+  """
+  Time a block as a child of the active span. A span started with no active
+  parent is a root (one per command); finished spans feed the metrics and
+  exporters.
+  """
+  parent = _CURRENT.get()
+  current = Span(name=name, parent=parent)
+  current.set(**attributes)
+  if parent is not None:
+    parent.children.append(current)
+
+  token = _CURRENT.set(current)
+  try:
+    yield current
+  except BaseException as e:
+    current.error = f"{type(e).__name__}: {e}"
+    raise
+  finally:
+    current.end = time.perf_counter()
+    _CURRENT.reset(token)
+    _finish(current)
+
+
+def _finish(finished: Span):
+  from . import metrics, otel
+
+  metrics.record(finished)
+  if finished.parent is None:
+    otel.export(finished)
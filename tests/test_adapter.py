@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from src.config.agent import Route
+from src.infrastructure.llm import adapter as adapter_module
+from src.infrastructure.llm.adapter import Adapter
+from src.infrastructure.llm.router import Router
+from src.infrastructure.llm.stream import StreamEvent, StreamEventType
+
+
+class FakeModel:
+  """Adds a user and a model turn per message, after `delay` seconds; fails when `error` is set."""
+
+  def __init__(self, delay: float = 0.0, error: Exception | None = None):
+    self.delay = delay
+    self.error = error
+    self.model = "fake"
+    self.tool_calls = 0
+    self._history: list = []
+
+  @property
+  def history_length(self) -> int:
+    return len(self._history)
+
+  def rollback(self, length: int):
+    del self._history[length:]
+
+  def is_session_opened(self) -> bool:
+    return True
+
+  async def send_message(self, prompt: str, config: dict | None = None) -> str:
+    self._history.append(("user", prompt))
+    await asyncio.sleep(self.delay)
+    if self.error is not None:
+      raise self.error
+    self._history.append(("model", prompt))
+    return prompt
+
+  async def stream_message(self, prompt: str, config: dict | None = None):
+    self._history.append(("user", prompt))
+    await asyncio.sleep(self.delay)
+    if self.error is not None:
+      raise self.error
+    yield StreamEvent(type=StreamEventType.TEXT, text=prompt)
+    self._history.append(("model", prompt))
+    yield StreamEvent(type=StreamEventType.DONE, text=prompt)
+
+
+@pytest.fixture
+def models(monkeypatch) -> dict[str, FakeModel]:
+  models = {"gemini": FakeModel(), "claude": FakeModel()}
+  router = Router(["gemini", "claude"], {Route.FORMATTING: 0.05, Route.TOOLS: 0}, cooldown=30)
+  monkeypatch.setattr(adapter_module, "get_router", lambda: router)
+  monkeypatch.setattr(Adapter, "_get_agent", lambda self, agent: self._agents.setdefault(agent, models[agent]))
+  return models
+
+
+def test_failed_attempt_leaves_no_turn(models):
+  models["gemini"].error = RuntimeError("down")
+  adapter = Adapter(route=Route.TOOLS)
+  assert asyncio.run(adapter.send_message("hello")) == "hello"
+  assert models["gemini"]._history == []
+  assert models["claude"]._history == [("user", "hello"), ("model", "hello")]
+
+
+def test_hedge_that_lost_leaves_no_turn(models):
+  models["gemini"].delay = 0.5
+  adapter = Adapter(route=Route.FORMATTING)
+  assert asyncio.run(adapter.send_message("hello")) == "hello"
+  assert models["gemini"]._history == []
+  assert models["claude"].history_length == 2
+
+
+def test_stream_that_lost_leaves_no_turn(models):
+  models["gemini"].delay = 0.5
+
+  async def run() -> list[str]:
+    adapter = Adapter(route=Route.FORMATTING)
+    return [event.type async for event in adapter.stream_message("hello")]
+
+  assert asyncio.run(run()) == [StreamEventType.TEXT, StreamEventType.DONE]
+  assert models["gemini"]._history == []
+  assert models["claude"].history_length == 2
@@ -0,0 +1,17 @@
+from src.infrastructure.llm.model.claude import Claude
+
+
+def test_custom_tool_names_are_made_valid_and_mapped_back():
+  claude = Claude()
+  tool = {"name": "custom_tool.get_sprint_issues", "description": "", "input_schema": {}}
+  sent = claude._sendable_tool(tool)
+  assert sent["name"] == "custom_tool_get_sprint_issues"
+  assert tool["name"] == "custom_tool.get_sprint_issues"
+  assert claude._tool_name(sent["name"]) == "custom_tool.get_sprint_issues"
+
+
+def test_valid_tool_names_are_sent_as_they_are():
+  claude = Claude()
+  tool = {"name": "jira_get_sprint_issues", "description": "", "input_schema": {}}
+  assert claude._sendable_tool(tool) is tool
+  assert claude._tool_name("jira_get_sprint_issues") == "jira_get_sprint_issues"
@@ -0,0 +1,65 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.infrastructure.runtime.cron import Cron
+
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+def test_next_after_is_strictly_later():
+  assert Cron("0 9 * * *").next_after(datetime(2026, 5, 4, 9, 0)) == datetime(2026, 5, 5, 9, 0)
+
+
+def test_lists_ranges_and_steps():
+  cron = Cron("*/15 8-9 * * *")
+  assert cron.next_after(datetime(2026, 5, 4, 8, 50)) == datetime(2026, 5, 4, 9, 0)
+  assert cron.next_after(datetime(2026, 5, 4, 9, 45)) == datetime(2026, 5, 5, 8, 0)
+
+
+def test_weekdays_count_sunday_as_zero_and_seven():
+  # 2026-05-04 is a Monday
+  assert Cron("0 9 * * 0").next_after(datetime(2026, 5, 4)) == datetime(2026, 5, 10, 9, 0)
+  assert Cron("0 9 * * 7").next_after(datetime(2026, 5, 4)) == datetime(2026, 5, 10, 9, 0)
+  assert Cron("0 9 * * 1-5").next_after(datetime(2026, 5, 8, 10, 0)) == datetime(2026, 5, 11, 9, 0)
+
+
+def test_restricted_day_fields_match_either():
+  # The 15th or any Friday, as in cron
+  cron = Cron("0 0 15 * 5")
+  assert cron.next_after(datetime(2026, 5, 4)) == datetime(2026, 5, 8, 0, 0)
+  assert cron.next_after(datetime(2026, 5, 13)) == datetime(2026, 5, 15, 0, 0)
+
+
+@pytest.mark.parametrize("expression", ["0 9 * *", "60 * * * *", "0 24 * * *", "0 0 0 * *", "5-1 * * * *"])
+def test_invalid_expressions_are_rejected(expression):
+  with pytest.raises(ValueError):
+    Cron(expression)
+
+
+def test_impossible_expression_fails_instead_of_spinning():
+  with pytest.raises(ValueError):
+    Cron("0 0 31 2 *").next_after(datetime(2026, 1, 1))
+
+
+def test_spring_forward_keeps_wall_clock_time():
+  now = datetime(2026, 3, 28, 9, 0, tzinfo=BERLIN)
+  nxt = Cron("0 9 * * *").next_after(now)
+  assert nxt == datetime(2026, 3, 29, 9, 0, tzinfo=BERLIN)
+  # The scheduler sleeps for the difference in timestamps, which is one hour short of a day
+  assert nxt.timestamp() - now.timestamp() == 23 * 3600
+
+
+def test_fall_back_keeps_wall_clock_time():
+  now = datetime(2026, 10, 24, 9, 0, tzinfo=BERLIN)
+  nxt = Cron("0 9 * * *").next_after(now)
+  assert nxt == datetime(2026, 10, 25, 9, 0, tzinfo=BERLIN)
+  assert nxt.timestamp() - now.timestamp() == 25 * 3600
+
+
+def test_skipped_wall_clock_time_still_fires_that_day():
+  # 02:30 does not exist in Berlin on 2026-03-29
+  nxt = Cron("30 2 * * *").next_after(datetime(2026, 3, 28, 3, 0, tzinfo=BERLIN))
+  assert nxt.date() == datetime(2026, 3, 29).date()
@@ -0,0 +1,22 @@
+from src.domain.entity.agent.common.plan import Plan
+from src.domain.entity.agent.common.task import Task
+from src.domain.entity.agent.executor import Executor
+
+
+def _plan(*steps: tuple[int, list[int]]) -> Plan:
+  return Plan(goal="goal", steps=[Task(id=step_id, description=f"step {step_id}", depends_on=deps) for step_id, deps in steps])
+
+
+def test_final_step_waits_for_every_other_step():
+  dependencies = Executor(concurrency=1)._dependencies(_plan((1, []), (2, []), (3, [1])))
+  assert dependencies == {1: set(), 2: set(), 3: {1, 2}}
+
+
+def test_unknown_and_self_dependencies_are_dropped():
+  dependencies = Executor(concurrency=1)._dependencies(_plan((1, [1, 9]), (2, [1]), (3, [])))
+  assert dependencies == {1: set(), 2: {1}, 3: {1, 2}}
+
+
+def test_cyclic_plan_runs_in_id_order():
+  dependencies = Executor(concurrency=1)._dependencies(_plan((1, [2]), (2, [1]), (3, [])))
+  assert dependencies == {1: set(), 2: {1}, 3: {1, 2}}
@@ -0,0 +1,63 @@
+import json
+
+from src.infrastructure.llm.history import SUPERSEDED_RESULT, TRUNCATED_RESULT_CHARS, TRUNCATED_SUFFIX, History, truncate
+
+
+class DictHistory(History):
+  """Items are {"calls": [(id, name, arguments)], "results": [(id, name, text)]}."""
+
+  def _size(self, item: dict) -> int:
+    return len(json.dumps(item))
+
+  def _calls(self, item: dict) -> list:
+    return [tuple(call) for call in item.get("calls", [])]
+
+  def _result_refs(self, item: dict) -> list:
+    return [(index, call_id, name) for index, (call_id, name, _) in enumerate(item.get("results", []))]
+
+  def _result_length(self, item: dict, part_index: int) -> int:
+    return len(item["results"][part_index][2])
+
+  def _replace_result(self, item: dict, part_index: int, text: str | None) -> dict:
+    results = list(item["results"])
+    call_id, name, previous = results[part_index]
+    results[part_index] = (call_id, name, truncate(previous) if text is None else text)
+    return {**item, "results": results}
+
+
+def _turn(call_id: str, name: str, arguments: dict, result: str) -> list[dict]:
+  return [{"calls": [(call_id, name, arguments)]}, {"results": [(call_id, name, result)]}]
+
+
+def test_superseded_results_are_replaced_by_a_marker():
+  history = DictHistory(max_tokens=10**6)
+  history.extend(_turn("1", "search", {"q": "a"}, "old"))
+  history.extend(_turn("2", "search", {"q": "b"}, "other"))
+  history.extend(_turn("3", "search", {"q": "a"}, "new"))
+  results = [item["results"][0][2] for item in history.payload() if "results" in item]
+  assert results == [SUPERSEDED_RESULT, "other", "new"]
+
+
+def test_oldest_results_are_truncated_first_to_fit_the_budget():
+  history = DictHistory(max_tokens=10**6)
+  for index in range(3):
+    history.extend(_turn(str(index), "fetch", {"page": index}, "x" * 10000))
+  history.compact(max_tokens=history.estimate_tokens() - 1000)
+  lengths = [len(item["results"][0][2]) for item in history if "results" in item]
+  assert lengths == [TRUNCATED_RESULT_CHARS + len(TRUNCATED_SUFFIX), 10000, 10000]
+
+
+def test_recent_items_are_kept_unless_asked():
+  history = DictHistory(max_tokens=10**6)
+  history.extend(_turn("1", "fetch", {}, "x" * 10000))
+  history.compact(max_tokens=1)
+  assert len(list(history)[-1]["results"][0][2]) == 10000
+  history.compact(max_tokens=1, keep_recent=0)
+  assert list(history)[-1]["results"][0][2].endswith(TRUNCATED_SUFFIX)
+
+
+def test_payload_records_its_size():
+  history = DictHistory(max_tokens=10**6)
+  history.extend(_turn("1", "fetch", {}, "result"))
+  history.payload()
+  assert history.payload_sizes == [history.size()]
@@ -0,0 +1,64 @@
+import asyncio
+
+from src.infrastructure.messaging.slack.outbox import POST, SECTION_CHARS, UPDATE, OutboundMessage, TokenBucket, split_text
+
+
+def test_split_text_keeps_short_text_whole():
+  assert split_text("hello") == ["hello"]
+  assert split_text("") == [""]
+
+
+def test_split_text_cuts_at_line_breaks():
+  text = "a" * 6 + "\n" + "b" * 6
+  assert split_text(text, limit=10) == ["a" * 6, "b" * 6]
+
+
+def test_split_text_cuts_long_lines_at_the_limit():
+  assert split_text("x" * 25, limit=10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_split_text_chunks_fit_a_section_block():
+  text = "\n".join("line %d " % i * 40 for i in range(200))
+  chunks = split_text(text)
+  assert all(len(chunk) <= SECTION_CHARS for chunk in chunks)
+  assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
+
+
+def test_absorb_joins_fire_and_forget_posts_to_the_same_thread():
+  first = OutboundMessage(POST, "C1", "one", thread_ts="1", coalesce=True)
+  assert first.absorb(OutboundMessage(POST, "C1", "two", thread_ts="1", coalesce=True))
+  assert first.text == "one\ntwo"
+  assert not first.absorb(OutboundMessage(POST, "C1", "three", thread_ts="2", coalesce=True))
+
+
+def test_absorb_leaves_posts_whose_ts_is_awaited_alone():
+  awaited = OutboundMessage(POST, "C1", "placeholder")
+  assert not awaited.absorb(OutboundMessage(POST, "C1", "other placeholder"))
+  assert not awaited.absorb(OutboundMessage(POST, "C1", "note", coalesce=True))
+  assert not OutboundMessage(POST, "C1", "note", coalesce=True).absorb(OutboundMessage(POST, "C1", "placeholder"))
+  assert awaited.text == "placeholder"
+
+
+def test_absorb_keeps_only_the_latest_update():
+  update = OutboundMessage(UPDATE, "C1", "draft", ts="5")
+  later = OutboundMessage(UPDATE, "C1", "final", ts="5")
+  later.futures.append(object())
+  assert update.absorb(later)
+  assert update.text == "final"
+  assert len(update.futures) == 1
+  assert not update.absorb(OutboundMessage(UPDATE, "C1", "other", ts="6"))
+  assert not update.absorb(OutboundMessage(POST, "C1", "post", coalesce=True))
+
+
+def test_token_bucket_allows_a_burst_then_paces():
+  async def run() -> float:
+    bucket = TokenBucket(rate=20, capacity=2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(4):
+      await bucket.acquire()
+    return loop.time() - start
+
+  elapsed = asyncio.run(run())
+  # Two tokens are there at once, the other two take 1/20 s each
+  assert 0.08 <= elapsed < 0.5
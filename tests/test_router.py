@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from src.config.agent import Route
+from src.infrastructure.llm import router as router_module
+from src.infrastructure.llm.router import Router
+
+
+class Throttled(Exception):
+  status_code = 429
+
+
+def _router(hedge: float = 0) -> Router:
+  return Router(["gemini", "claude"], {Route.PLANNING: hedge, Route.TOOLS: 0}, cooldown=30)
+
+
+def test_latency_is_smoothed():
+  router = _router()
+  router.observe_latency("gemini", Route.PLANNING, 1.0)
+  router.observe_latency("gemini", Route.PLANNING, 2.0)
+  latency, _ = router._latency[("gemini", Route.PLANNING)]
+  assert latency == pytest.approx(1.0 + router_module.SMOOTHING * 1.0)
+
+
+def test_candidates_prefer_the_faster_provider_per_route():
+  router = _router()
+  router.observe_latency("gemini", Route.PLANNING, 5.0)
+  router.observe_latency("claude", Route.PLANNING, 1.0)
+  router.observe_latency("gemini", Route.TOOLS, 1.0)
+  router.observe_latency("claude", Route.TOOLS, 5.0)
+  assert router.candidates(Route.PLANNING) == ["claude", "gemini"]
+  assert router.candidates(Route.TOOLS) == ["gemini", "claude"]
+
+
+def test_unmeasured_provider_is_tried_first():
+  router = _router()
+  router.observe_latency("gemini", Route.PLANNING, 1.0)
+  assert router.candidates(Route.PLANNING) == ["claude", "gemini"]
+
+
+def test_throttled_provider_is_benched():
+  router = _router()
+  router.observe_result("gemini", Throttled())
+  assert router.candidates(Route.PLANNING) == ["claude"]
+
+
+def test_error_rate_above_the_limit_drops_a_provider():
+  router = _router()
+  for _ in range(5):
+    router.observe_result("claude", RuntimeError("boom"))
+  assert router.candidates(Route.PLANNING) == ["gemini"]
+
+
+def test_every_provider_is_tried_when_none_is_healthy():
+  router = _router()
+  router.observe_result("gemini", Throttled())
+  router.observe_result("claude", Throttled())
+  assert sorted(router.candidates(Route.PLANNING)) == ["claude", "gemini"]
+
+
+def test_call_fails_over_to_the_next_provider():
+  router = _router()
+
+  async def attempt(provider: str) -> str:
+    if provider == "gemini":
+      raise RuntimeError("down")
+    return provider
+
+  assert asyncio.run(router.call(Route.TOOLS, ["gemini", "claude"], attempt)) == "claude"
+
+
+def test_call_hedges_a_slow_provider():
+  router = _router(hedge=0.05)
+
+  async def attempt(provider: str) -> str:
+    await asyncio.sleep(1.0 if provider == "gemini" else 0.01)
+    return provider
+
+  assert asyncio.run(router.call(Route.PLANNING, ["gemini", "claude"], attempt)) == "claude"
+  # The provider that lost the race still gets a latency figure
+  assert ("gemini", Route.PLANNING) in router._latency
@@ -0,0 +1,64 @@
+import pytest
+
+from src.infrastructure.issue_tracking.jira.snapshot_store import SnapshotStore
+
+
+def _issue(key: str, updated: str, status: str) -> dict:
+  return {"key": key, "updated": updated, "status": status}
+
+
+def _changes(store: SnapshotStore, summary_key: str, sprint_id: int = 1) -> list[tuple]:
+  return [
+    (change["key"], change["before"] and change["before"]["status"], change["after"] and change["after"]["status"])
+    for change in store.changes(summary_key, sprint_id)
+  ]
+
+
+@pytest.fixture
+def store() -> SnapshotStore:
+  store = SnapshotStore(":memory:")
+  store.upsert_issues(1, [_issue("A-1", "1", "todo"), _issue("A-2", "1", "todo")])
+  return store
+
+
+def test_no_changes_right_after_a_summary(store):
+  store.save_summary("a", [1], "summary")
+  assert store.changes("a", 1) == []
+
+
+def test_changes_list_changed_added_and_removed_issues(store):
+  store.save_summary("a", [1], "summary")
+  store.upsert_issues(1, [_issue("A-1", "2", "done"), _issue("A-3", "1", "todo")])
+  store.retain_issues(1, {"A-1", "A-3"})
+  assert _changes(store, "a") == [("A-1", "todo", "done"), ("A-2", "todo", None), ("A-3", None, "todo")]
+
+
+def test_unchanged_timestamp_is_not_a_change(store):
+  store.save_summary("a", [1], "summary")
+  assert store.upsert_issues(1, [_issue("A-1", "1", "todo")]) == 0
+  assert store.changes("a", 1) == []
+
+
+def test_each_summary_keeps_its_own_baseline(store):
+  store.save_summary("a", [1], "summary a")
+  store.save_summary("b", [1], "summary b")
+  store.upsert_issues(1, [_issue("A-1", "2", "done")])
+  store.save_summary("a", [1], "summary a again")
+  assert store.changes("a", 1) == []
+  assert _changes(store, "b") == [("A-1", "todo", "done")]
+
+
+def test_changes_are_per_sprint(store):
+  store.upsert_issues(2, [_issue("B-1", "1", "todo")])
+  store.save_summary("a", [1, 2], "summary")
+  store.upsert_issues(2, [_issue("B-1", "2", "done")])
+  assert store.changes("a", 1) == []
+  assert _changes(store, "a", 2) == [("B-1", "todo", "done")]
+
+
+def test_summary_round_trip(store):
+  assert store.summary("a") is None
+  store.save_summary("a", [2, 1], "summary")
+  sprint_ids, summary, created_at = store.summary("a")
+  assert (sprint_ids, summary) == ([1, 2], "summary")
+  assert created_at > 0